@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+앱 로그 + 구조화 타이밍 이벤트.
+
+- 텍스트 로그는 고정 길이 링 버퍼. 화면용 문자열은 매번 전체를 다시 합치지 않고
+  새 줄만 덧붙인 뒤 max_chars 로 잘라 유지한다 (호출당 비용이 세션 길이와 무관).
+- 이벤트는 dict(ts, op, key, status, wait_ms, compute_ms, total_ms, size, ...) 의 링 버퍼.
+  key 는 입력의 정규화 해시라 같은 입력의 반복 계산을 묶어 볼 수 있다.
+- to_jsonl() 로 현장 세션의 이벤트를 내보내 어디서 시간이 드는지 분석한다.
+
+Kivy 에 의존하지 않는다.
+"""
+from __future__ import annotations
+import contextlib, datetime, hashlib, json, time
+from collections import deque
+
+def input_hash(*args) -> str:
+    """입력 값들의 짧은 안정 해시 (repr 기준 — 같은 문자열 입력이면 같은 키)."""
+    return hashlib.blake2b(repr(args).encode("utf-8"), digest_size=8).hexdigest()
+
+class LogBook:
+    def __init__(self, lines: int = 1000, max_chars: int = 9000, events: int = 4096):
+        self.lines = deque(maxlen=lines); self.events = deque(maxlen=events)
+        self.max_chars = max_chars; self.text = ""
+
+    # --- 텍스트 로그 ---
+    def log(self, msg: str) -> str:
+        ts = datetime.datetime.now().strftime("%H:%M:%S")
+        line = f"[{ts}] {msg}"
+        self.lines.append(line)
+        text = f"{self.text}\n{line}" if self.text else line
+        self.text = text[-self.max_chars:] if len(text) > self.max_chars else text
+        return self.text
+
+    def clear(self):
+        self.lines.clear(); self.text = ""
+
+    # --- 구조화 이벤트 ---
+    def event(self, op: str, key: str | None = None, status: str = "ok", **fields) -> dict:
+        ev = dict(ts=time.time(), op=op, key=key, status=status, **fields)
+        self.events.append(ev); return ev
+
+    @contextlib.contextmanager
+    def timed(self, op: str, key: str | None = None, **fields):
+        """동기 작업용: with book.timed("export_csv", key) as ev: ...; ev["size"]=... (예외면 status=error)."""
+        ev = dict(fields); t0 = time.perf_counter(); status = "ok"
+        try: yield ev
+        except Exception as e:
+            status = "error"; ev.setdefault("error", str(e)); raise
+        finally:
+            self.event(op, key, status, compute_ms=(time.perf_counter()-t0)*1e3, **ev)
+
+    def to_jsonl(self, path) -> int:
+        """이벤트를 한 줄에 하나씩 JSON 으로 기록. 기록한 건수 반환."""
+        with open(path, "w", encoding="utf-8") as f:
+            for ev in self.events: f.write(json.dumps(ev, ensure_ascii=False, default=str) + "\n")
+        return len(self.events)
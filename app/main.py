@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-import os, io, base64, math, datetime, json
+import os, io, math, datetime, json, time
 from pathlib import Path
 
 from kivy.utils import platform
@@ -7,42 +7,83 @@ from kivy.lang import Builder
 from kivy.core.clipboard import Clipboard
 from kivy.core.window import Window
 from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.widget import Widget
+from kivy.graphics import Rectangle
+from kivy.graphics.texture import Texture
+from kivy.properties import StringProperty, BooleanProperty, ListProperty
 
 from kivymd.app import MDApp
 from kivymd.uix.tab import MDTabsBase
 from kivymd.uix.snackbar import Snackbar
 
-from scr.core import System, RL, s_sc_from_z, solve_line_rl_for_target_scr, p_of_delta, delta_from_p, waveforms, current_drop_limit, voltage_drop_limit
+from scr.core import System, RL, s_sc_from_z, solve_line_rl_for_target_scr, sweep_delta
 from scr.utils import parse_value, fmt_num
+from scr.table import ColumnTable, SWEEP_CHUNK, SWEEP_PREVIEW, SWEEP_PAGE
+from scr.store import Store, canonical_key
+from tasks import TaskScheduler
+from logbook import LogBook, input_hash
+
+# Plot stack — 시각화 탭에서 처음 쓸 때 로드 (콜드 스타트 시간의 절반 이상을 차지)
+_plot_mods=None
+def _plot_stack():
+    """PlotSet 클래스 또는 None(matplotlib 미설치)."""
+    global _plot_mods
+    if _plot_mods is None:
+        try:
+            import matplotlib
+            matplotlib.use("Agg")
+            from scr.figures import PlotSet, configure_fonts
+            configure_fonts()
+            _plot_mods=PlotSet
+        except Exception:
+            _plot_mods=False
+    return _plot_mods or None
+
+BASE_PRESETS={"380V/60Hz": {"V_LL":"380","S_n":"250000","f_hz":"60"},
+              "400V/50Hz": {"V_LL":"400","S_n":"250000","f_hz":"50"},
+              "480V/60Hz": {"V_LL":"480","S_n":"250000","f_hz":"60"}}
 
-# Plot stack
-_use_plots = True
-try:
-    import numpy as np
-    import matplotlib
-    matplotlib.use("Agg")
-    from matplotlib.figure import Figure
-    from kivy_garden.matplotlib.backend_kivyagg import FigureCanvasKivyAgg
-    matplotlib.rcParams['font.family'] = ["Malgun Gothic","AppleGothic","NanumGothic","Noto Sans CJK KR","DejaVu Sans"]
-    matplotlib.rcParams['axes.unicode_minus'] = False
-except Exception:
-    _use_plots = False
+SWEEP_CSV_KEYS=["delta_deg","P_MW","I_A","dV_pct"]
+SWEEP_HEADERS=["δ[deg]","P[MW]","I[A]","ΔV[%]"]
+SWEEP_FMTS=["%.2f","%.6f","%.3f","%.3f"]
+DEBOUNCE_S=0.15        # 입력 편집 중 미리보기 디바운스
 
 class ContentTab(BoxLayout, MDTabsBase):
     pass
 
+class PlotView(Widget):
+    """PlotSet 의 Agg 버퍼를 재사용 텍스처로 보여 주는 위젯 (매 그리기마다 텍스처를 새로 만들지 않음)."""
+    def __init__(self, plots, name, **kw):
+        super().__init__(**kw)
+        self.plots=plots; self.name=name; self._tex=None
+        with self.canvas: self._rect=Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._layout, size=self._layout)
+
+    def _layout(self, *_):
+        self._rect.pos=self.pos; self._rect.size=self.size
+        self.plots.resize(self.name, *self.size)
+        if self.plots.key is not None: self.plots.render(); self.refresh(self.plots.snapshot(self.name))
+
+    def refresh(self, frame):
+        """frame: PlotSet.snapshot() 결과 (폭, 높이, RGBA bytes)."""
+        w, h, data = frame
+        if self._tex is None or self._tex.size!=(w, h):
+            self._tex=Texture.create(size=(w, h), colorfmt='rgba'); self._tex.flip_vertical()
+            self._rect.texture=self._tex
+        self._tex.blit_buffer(data, colorfmt='rgba', bufferfmt='ubyte')
+        self.canvas.ask_update()
+
 class State:
     def __init__(self, app):
         self.app=app
         self.last_result=None
         self.last_line=None
-        self.last_plot_pngs={}
-        self.logs=[]; self.sweep_rows=[]; self.presets={}
+        self.plots=None   # scr.figures.PlotSet, 첫 시각화 때 생성
+        self.book=LogBook(); self.sweep=None; self.presets={}
+        self.sweep_table=None; self.sweep_page=0   # scr.table.ColumnTable, 현재 페이지
 
     def log(self, msg):
-        ts=datetime.datetime.now().strftime("%H:%M:%S")
-        self.logs.append(f"[{ts}] {msg}")
-        self.app.log_text="\\n".join(self.logs)[-9000:]
+        self.app.log_text=self.book.log(msg)
 
 class SCRProV2(MDApp):
     # defaults
@@ -53,23 +94,29 @@ class SCRProV2(MDApp):
     P_kW="1000"; delta_deg="10"; I_max=""; V_drop_pct=""
     sweep_deg_max="60"; sweep_step="0.5"
 
-    scr_summary="여기에 SCR 계산 결과가 표시됩니다."
-    line_summary="여기에 선로 RL 산출 결과가 표시됩니다."
-    vis_summary="여기에 시각화 결과가 표시됩니다."
-    sweep_summary="스윕 결과가 여기에 표시됩니다."
-    presets_summary="프리셋 목록이 여기에 표시됩니다."
-    log_text=""
-    pu_mode=False
+    # 결과는 작업 완료 콜백에서 채워지므로 kv 가 바인딩할 수 있는 프로퍼티여야 한다
+    scr_summary=StringProperty("여기에 SCR 계산 결과가 표시됩니다.")
+    line_summary=StringProperty("여기에 선로 RL 산출 결과가 표시됩니다.")
+    vis_summary=StringProperty("여기에 시각화 결과가 표시됩니다.")
+    sweep_summary=StringProperty("스윕 결과가 여기에 표시됩니다.")
+    presets_summary=StringProperty("프리셋 목록이 여기에 표시됩니다.")
+    log_text=StringProperty("")
+    sweep_headers=ListProperty(SWEEP_HEADERS)
+    sweep_preview=BooleanProperty(False)
+    pu_mode=BooleanProperty(False)
 
     def build(self):
         self.title="SCR 계산기 Pro v2"
         self.theme_cls.theme_style="Light"
         self.state=State(self)
+        self.tasks=TaskScheduler(workers=2)
         (Path(self.user_data_dir)/"exports").mkdir(parents=True, exist_ok=True)
-        # load presets
+        # 프리셋 + 계산 이력/결과 캐시
+        self.store=Store(Path(self.user_data_dir)/"scr.sqlite3")
         self._load_presets()
-        kv_path=Path(__file__).with_name("ui.kv")
-        return Builder.load_string(kv_path.read_text(encoding="utf-8"))
+        return Builder.load_file(str(Path(__file__).with_name("ui.kv")))
+
+    def on_stop(self): self.tasks.shutdown(); self.store.close()
 
     # --- Theme ---
     def toggle_theme(self):
@@ -89,175 +136,233 @@ class SCRProV2(MDApp):
     def open_guide(self):
         Snackbar(text="가이드는 /app/docs/guide.html 을 브라우저로 여세요.").open()
 
+    # --- 작업 스케줄러 ---
+    def _submit(self, op, channel, fn, *args, on_done, on_error=None, on_partial=None, delay=0.0, size=None, key_args=None):
+        """
+        계산은 워커에서, 결과 표시는 UI 스레드에서. 같은 채널의 이전 요청은 대체된다.
+        완료/오류/대체 시 op 이름·입력 해시·대기/계산 시간·결과 크기(size(result)) 이벤트를 남긴다 (작업 계측은 여기 한 곳).
+        입력 해시는 key_args(기본 args)로 — 그림 객체처럼 repr 이 세션마다 다른 인자는 빼고 넘긴다.
+        """
+        key=input_hash(op, *(args if key_args is None else key_args))
+        def record(status, **kw):
+            ms=lambda a, b: (b-a)*1e3 if a is not None and b is not None else None
+            self.state.book.event(op, key, status, wait_ms=ms(task.t_queued, task.t_start),
+                                  compute_ms=ms(task.t_start, task.t_end), total_ms=ms(task.t_submit, time.perf_counter()), **kw)
+        def done(res):
+            record("ok", size=size(res) if size else None); on_done(res)
+        def error(e):
+            record("error", error=str(e))
+            if on_error is None: raise e
+            on_error(e)
+        task=self.tasks.submit(channel, fn, *args, on_done=done, on_error=error, on_partial=on_partial, on_drop=record, delay=delay)
+        return task
+
+    def _timing(self, op):
+        ev=self.state.book.events[-1] if self.state.book.events else None
+        return f" (대기 {ev['wait_ms']:.0f} ms, 계산 {ev['compute_ms']:.0f} ms)" if ev and ev["op"]==op and ev.get("wait_ms") is not None else ""
+
     # --- calc SCR ---
     def calc_scr(self, VLL, Sn, f, R_line, L_line, R_tr, L_tr):
-        try:
-            sys=self._sys_from(VLL,Sn,f)
-            Rl=parse_value(R_line,'R', pu=self.pu_mode, Z_base=sys.Z_base, L_base=sys.L_base)
-            Ll=parse_value(L_line,'L', pu=self.pu_mode, Z_base=sys.Z_base, L_base=sys.L_base)
-            Rtr=parse_value(R_tr,'R', pu=self.pu_mode, Z_base=sys.Z_base, L_base=sys.L_base)
-            Ltr=parse_value(L_tr,'L', pu=self.pu_mode, Z_base=sys.Z_base, L_base=sys.L_base)
-            line=RL(Rl,Ll); tr=RL(Rtr,Ltr)
-            Zabs=RL(line.R+tr.R, line.L+tr.L).Zabs(sys.omega)
-            Ssc=s_sc_from_z(sys.V_LL, Zabs); SCR=Ssc/sys.S_n
-            Ir=sys.S_n/(math.sqrt(3)*sys.V_LL); Isc=Ssc/(math.sqrt(3)*sys.V_LL); ratio=Isc/Ir if Ir>0 else float("nan")
-            self.scr_summary=(
-                f"[SCR 계산]\\n|Z_th| = {Zabs:.6f} Ω/상\\nS_sc = {Ssc/1e6:.3f} MVA, SCR={SCR:.3f}\\nI_sc/I_r = {ratio:.3f}\\n"
-            )
-            self.state.last_result=dict(V_LL=sys.V_LL,S_n=sys.S_n,f=sys.f, R_line=line.R,L_line=line.L,R_tr=tr.R,L_tr=tr.L, Zth=Zabs,S_sc=Ssc,SCR=SCR,I_ratio=ratio)
-            self.state.log("SCR 계산 완료")
-        except Exception as e:
-            self.scr_summary=f"오류: {e}"; self.state.log(f"SCR 오류: {e}")
+        def err(e): self.scr_summary=f"오류: {e}"; self.state.log(f"SCR 오류: {e}")
+        self._submit("calc_scr", "scr", self._scr_job, VLL, Sn, f, R_line, L_line, R_tr, L_tr, self.pu_mode,
+                     on_done=self._show_scr, on_error=err)
+
+    def _cached(self, kind, inputs, compute):
+        """정규화 입력 해시로 결과 캐시 조회 → 없으면 계산해 저장. (결과, 캐시 적중 여부)."""
+        key=canonical_key(kind, inputs); hit=self.store.get(key)
+        if hit is not None: self.store.record(key); return hit, True
+        r=compute(); self.store.put(kind, inputs, r, key); return r, False
+
+    def _scr_job(self, task, VLL, Sn, f, R_line, L_line, R_tr, L_tr, pu):
+        sys=self._sys_from(VLL,Sn,f)
+        Rl=parse_value(R_line,'R', pu=pu, Z_base=sys.Z_base, L_base=sys.L_base)
+        Ll=parse_value(L_line,'L', pu=pu, Z_base=sys.Z_base, L_base=sys.L_base)
+        Rtr=parse_value(R_tr,'R', pu=pu, Z_base=sys.Z_base, L_base=sys.L_base)
+        Ltr=parse_value(L_tr,'L', pu=pu, Z_base=sys.Z_base, L_base=sys.L_base)
+        inputs=dict(V_LL=sys.V_LL,S_n=sys.S_n,f=sys.f,R_line=Rl,L_line=Ll,R_tr=Rtr,L_tr=Ltr)
+        return self._cached("scr", inputs, lambda: self._scr_result(sys, RL(Rl,Ll), RL(Rtr,Ltr)))
+
+    def _scr_result(self, sys, line, tr):
+        Zabs=RL(line.R+tr.R, line.L+tr.L).Zabs(sys.omega)
+        Ssc=s_sc_from_z(sys.V_LL, Zabs); SCR=Ssc/sys.S_n
+        Ir=sys.S_n/(math.sqrt(3)*sys.V_LL); Isc=Ssc/(math.sqrt(3)*sys.V_LL); ratio=Isc/Ir if Ir>0 else float("nan")
+        return dict(V_LL=sys.V_LL,S_n=sys.S_n,f=sys.f, R_line=line.R,L_line=line.L,R_tr=tr.R,L_tr=tr.L, Zth=Zabs,S_sc=Ssc,SCR=SCR,I_ratio=ratio)
+
+    def _show_scr(self, res):
+        r, cached = res
+        self.scr_summary=(
+            f"[SCR 계산]\n|Z_th| = {r['Zth']:.6f} Ω/상\nS_sc = {r['S_sc']/1e6:.3f} MVA, SCR={r['SCR']:.3f}\nI_sc/I_r = {r['I_ratio']:.3f}\n"
+        )
+        self.state.last_result=r
+        self.state.log("SCR 계산 완료"+(" (캐시)" if cached else "")+self._timing("calc_scr"))
 
     # --- calc line ---
     def calc_line(self, VLL, Sn, f, target_scr, r_over_l, R_tr, L_tr):
-        try:
-            sys=self._sys_from(VLL,Sn,f)
-            Rtr=parse_value(R_tr,'R', pu=self.pu_mode, Z_base=sys.Z_base, L_base=sys.L_base)
-            Ltr=parse_value(L_tr,'L', pu=self.pu_mode, Z_base=sys.Z_base, L_base=sys.L_base)
-            rho=parse_value(r_over_l,'R')/max(parse_value("1",'L'),1e-12) if 'pu' not in str(r_over_l).lower() else float(r_over_l) # 간단화
-            target=float(target_scr)
-            line=solve_line_rl_for_target_scr(sys, target, rho, RL(Rtr,Ltr))
-            Zabs=RL(line.R+Rtr, line.L+Ltr).Zabs(sys.omega); Ssc=s_sc_from_z(sys.V_LL, Zabs); SCR=Ssc/sys.S_n
-            self.line_summary=(
-                f"[선로 RL 산출]\\nR_line={line.R:.6f} Ω/상, L_line={line.L:.9e} H/상\\n|Z_th|={Zabs:.6f} Ω/상, S_sc={Ssc/1e6:.3f} MVA, SCR={SCR:.3f}\\n"
-            )
-            self.state.last_line=dict(R_line=line.R,L_line=line.L,Zth=Zabs,S_sc=Ssc,SCR=SCR)
-            self.state.log("선로 RL 산출 완료")
-        except Exception as e:
-            self.line_summary=f"오류: {e}"; self.state.log(f"RL 산출 오류: {e}")
+        def err(e): self.line_summary=f"오류: {e}"; self.state.log(f"RL 산출 오류: {e}")
+        self._submit("calc_line", "line", self._line_job, VLL, Sn, f, target_scr, r_over_l, R_tr, L_tr, self.pu_mode,
+                     on_done=self._show_line, on_error=err)
+
+    def _line_job(self, task, VLL, Sn, f, target_scr, r_over_l, R_tr, L_tr, pu):
+        sys=self._sys_from(VLL,Sn,f)
+        Rtr=parse_value(R_tr,'R', pu=pu, Z_base=sys.Z_base, L_base=sys.L_base)
+        Ltr=parse_value(L_tr,'L', pu=pu, Z_base=sys.Z_base, L_base=sys.L_base)
+        rho=parse_value(r_over_l,'R')/max(parse_value("1",'L'),1e-12) if 'pu' not in str(r_over_l).lower() else float(r_over_l) # 간단화
+        target=float(target_scr)
+        inputs=dict(V_LL=sys.V_LL,S_n=sys.S_n,f=sys.f,target_scr=target,r_over_l=rho,R_tr=Rtr,L_tr=Ltr)
+        return self._cached("line", inputs, lambda: self._line_result(sys, target, rho, RL(Rtr,Ltr)))
+
+    def _line_result(self, sys, target, rho, tr):
+        line=solve_line_rl_for_target_scr(sys, target, rho, tr)
+        Zabs=RL(line.R+tr.R, line.L+tr.L).Zabs(sys.omega); Ssc=s_sc_from_z(sys.V_LL, Zabs); SCR=Ssc/sys.S_n
+        return dict(R_line=line.R,L_line=line.L,Zth=Zabs,S_sc=Ssc,SCR=SCR)
+
+    def _show_line(self, res):
+        r, cached = res
+        self.line_summary=(
+            f"[선로 RL 산출]\nR_line={r['R_line']:.6f} Ω/상, L_line={r['L_line']:.9e} H/상\n|Z_th|={r['Zth']:.6f} Ω/상, S_sc={r['S_sc']/1e6:.3f} MVA, SCR={r['SCR']:.3f}\n"
+        )
+        self.state.last_line=r
+        self.state.log("선로 RL 산출 완료"+(" (캐시)" if cached else "")+self._timing("calc_line"))
 
     # --- visualize ---
-    def visualize(self, P_kW, delta_deg, Imax, Vdpct):
-        if not _use_plots:
-            self.vis_summary="그래프 모듈 불가 (matplotlib/garden 미설치)"; return
-        src=self.state.last_result or {}
-        sys=System(float(src.get('V_LL', parse_value(self.V_LL,'V'))),
-                   float(src.get('S_n', parse_value(self.S_n,'S'))),
-                   float(src.get('f', parse_value(self.f_hz,'F'))))
-        R=float(src.get('R_line', parse_value(self.R_line,'R'))) + float(src.get('R_tr', parse_value(self.R_tr,'R')))
-        X=sys.omega*(float(src.get('L_line', parse_value(self.L_line,'L'))) + float(src.get('L_tr', parse_value(self.L_tr,'L'))))
-        VLL=sys.V_LL; Vph=sys.V_ph; Zabs=math.hypot(R,X); theta=math.atan2(X,R) if (R or X) else 0.0
-
-        P_in=parse_value(P_kW,'P'); d_in=math.radians(float(delta_deg or 0))
-        try:
-            if P_in>0:
-                delta=delta_from_p(VLL,R,X,P_in); P=P_in
-            else:
-                delta=d_in; P=p_of_delta(VLL,R,X,delta)
-        except Exception as e:
-            self.vis_summary=f"시각화 오류: {e}"; return
-
-        E=Vph*complex(math.cos(delta), math.sin(delta))
-        V=complex(Vph,0.0); Z=complex(R,X)
-        I=(E-V)/Z if Zabs>0 else complex(0,0)
-        Irms=abs(I); Iang=math.atan2(I.imag,I.real)
-        Pmax=(VLL**2/Zabs)*(1-math.cos(theta)) if Zabs>0 else 0.0
-
-        # 캔버스 정리
-        area=self.root.ids.plot_area; area.clear_widgets()
-        import numpy as np
-        fig=Figure(figsize=(6,3), dpi=120); ax1=fig.add_subplot(121); ax2=fig.add_subplot(122)
-
-        # Phasor
-        vmax=Vph*1.25
-        ax1.arrow(0,0,Vph,0, head_width=0.03*Vph, length_includes_head=True, color="#93c5fd", label="V")
-        ax1.arrow(0,0,Vph*math.cos(delta),Vph*math.sin(delta), head_width=0.03*Vph, length_includes_head=True, color="#34d399", label="E")
-        drop=(E-V)
-        ax1.arrow(Vph*math.cos(delta),Vph*math.sin(delta), -drop.real, -drop.imag, head_width=0.03*Vph, length_includes_head=True, color="#f59e0b", label="ΔV")
-        ax1.set_aspect('equal'); ax1.set_xlim(-vmax,vmax); ax1.set_ylim(-vmax,vmax); ax1.set_title("Phasor")
-        ax1.legend(fontsize=8, loc="upper left")
-
-        # P–δ
-        del_max=min(theta, math.radians(89.9))
-        ds=np.linspace(0, del_max, 400)
-        Pcurve=(VLL**2/Zabs)*(np.cos(theta-ds)-np.cos(theta)) if Zabs>0 else np.zeros_like(ds)
-        ax2.plot(np.degrees(ds), Pcurve/1e6, label="P(δ)")
-        ax2.scatter([math.degrees(delta)], [P/1e6], s=18, color="#ef4444", label="현재")
-        # 한계선
-        Imax_val=parse_value(Imax,'I') if Imax else None
-        Vpct_val=parse_value(Vdpct,'pct') if Vdpct else None
-        dI=current_drop_limit(Vph,Zabs,Imax_val) if Imax_val else None
-        dV=voltage_drop_limit(Vph,Vpct_val) if Vpct_val else None
-        for dval, lab, col in [(dI,"I_max", "#f59e0b"), (dV,"ΔV%", "#a78bfa")]:
-            if dval:
-                ax2.axvline(math.degrees(dval), color=col, linestyle="--", label=f"{lab} @ {math.degrees(dval):.1f}°")
-        ax2.set_xlabel("δ [deg]"); ax2.set_ylabel("P [MW]"); ax2.grid(True, alpha=.3); ax2.legend(fontsize=8); ax2.set_title("P–δ + 한계")
-
-        area.add_widget(FigureCanvasKivyAgg(fig))
-
-        # Waveforms
-        fig2=Figure(figsize=(6,3), dpi=120); axw=fig2.add_subplot(111)
-        t, v_pcc, v_inv, i_t = waveforms(sys, Irms, delta, Iang, cycles=2, ppc=400)
-        axw.plot(t*1e3, v_pcc, label="v_pcc[V]"); axw.plot(t*1e3, v_inv, label="v_inv[V]"); axw.plot(t*1e3, i_t, label="i[A]")
-        axw.set_xlabel("t [ms]"); axw.grid(True, alpha=.3); axw.legend(fontsize=8); axw.set_title("Time waveforms")
-        area.add_widget(FigureCanvasKivyAgg(fig2))
-
-        # summary & cache
-        self.vis_summary=f"P={P/1e6:.3f} MW, δ={math.degrees(delta):.2f}°, P_max={Pmax/1e6:.3f} MW | I={Irms:.1f} A"
-        self.state.last_plot_pngs={"phas_pdelta": self._fig_to_b64(fig), "wave": self._fig_to_b64(fig2)}
-
-    def _fig_to_b64(self, fig):
-        import io, base64
-        buf=io.BytesIO(); fig.savefig(buf, format="png", dpi=140, bbox_inches="tight"); data=base64.b64encode(buf.getvalue()).decode("ascii"); buf.close(); return data
+    def visualize(self, P_kW, delta_deg, Imax, Vdpct, live=False):
+        """live=True 는 입력 편집 중 미리보기 — 그림이 이미 있을 때만, 디바운스해서 갱신."""
+        if live and self.state.plots is None: return
+        mods=_plot_stack()
+        if not mods:
+            self.vis_summary="그래프 모듈 불가 (matplotlib 미설치)"; return
+        plots=self._plot_set(mods)
+        src=dict(self.state.last_result or {})
+        for k, attr, kind in (("V_LL","V_LL",'V'),("S_n","S_n",'S'),("f","f_hz",'F'),("R_line","R_line",'R'),
+                              ("L_line","L_line",'L'),("R_tr","R_tr",'R'),("L_tr","L_tr",'L')):
+            if k not in src: src[k]=parse_value(getattr(self, attr), kind)
+        def err(e): self.vis_summary=f"시각화 오류: {e}"
+        self._submit("visualize", "vis", self._vis_job, plots, src, P_kW, delta_deg, Imax, Vdpct,
+                     on_done=self._show_vis, on_error=err, delay=DEBOUNCE_S if live else 0.0,
+                     size=lambda res: sum(len(fr[2]) for fr in res[1].values()), key_args=(src, P_kW, delta_deg, Imax, Vdpct))
+
+    def _vis_job(self, task, plots, src, P_kW, delta_deg, Imax, Vdpct):
+        # 운전점 계산은 보고서 생성과 공용 (scr.report.operating_point). report 는 numpy 를 불러오므로 쓸 때 import
+        from scr import report
+        op, o=report.operating_point(src, P_kW, delta_deg, Imax, Vdpct)
+        # 그림은 한 번 만들고 이후엔 아티스트만 갱신 (축 범위가 그대로면 블리팅).
+        # 렌더링까지 워커에서 하고 UI 에는 버퍼 사본만 넘긴다.
+        task.check()
+        with plots.lock:
+            names=plots.render() if plots.update(op) else []
+            # 같은 입력을 그린 이전 작업이 대체되어 화면에 못 나갔으면 현재 버퍼를 그대로 보낸다
+            if not names and plots.key!=self._vis_key: names=list(plots.figures)
+            frames={name: plots.snapshot(name) for name in names}; key=plots.key
+        summary=f"P={o['P']/1e6:.3f} MW, δ={math.degrees(o['delta']):.2f}°, P_max={o['Pmax']/1e6:.3f} MW | I={o['Irms']:.1f} A"
+        return summary, frames, key
+
+    def _show_vis(self, res):
+        summary, frames, self._vis_key = res
+        for name, frame in frames.items(): self._plot_views[name].refresh(frame)
+        self.vis_summary=summary
+
+    def _plot_set(self, PlotSet):
+        if self.state.plots is None:
+            plots=self.state.plots=PlotSet(); self._vis_key=None
+            self._plot_views={k: PlotView(plots, k) for k in plots.figures}
+            area=self.root.ids.plot_area; area.clear_widgets()
+            for v in self._plot_views.values(): area.add_widget(v)
+        return self.state.plots
 
     # --- sweep ---
     def run_sweep(self, dmax, step):
         src=self.state.last_result or {}
         if not src: self.sweep_summary="먼저 계산을 수행하세요."; return
+        def err(e): self.sweep_summary=f"스윕 오류: {e}"
+        self._submit("run_sweep", "sweep", self._sweep_job, src, dmax, step, on_done=self._show_sweep,
+                     on_partial=self._show_sweep_progress, on_error=err, size=len)
+
+    def _sweep_job(self, task, src, dmax, step):
         sys=System(src["V_LL"], src["S_n"], src["f"])
         R=src.get("R_line",0)+src.get("R_tr",0); X=sys.omega*(src.get("L_line",0)+src.get("L_tr",0))
-        import numpy as np, math
-        dmax_rad=math.radians(float(dmax or 60)); step_deg=float(step or 0.5)
-        ds=np.arange(0, math.degrees(dmax_rad)+1e-9, step_deg)
-        rows=[]
-        for deg in ds:
-            d=math.radians(deg)
-            P=p_of_delta(sys.V_LL,R,X,d)
-            I=abs((sys.V_ph*(complex(math.cos(d), math.sin(d)) - 1+0j)) / complex(R,X)) if (R or X) else 0.0
-            drop=2*sys.V_ph*math.sin(d/2)
-            rows.append(dict(delta_deg=deg, P_MW=P/1e6, I_A=I, dV_pct=(drop/sys.V_ph*100)))
-        self.state.sweep_rows=rows
-        self.sweep_summary="δ,P[MW],I[A],ΔV[%]\\n" + "\\n".join([f"{r['delta_deg']:.2f},{r['P_MW']:.6f},{r['I_A']:.3f},{r['dV_pct']:.3f}" for r in rows])
-        self.state.log(f"δ-스윕 {len(rows)}포인트 완료")
+        def progress(st, done):
+            task.check(); task.partial((st, done))
+        return sweep_delta(sys, R, X, float(dmax or 60), float(step or 0.5), chunk=SWEEP_CHUNK, progress=progress)
+
+    def _set_sweep_rows(self, rows):
+        # 보이는 페이지 분량만 RecycleView 에 넘기고 행 위젯은 재사용된다
+        self.root.ids.sweep_rv.data=[dict(c0=a, c1=b, c2=c, c3=d) for a, b, c, d in rows]
+
+    def _show_sweep_progress(self, payload):
+        st, done = payload
+        self.sweep_summary=f"계산 중… {done:,}/{len(st):,}"
+        self._set_sweep_rows(ColumnTable(st, SWEEP_CSV_KEYS, SWEEP_FMTS, n=done).preview(SWEEP_PREVIEW))
+
+    def _show_sweep(self, st):
+        self.state.sweep=st
+        self.state.sweep_table=ColumnTable(st, SWEEP_CSV_KEYS, SWEEP_FMTS); self.state.sweep_page=0
+        self.sweep_headers=list(SWEEP_HEADERS)
+        self._render_sweep()
+        self.state.log(f"δ-스윕 {len(st)}포인트 완료"+self._timing("run_sweep"))
+
+    def _render_sweep(self):
+        tbl=self.state.sweep_table
+        if tbl is None: return
+        if self.sweep_preview:
+            rows=tbl.preview(SWEEP_PREVIEW)
+            self.sweep_summary=f"{len(tbl):,} 포인트 · 미리보기 {len(rows)}행 (균등 간격)"
+        else:
+            p=self.state.sweep_page; a=p*SWEEP_PAGE
+            rows=tbl.rows(a, a+SWEEP_PAGE)
+            self.sweep_summary=f"{len(tbl):,} 포인트 · {a+1:,}–{a+len(rows):,}행 (페이지 {p+1}/{tbl.pages(SWEEP_PAGE)})"
+        self._set_sweep_rows(rows)
+
+    def sweep_page_step(self, d):
+        tbl=self.state.sweep_table
+        if tbl is None or self.sweep_preview: return
+        p=min(max(self.state.sweep_page+d, 0), tbl.pages(SWEEP_PAGE)-1)
+        if p!=self.state.sweep_page:
+            self.state.sweep_page=p; self._render_sweep(); self.root.ids.sweep_rv.scroll_y=1
+
+    def sort_sweep(self, key):
+        tbl=self.state.sweep_table
+        if tbl is None: return
+        tbl.toggle_sort(key); self.state.sweep_page=0
+        mark="" if tbl.sort_key is None else (" ▼" if tbl.descending else " ▲")
+        self.sweep_headers=[h+(mark if k==tbl.sort_key else "") for k, h in zip(SWEEP_CSV_KEYS, SWEEP_HEADERS)]
+        self._render_sweep(); self.root.ids.sweep_rv.scroll_y=1
+
+    def toggle_sweep_preview(self):
+        self.sweep_preview=not self.sweep_preview; self._render_sweep()
 
     def save_sweep_csv(self):
-        if not self.state.sweep_rows: Snackbar(text="스윕 데이터가 없습니다").open(); return
+        if self.state.sweep is None or not len(self.state.sweep): Snackbar(text="스윕 데이터가 없습니다").open(); return
         base=self._downloads(); ts=datetime.datetime.now().strftime("%Y%m%d_%H%M%S"); path=os.path.join(base, f"delta_sweep_{ts}.csv")
-        import csv
-        keys=["delta_deg","P_MW","I_A","dV_pct"]
-        with open(path,"w",newline="",encoding="utf-8-sig") as f:
-            w=csv.DictWriter(f, fieldnames=keys); w.writeheader(); [w.writerow(r) for r in self.state.sweep_rows]
+        with self.state.book.timed("save_sweep_csv", rows=len(self.state.sweep)) as ev:
+            self.state.sweep.to_csv(path, SWEEP_CSV_KEYS); ev["size"]=os.path.getsize(path)
         Snackbar(text=f"CSV 저장: {path}").open()
 
     # --- presets ---
-    def _preset_path(self): return Path(self.user_data_dir)/"presets.json"
     def _load_presets(self):
-        # 기본 프리셋
-        base={"380V/60Hz": {"V_LL":"380","S_n":"250000","f_hz":"60"},
-              "400V/50Hz": {"V_LL":"400","S_n":"250000","f_hz":"50"},
-              "480V/60Hz": {"V_LL":"480","S_n":"250000","f_hz":"60"}}
-        p=self._preset_path()
-        if p.exists():
-            try: self.state.presets=json.loads(p.read_text(encoding="utf-8"))
-            except: self.state.presets=base
-        else:
-            self.state.presets=base; p.write_text(json.dumps(base,ensure_ascii=False,indent=2), encoding="utf-8")
+        presets=self.store.presets()
+        if not presets:
+            # 첫 실행: 예전 presets.json 이 있으면 한 번 가져오고, 없으면 기본 프리셋
+            old=Path(self.user_data_dir)/"presets.json"; presets=BASE_PRESETS
+            if old.exists():
+                try: presets=json.loads(old.read_text(encoding="utf-8"))
+                except: pass
+            self.store.reset_presets(presets)
+        self.state.presets=dict(presets)
         self._refresh_presets_summary()
 
     def _refresh_presets_summary(self):
         lines=[f"- {k}: V_LL={v['V_LL']}, S_n={v['S_n']}, f={v['f_hz']}" for k,v in self.state.presets.items()]
-        self.presets_summary="\\n".join(lines)
+        self.presets_summary="\n".join(lines)
 
     def save_preset(self, name):
         name=(name or "").strip() or datetime.datetime.now().strftime("custom-%H%M%S")
         self.state.presets[name]={"V_LL":self.V_LL,"S_n":self.S_n,"f_hz":self.f_hz}
-        self._preset_path().write_text(json.dumps(self.state.presets,ensure_ascii=False,indent=2), encoding="utf-8")
+        self.store.save_preset(name, self.state.presets[name])
         self._refresh_presets_summary()
         Snackbar(text=f"프리셋 저장: {name}").open()
 
     def load_default_presets(self):
-        (Path(self.user_data_dir)/"presets.json").unlink(missing_ok=True)
+        self.store.reset_presets(BASE_PRESETS)
         self._load_presets(); Snackbar(text="기본 프리셋 재생성").open()
 
     # --- export ---
@@ -269,27 +374,52 @@ class SCRProV2(MDApp):
         ts=datetime.datetime.now().strftime("%Y%m%d_%H%M%S"); base=self._downloads(); path=os.path.join(base, f"scr_results_{ts}.csv")
         import csv
         keys=sorted(set().union(*[r.keys() for r in rows]))
-        with open(path,"w",newline="",encoding="utf-8-sig") as f:
-            w=csv.DictWriter(f, fieldnames=keys); w.writeheader(); [w.writerow(r) for r in rows]
+        with self.state.book.timed("export_csv", input_hash(rows), rows=len(rows)) as ev:
+            with open(path,"w",newline="",encoding="utf-8-sig") as f:
+                w=csv.DictWriter(f, fieldnames=keys); w.writeheader(); [w.writerow(r) for r in rows]
+            ev["size"]=os.path.getsize(path)
         Snackbar(text=f"CSV 저장: {path}").open()
 
     def export_html(self):
         r=self.state.last_result
         if not r: Snackbar(text="보고서용 결과가 없습니다").open(); return
-        css="body{font-family:system-ui,Segoe UI,Roboto,'Apple SD Gothic Neo',Noto Sans KR,Malgun Gothic,sans-serif;background:#0f172a;color:#e2e8f0;margin:0} .wrap{max-width:980px;margin:0 auto;padding:24px} .card{background:#111827;border:1px solid #1f2937;border-radius:12px;padding:16px;margin:12px 0} table{width:100%;border-collapse:collapse} th,td{border:1px solid #1f2937;padding:8px 10px} th{background:#0b1220} img{max-width:100%}"
-        rows=[("SCR", f"{r['SCR']:.3f}"),("S_sc [MVA]", f"{r['S_sc']/1e6:.3f}"),("|Z_th| [Ω/상]", f"{r['Zth']:.6f}"),("I_sc/I_r", f"{r['I_ratio']:.3f}"),
-              ("V_LL [V]", f"{r['V_LL']:.1f}"),("S_n [VA]", f"{r['S_n']:.0f}"),("f [Hz]", f"{r['f']:.1f}"),
-              ("R_line [Ω/상]", f"{r.get('R_line',0):.6f}"),("L_line [H/상]", f"{r.get('L_line',0):.9e}"),
-              ("R_tr [Ω/상]", f"{r.get('R_tr',0):.6f}"),("L_tr [H/상]", f"{r.get('L_tr',0):.9e}")]
-        table="".join([f"<tr><th>{k}</th><td>{v}</td></tr>" for k,v in rows])
-        html=f"<!doctype html><meta charset='utf-8'><title>SCR Report</title><style>{css}</style><div class='wrap'><h1>SCR 계산기 Pro v2 보고서</h1><div class='card'><table>{table}</table></div><div class='card'><h3>Phasor & P–δ</h3><img src='data:image/png;base64,{self.state.last_plot_pngs.get('phas_pdelta','')}'/></div><div class='card'><h3>Time waveforms</h3><img src='data:image/png;base64,{self.state.last_plot_pngs.get('wave','')}'/></div></div>"
-        base=self._downloads(); ts=datetime.datetime.now().strftime("%Y%m%d_%H%M%S"); path=os.path.join(base, f"scr_report_{ts}.html")
-        with open(path,"w",encoding="utf-8") as f: f.write(html)
+        with self.state.book.timed("export_html", input_hash(r)) as ev:
+            path=self._write_html(r); ev["size"]=os.path.getsize(path)
         Snackbar(text=f"HTML 보고서 저장: {path}").open()
 
+    def _write_html(self, r):
+        # 그림은 scr_assets/<내용 해시>.png 로 한 번만 저장하고 HTML 은 참조만 (base64 인라인 없음)
+        from scr import report
+        base=self._downloads(); assets=report.Assets(base, "scr_assets")
+        plots=self.state.plots
+        imgs={k: assets.put(plots.png(k)) for k in plots.figures} if plots is not None and plots.key is not None else {}
+        ts=datetime.datetime.now().strftime("%Y%m%d_%H%M%S"); path=os.path.join(base, f"scr_report_{ts}.html")
+        report.write_case(path, r, imgs)
+        return path
+
+    def export_history_reports(self):
+        """저장소의 SCR 계산 이력(최근 1000건)을 케이스별 보고서 + 색인으로 (백그라운드)."""
+        ts=datetime.datetime.now().strftime("%Y%m%d_%H%M%S"); out=os.path.join(self._downloads(), f"scr_reports_{ts}")
+        def done(res): n, dt = res; self.state.log(f"이력 보고서 {n}건 ({dt:.1f}s): {out}"); Snackbar(text=f"보고서 {n}건 저장: {out}").open()
+        def err(e): self.state.log(f"보고서 오류: {e}")
+        self._submit("export_reports", "report", self._reports_job, out, on_done=done, on_error=err, size=lambda res: res[0])
+
+    def _reports_job(self, task, out):
+        from scr import report
+        cases=list(report.cases_from_store(self.store))
+        def each():
+            for c in cases: task.check(); yield c
+        return report.run(each(), out, workers=0)
+
+    def export_events(self):
+        """구조화 타이밍 이벤트를 JSONL 로 (현장 세션 프로파일링용)."""
+        ts=datetime.datetime.now().strftime("%Y%m%d_%H%M%S"); path=os.path.join(self._downloads(), f"scr_events_{ts}.jsonl")
+        n=self.state.book.to_jsonl(path)
+        Snackbar(text=f"이벤트 {n}건 저장: {path}").open()
+
     # --- copy ---
     def copy_log(self): Clipboard.copy(self.log_text or ""); Snackbar(text="로그 복사").open()
-    def clear_log(self): self.state.logs.clear(); self.log_text=""; Snackbar(text="로그 초기화").open()
+    def clear_log(self): self.state.book.clear(); self.log_text=""; Snackbar(text="로그 초기화").open()
     def copy_result(self, which):
         txt = self.scr_summary if which=='scr' else self.line_summary
         Clipboard.copy(txt or ""); Snackbar(text="결과 복사").open()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+헤드리스 배치 실행기 — CSV/JSONL 케이스를 스트리밍으로 읽어 SCR, 선로 RL 역산,
+δ-한계를 계산하고 결과를 순서대로 즉시 기록한다.
+
+    python -m scr.batch cases.csv -o results.csv --workers 8 --chunk 50000
+
+입력 열(단위 문자열 허용, scr.utils.parse_column 으로 해석):
+  V_LL, S_n, f, R_line, L_line, R_tr, L_tr   — 필수/기본 0
+  P, I_max, dV_pct, target_scr, r_over_l     — 선택 (있으면 해당 결과 열 추가)
+  id                                         — 선택, 그대로 통과
+
+메모리는 (청크 크기 × 진행 중 청크 수)로 제한되므로 1,000만 행 입력도 가능.
+"""
+from __future__ import annotations
+import argparse, csv, io, itertools, json, os, sys, time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+import numpy as np
+
+from .utils import parse_column
+from . import vec
+
+NAN = float("nan")
+KINDS = {"V_LL": "V", "S_n": "S", "f": "F", "R_line": "R", "L_line": "L", "R_tr": "R", "L_tr": "L",
+         "P": "P", "I_max": "I", "dV_pct": "pct", "target_scr": "pct", "r_over_l": "R"}
+BASE_OUT = ["Zth", "S_sc", "SCR", "I_ratio", "P_max"]
+
+def out_columns(in_cols) -> list[str]:
+    cols = (["id"] if "id" in in_cols else []) + BASE_OUT
+    if "P" in in_cols: cols.append("delta_deg")
+    if "target_scr" in in_cols: cols += ["R_line_sol", "L_line_sol"]
+    if "I_max" in in_cols: cols.append("delta_I_deg")
+    if "dV_pct" in in_cols: cols.append("delta_V_deg")
+    return cols + ["ok"]
+
+# --- 입력 ---
+def _sniff(path: str, fmt: str | None) -> str:
+    if fmt: return fmt
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+def iter_chunks(path: str, size: int, fmt: str | None = None) -> Iterator[dict]:
+    """입력을 열 단위 청크 {열: [문자열...]} 로 순차 반환. 전체를 메모리에 올리지 않는다."""
+    fmt = _sniff(path, fmt)
+    f = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8-sig")
+    try:
+        if fmt == "csv":
+            rd = csv.reader(f); header = [h.strip() for h in next(rd, [])]
+            while True:
+                rows = list(itertools.islice(rd, size))
+                if not rows: return
+                w = len(header)
+                cols = zip(*[(r + [""]*w)[:w] for r in rows])
+                yield {h: list(c) for h, c in zip(header, cols)}
+        else:
+            lines = (ln for ln in f if ln.strip())
+            while True:
+                recs = [json.loads(ln) for ln in itertools.islice(lines, size)]
+                if not recs: return
+                keys = list(dict.fromkeys(k for r in recs for k in r))
+                yield {k: [r.get(k, "") for r in recs] for k in keys}
+    finally:
+        if f is not sys.stdin: f.close()
+
+# --- 계산 ---
+def _parse(col: list, kind: str, default=0.0, **kw) -> np.ndarray:
+    v, ok = parse_column(col, kind, **kw)
+    if not ok.all(): v[~ok] = default
+    return v
+
+def eval_chunk(chunk: dict, pu: bool = False) -> dict:
+    """문자열 청크 → 결과 열(np.ndarray) 사전. 해석된 입력 열(V_LL, S_n, f, R/L)도 같이 담는다."""
+    n = len(next(iter(chunk.values())))
+    get = lambda k, d=0.0: _parse(chunk[k], KINDS[k], d) if k in chunk else np.full(n, d)
+    V = get("V_LL"); Sn = get("S_n"); f = get("f")
+    Zb = vec.z_base(V, Sn) if pu else None; Lb = vec.l_base(V, Sn, f) if pu else None
+    def rl(k):
+        if k not in chunk: return np.zeros(n)
+        return _parse(chunk[k], KINDS[k], pu=pu, Z_base=Zb, L_base=Lb) if pu else get(k)
+    cols = dict(V_LL=V, S_n=Sn, f=f, R_line=rl("R_line"), L_line=rl("L_line"), R_tr=rl("R_tr"), L_tr=rl("L_tr"))
+    with np.errstate(all="ignore"):
+        res = vec.evaluate(cols)
+        w = vec.omega(f); R = cols["R_line"]+cols["R_tr"]; X = w*(cols["L_line"]+cols["L_tr"])
+        if "P" in chunk:
+            # P > P_max 인 행은 스칼라 경로(delta_from_p 예외)처럼 ok=0. 빈 P 는 요청 없음으로 본다
+            P = get("P", NAN); d, dok = vec.delta_from_p(V, R, X, P); res["delta_deg"] = np.degrees(d)
+            res["delta_ok"] = dok | np.isnan(P); res["ok"] = res["ok"] & res["delta_ok"]
+        if "target_scr" in chunk:
+            res["R_line_sol"], res["L_line_sol"] = _solve_lines(V, Sn, f, get("target_scr", NAN), get("r_over_l"), cols["R_tr"], cols["L_tr"])
+        Vph = V/vec.SQRT3
+        if "I_max" in chunk:
+            d, _ = vec.current_drop_limit(Vph, res["Zth"], get("I_max", NAN)); res["delta_I_deg"] = np.degrees(d)
+        if "dV_pct" in chunk:
+            d, _ = vec.voltage_drop_limit(Vph, get("dV_pct", NAN)); res["delta_V_deg"] = np.degrees(d)
+    if "id" in chunk: res["id"] = chunk["id"]
+    res.update(cols)
+    return res
+
+def _solve_lines(V, Sn, f, target, rho, Rtr, Ltr):
+    R, L, _ = vec.solve_line_rl(V, Sn, f, target, rho, Rtr, Ltr)
+    return R, L
+
+# --- 출력 ---
+def format_chunk(res: dict, cols: list[str], fmt: str) -> str:
+    data = [res["id"] if c == "id" else res["ok"].astype(int).tolist() if c == "ok" else res[c].tolist() for c in cols]
+    if fmt == "jsonl":
+        nanfix = lambda v: None if isinstance(v, float) and v != v else v
+        return "".join(json.dumps(dict(zip(cols, map(nanfix, row))), ensure_ascii=False) + "\n" for row in zip(*data))
+    buf = io.StringIO(); csv.writer(buf, lineterminator="\n").writerows(zip(*data))
+    return buf.getvalue()
+
+def _work(args) -> tuple[int, str]:
+    chunk, cols, fmt, pu = args
+    res = eval_chunk(chunk, pu); n = len(res["ok"])
+    for c in cols:   # JSONL 은 청크마다 키가 다를 수 있음
+        if c not in res: res[c] = [""]*n if c == "id" else np.full(n, NAN)
+    return n, format_chunk(res, cols, fmt)
+
+def run(inp: str, out: str, *, workers: int = 0, chunk: int = 20000, fmt_in: str | None = None,
+        fmt_out: str | None = None, pu: bool = False, progress: bool = False) -> tuple[int, float]:
+    """
+    inp → out 스트리밍 실행. (처리 건수, 경과 초) 반환.
+    workers<=1 이면 현재 프로세스에서, 아니면 ProcessPoolExecutor 로 청크를 분산.
+    진행 중 청크는 workers*2 개로 제한되어 메모리가 입력 크기와 무관하다.
+    """
+    fmt_out = _sniff(out, fmt_out)
+    chunks = iter_chunks(inp, chunk, fmt_in)
+    first = next(chunks, None)
+    if first is None: return 0, 0.0
+    cols = out_columns(first.keys())
+    jobs = ((c, cols, fmt_out, pu) for c in itertools.chain([first], chunks))
+    fo = sys.stdout if out == "-" else open(out, "w", newline="", encoding="utf-8")
+    t0 = time.perf_counter(); n = 0
+    def emit(k, text):
+        nonlocal n
+        fo.write(text); n += k
+        if progress:
+            dt = time.perf_counter()-t0
+            print(f"\r{n:,}건, {n/dt if dt else 0:,.0f} cases/s", end="", file=sys.stderr, flush=True)
+    try:
+        if fmt_out == "csv": fo.write(",".join(cols) + "\n")
+        if workers <= 1:
+            for j in jobs: emit(*_work(j))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                pending = deque()
+                for j in jobs:
+                    pending.append(ex.submit(_work, j))
+                    if len(pending) >= workers*2: emit(*pending.popleft().result())
+                while pending: emit(*pending.popleft().result())
+    finally:
+        if fo is not sys.stdout: fo.close()
+    dt = time.perf_counter()-t0
+    if progress: print(file=sys.stderr)
+    return n, dt
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m scr.batch", description="SCR 배치 스크리닝")
+    ap.add_argument("input", help="CSV/JSONL 경로 ('-' = stdin)")
+    ap.add_argument("-o", "--output", default="-", help="결과 경로 (.csv/.jsonl, '-' = stdout)")
+    ap.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("-c", "--chunk", type=int, default=20000)
+    ap.add_argument("--in-format", choices=["csv", "jsonl"])
+    ap.add_argument("--out-format", choices=["csv", "jsonl"])
+    ap.add_argument("--pu", action="store_true", help="R/L 열의 pu 입력 허용(Z_base, L_base 기준)")
+    ap.add_argument("-q", "--quiet", action="store_true")
+    a = ap.parse_args(argv)
+    n, dt = run(a.input, a.output, workers=a.workers, chunk=a.chunk, fmt_in=a.in_format,
+                fmt_out=a.out_format, pu=a.pu, progress=not a.quiet)
+    if not a.quiet:
+        print(f"완료: {n:,}건, {dt:.2f}s, {n/dt if dt else 0:,.0f} cases/s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
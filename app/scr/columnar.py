@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+열(column) 단위 결과 저장소.
+
+열마다 1차원 배열 하나. path 를 주면 <path>/<열>.npy 를 memmap 으로 만들어
+RAM 보다 큰 결과(10^8 점 스윕 등)도 디스크로 흘려 쓴다. 격자 스윕의 축 열은
+저장하지 않고 meta.json 의 축 값에서 필요한 구간만 계산해 돌려준다.
+"""
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import numpy as np
+
+class ColumnStore:
+    def __init__(self, columns: dict, n: int | None = None, axes: Sequence | None = None, path=None):
+        self.columns = dict(columns)
+        self.axes = [(name, np.asarray(vals, dtype=float)) for name, vals in (axes or [])]
+        self.shape = tuple(len(v) for _, v in self.axes)
+        self.n = n if n is not None else (len(next(iter(self.columns.values()))) if self.columns else int(np.prod(self.shape)))
+        self.path = Path(path) if path else None
+
+    # --- 생성/열기 ---
+    @classmethod
+    def create(cls, n: int, names: Sequence[str], path=None, axes=None, dtype=float) -> "ColumnStore":
+        """빈 저장소. path 가 있으면 열을 memmap .npy 로 만든다."""
+        if path is None:
+            return cls({k: np.empty(n, dtype=dtype) for k in names}, n, axes)
+        p = Path(path); p.mkdir(parents=True, exist_ok=True)
+        cols = {k: np.lib.format.open_memmap(p/f"{k}.npy", mode="w+", dtype=dtype, shape=(n,)) for k in names}
+        st = cls(cols, n, axes, p); st._write_meta(); return st
+
+    @classmethod
+    def open(cls, path, mode: str = "r") -> "ColumnStore":
+        p = Path(path); meta = json.loads((p/"meta.json").read_text(encoding="utf-8"))
+        cols = {k: np.load(p/f"{k}.npy", mmap_mode=mode) for k in meta["columns"]}
+        return cls(cols, meta["n"], [(a["name"], a["values"]) for a in meta["axes"]], p)
+
+    def _write_meta(self):
+        meta = dict(n=self.n, columns=list(self.columns),
+                    axes=[dict(name=k, values=v.tolist()) for k, v in self.axes])
+        (self.path/"meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    def flush(self):
+        for a in self.columns.values():
+            if isinstance(a, np.memmap): a.flush()
+
+    # --- 접근 ---
+    def __len__(self): return self.n
+    def __contains__(self, name): return name in self.columns or any(k == name for k, _ in self.axes)
+
+    @property
+    def names(self) -> list[str]:
+        return [k for k, _ in self.axes] + list(self.columns)
+
+    def column(self, name: str, start: int = 0, stop: int | None = None) -> np.ndarray:
+        stop = self.n if stop is None else min(stop, self.n)
+        if name in self.columns: return self.columns[name][start:stop]
+        for i, (k, vals) in enumerate(self.axes):
+            if k == name:
+                idx = np.unravel_index(np.arange(start, stop), self.shape)[i]
+                return vals[idx]
+        raise KeyError(name)
+
+    __getitem__ = column
+
+    def take(self, name: str, idx) -> np.ndarray:
+        """임의 행 인덱스의 값 (정렬/다운샘플 표시용 — 필요한 행만 읽는다)."""
+        idx = np.asarray(idx, dtype=np.intp)
+        if name in self.columns: return np.asarray(self.columns[name][idx])
+        for i, (k, vals) in enumerate(self.axes):
+            if k == name: return vals[np.unravel_index(idx, self.shape)[i]]
+        raise KeyError(name)
+
+    def iter_chunks(self, names: Sequence[str] | None = None, chunk: int = 1 << 16) -> Iterator[dict]:
+        names = list(names or self.names)
+        for s in range(0, self.n, chunk):
+            yield {k: self.column(k, s, s+chunk) for k in names}
+
+    # --- 내보내기 ---
+    def to_csv(self, path, names: Sequence[str] | None = None, fmt: str = "%.10g",
+               chunk: int = 1 << 16, encoding: str = "utf-8-sig"):
+        """청크 단위 np.savetxt 로 일괄 기록 (행 단위 DictWriter 대비 수십 배 빠름)."""
+        names = list(names or self.names)
+        with open(path, "w", newline="", encoding=encoding) as f:
+            f.write(",".join(names) + "\n")
+            for blk in self.iter_chunks(names, chunk):
+                np.savetxt(f, np.column_stack([blk[k] for k in names]), fmt=fmt, delimiter=",")
@@ -4,6 +4,8 @@ import math
 from dataclasses import dataclass
 from typing import Tuple
 
+from .limits import chord_delta, DELTA_MAX
+
 @dataclass
 class System:
     V_LL: float
@@ -62,28 +64,21 @@ def delta_from_p(V_LL: float, R: float, X: float, P: float) -> float:
 
 def current_drop_limit(Vph: float, Zabs: float, target_I: float) -> float | None:
     """
-    |E∠δ - V|/|Z| = I → δ를 근사 탐색 (E=V=Vph).
+    |E∠δ - V|/|Z| = I → δ = 2·asin(I·|Z|/(2·Vph)) (E=V=Vph).
+    닫힌 해이므로 float 반올림(≈1e-15 rad)까지 정확. δ > 89.9° 이면 None.
     """
-    import numpy as np, math
     if target_I is None or target_I<=0: return None
-    for d in np.linspace(0, math.radians(89.9), 2000):
-        drop = 2*Vph*math.sin(d/2.0)
-        I = drop/Zabs
-        if I>=target_I: return d
-    return None
+    d = chord_delta(target_I*Zabs/(2*Vph))
+    return d if d is not None and d<=DELTA_MAX else None
 
 def voltage_drop_limit(Vph: float, target_pct: float) -> float | None:
     """
-    |E - V| = 2 Vph sin(δ/2). ΔV/V[%] 한계 → δ 근사.
+    |E - V| = 2 Vph sin(δ/2). ΔV/V[%] 한계 → δ = 2·asin(ΔV/(2V)).
     """
-    import math
     if target_pct is None or target_pct<=0: return None
-    lim = target_pct/100.0*Vph
-    # 2 V sin(δ/2) >= lim
-    s = lim/(2*Vph)
-    if s<=0: return 0.0
+    s = target_pct/100.0/2.0
     if s>=1: return math.radians(180-1e-3)
-    return 2*math.asin(s)
+    return chord_delta(s)
 
 def waveforms(sys: System, Irms: float, delta: float, Iang: float, cycles=2, ppc=400):
     import numpy as np
@@ -94,3 +89,98 @@ def waveforms(sys: System, Irms: float, delta: float, Iang: float, cycles=2, ppc
     v_inv=np.sqrt(2)*Vph*np.sin(sys.omega*t+delta)
     i_t=np.sqrt(2)*Irms*np.sin(sys.omega*t+Iang)
     return t, v_pcc, v_inv, i_t
+
+SWEEP_COLS = ("P_MW", "I_A", "dV_pct")
+
+def sweep_grid(deltas_deg, scrs, rx, V_LLs, S_n: float, out=None, chunk: int = 1<<20, progress=None):
+    """
+    δ × SCR × R/X × V_LL 격자를 브로드캐스팅으로 평가 → ColumnStore(P_MW, I_A, dV_pct).
+    축 순서는 (V_LL, SCR, R/X, δ), δ가 가장 빠르게 변한다. |Z| = V²/(SCR·S_n),
+    θ = atan2(1, R/X) 이므로 R/X=inf 는 순저항. out 경로를 주면 열을 memmap .npy 로
+    청크마다 흘려 써서 10^8 점 격자도 RAM 과 무관하게 처리한다.
+    progress(store, done) 는 청크마다 호출된다 (부분 결과 표시/취소용 — 예외를 던지면 중단).
+    """
+    import numpy as np
+    from .columnar import ColumnStore
+    d=np.radians(np.atleast_1d(np.asarray(deltas_deg, dtype=float)))
+    scr=np.atleast_1d(np.asarray(scrs, dtype=float)); V=np.atleast_1d(np.asarray(V_LLs, dtype=float))
+    th=np.arctan2(1.0, np.atleast_1d(np.asarray(rx, dtype=float)))
+    axes=[("V_LL", V), ("SCR", scr), ("R_X", np.atleast_1d(rx).astype(float)), ("delta_deg", np.degrees(d))]
+    shape=(len(V), len(scr), len(th), len(d)); n=int(np.prod(shape))
+    st=ColumnStore.create(n, SWEEP_COLS, path=out, axes=axes)
+    # 축별 선계산: cos(θ-δ)-cosθ = cosθ·(cosδ-1) + sinθ·sinδ, cosδ-1 = -2sin²(δ/2)
+    s2=np.sin(d/2); cd1=-2*s2*s2; sd=np.sin(d); ct=np.cos(th); stt=np.sin(th)
+    Sn=float(S_n)
+    for a in range(0, n, chunk):
+        b=min(n, a+chunk)
+        iv, isc, ir, idl = np.unravel_index(np.arange(a, b), shape)
+        Ssc=scr[isc]*Sn   # = V²/|Z|
+        st.columns["P_MW"][a:b]=Ssc*(ct[ir]*cd1[idl] + stt[ir]*sd[idl])/1e6
+        st.columns["I_A"][a:b]=2*s2[idl]*Ssc/(math.sqrt(3.0)*V[iv])   # 2·Vph·sin(δ/2)/|Z|
+        st.columns["dV_pct"][a:b]=200*s2[idl]
+        if progress is not None: progress(st, b)
+    st.flush()
+    return st
+
+def sweep_delta(sys: System, R: float, X: float, dmax_deg: float, step_deg: float, out=None, chunk: int = 1<<20, progress=None):
+    """앱의 δ-스윕: 고정 R, X 에서 δ ∈ [0, dmax] (step) 1-D 격자."""
+    import numpy as np
+    Zabs=math.hypot(R, X)
+    scr=sys.V_LL**2/(Zabs*sys.S_n) if Zabs>0 else math.inf
+    rx=R/X if X else math.inf
+    ds=np.arange(0, dmax_deg+1e-9, step_deg)
+    return sweep_grid(ds, [scr], [rx], [sys.V_LL], sys.S_n, out=out, chunk=chunk, progress=progress)
+
+class MultiInfeed:
+    """
+    다수 인버터(연계점 k 개)의 다중 연계 지표. Z 는 연계 모선 사이 임피던스 행렬 (k×k, Ω/상,
+    network.Network.z_matrix 등), S_n 은 연계점별 정격 [VA].
+
+    - MIIF[j, i] = |Z_ji|/|Z_ii|   (i 의 전압 변동이 j 에 전달되는 비율)
+    - MISCR_i = S_sc,i / (S_i + Σ_{j≠i} MIIF[i, j]·S_j),  S_sc,i = V²/|Z_ii|
+    - WSCR = Σ S_sc,i·S_i / (Σ S_i)²
+
+    분모는 |Z| @ (S/|Z_ii|) 라서 MIIF 행렬을 만들지 않고 chunk 행씩 |Z| 를 계산해 누적한다.
+    set_rating() 은 한 연계점 정격 변경을 O(k) 로 반영한다 (|Z| 한 열만 읽음).
+    """
+    def __init__(self, V_LL: float, Z, S_n, chunk: int = 256):
+        import numpy as np
+        self.V_LL = float(V_LL); self.Z = np.asarray(Z); self.chunk = chunk
+        k = self.Z.shape[0]
+        if self.Z.shape != (k, k): raise ValueError("Z 는 정방 행렬이어야 함.")
+        self.S = np.broadcast_to(np.asarray(S_n, dtype=float), (k,)).copy()
+        self.zd = np.abs(np.diagonal(self.Z)).copy()
+        if not np.all(self.zd > 0): raise ValueError("|Z_ii| = 0 인 연계점이 있음.")
+        self.S_sc = self.V_LL**2/self.zd
+        self._denom = np.empty(k); w = self.S/self.zd
+        for a in range(0, k, chunk):
+            self._denom[a:a+chunk] = np.abs(self.Z[a:a+chunk]) @ w
+
+    def __len__(self): return len(self.S)
+
+    def miif(self, rows=slice(None)):
+        """MIIF 의 행 블록 (rows × k). 전체가 필요할 때만 rows=slice(None)."""
+        import numpy as np
+        return np.abs(self.Z[rows])/self.zd[None, :]
+
+    @property
+    def scr(self):
+        """연계점별 단독 SCR (상호작용 무시)."""
+        return self.S_sc/self.S
+
+    @property
+    def miscr(self):
+        return self.S_sc/self._denom
+
+    @property
+    def wscr(self) -> float:
+        tot = float(self.S.sum())
+        return float(self.S_sc @ self.S)/tot**2 if tot > 0 else float("nan")
+
+    def set_rating(self, m: int, S_new: float):
+        """연계점 m 의 정격만 바꿀 때 — 분모를 |Z[:, m]|/|Z_mm| 열로 갱신."""
+        import numpy as np
+        d = float(S_new) - self.S[m]
+        if d:
+            self._denom += np.abs(self.Z[:, m])*(d/self.zd[m]); self.S[m] = float(S_new)
+        return self
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+선로 RL 설계표 — "목표 SCR k 를 만드는 선로 R, L" 을 반복해서 묻는 설계 검토용.
+
+고정 V_LL, S_n, 변압기 RL 에 대해 (SCR, 선로 R/X, f) 격자에서 vec.solve_line_rl 로
+정확한 L 을 한 번 계산해 두고, 질의는 격자 보간(log L 을 log SCR, R/X, log f 에 대해
+삼선형)으로 답한다. 변압기가 없으면 log L 은 log SCR·log f 에 정확히 선형이고 R/X 쪽
+-½·log(1+(R/X)²) 만 근사된다.
+
+- 셀마다 보간의 상대 오차 상한을 저장하고 질의 결과와 함께 돌려준다. 삼선형 보간은 교차항(xy, xyz …)을
+  정확히 재현하므로 오차는 축별 2차항 Σ c_i·t_i(1-t_i) 의 합이고, 축 i 항의 최댓값은 그 축 방향 모서리
+  중점의 1차원 보간 오차 |c_i|/4 와 같다. 셀의 네 모서리 중 최대를 축마다 더한 값(내부 3×3×3 표본의
+  최대 오차보다 작으면 그 값)에 셀 안 곡률 변화 여유 ERR_SAFETY 를 곱한다. 내부 표본만 쓰면 축별 항의
+  부호가 반대일 때 표본에서 상쇄되어 실제 오차를 최대 4배까지 과소 추정한다
+- 격자 밖, 모서리 중 하나라도 해가 없는 셀, 추정 오차가 tol 을 넘는 셀은 정확 솔버로
+  대신 푼다 (err=0) — ok 는 언제나 정확한 실현 가능 여부
+- save()/load() 는 .npz, cached() 는 같은 매개변수의 표를 메모리/디스크에서 재사용
+"""
+from __future__ import annotations
+import functools, hashlib, json
+from pathlib import Path
+
+import numpy as np
+
+from . import vec
+from .core import RL
+
+ERR_SAMPLES = (0.25, 0.5, 0.75)   # 셀 오차 추정용 내부 표본 위치 (축별)
+# 곡률이 셀 안에서 일정하다는 가정의 여유. 기본 격자, 변압기 3 종, 무작위 질의 6×10^5 개에서
+# 실제 오차/(모서리 합) 최대 1.03 — 2 배면 충분하다 (tests/test_design.py 가 정확 솔버와 비교해 확인)
+ERR_SAFETY = 2.0
+
+class LineDesignTable:
+    def __init__(self, V_LL: float, S_n: float, tr: RL, scr, rx, f, logL, err):
+        self.V_LL = float(V_LL); self.S_n = float(S_n); self.tr = RL(float(tr.R), float(tr.L))
+        self.scr = np.asarray(scr, dtype=float); self.rx = np.asarray(rx, dtype=float); self.f = np.asarray(f, dtype=float)
+        self.logL = np.asarray(logL, dtype=float); self.err = np.asarray(err, dtype=float)
+        # 균일 격자 좌표: log SCR, R/X, log f
+        self._u = [np.log(self.scr), self.rx, np.log(self.f)]
+
+    # --- 생성 ---
+    @classmethod
+    def build(cls, V_LL: float, S_n: float, tr: RL = RL(), scr=(1.0, 20.0, 96), rx=(0.0, 2.0, 41),
+              f=(50.0, 60.0, 11), tol: float = 1e-3) -> "LineDesignTable":
+        """
+        scr/rx/f: (최소, 최대, 점 수). SCR·f 는 로그 간격, R/X 는 선형 간격.
+        추정 오차가 tol 을 넘는 셀(L→0 인 실현 가능 경계 근처 등)은 보간하지 않고 정확 솔버로 답한다.
+        """
+        ax = [np.geomspace(*scr[:2], int(scr[2])), np.linspace(*rx[:2], int(rx[2])), np.geomspace(*f[:2], int(f[2]))]
+        if min(len(a) for a in ax) < 2: raise ValueError("축마다 점이 2개 이상 필요.")
+        logL = cls._exact_logL(V_LL, S_n, tr, *np.meshgrid(*ax, indexing="ij"))
+        u = [np.log(ax[0]), ax[1], np.log(ax[2])]
+        n = [len(a)-1 for a in ax]
+        cube = lambda di, dj, dk: logL[di:n[0]+di, dj:n[1]+dj, dk:n[2]+dk]
+        # 축별 모서리 중점 오차의 합 (log L 기준)
+        err = np.zeros(n)
+        for a in range(3):
+            pts = list(ax); m = u[a][:-1]+0.5*np.diff(u[a]); pts[a] = m if a == 1 else np.exp(m)
+            exact = cls._exact_logL(V_LL, S_n, tr, *np.meshgrid(*pts, indexing="ij"))
+            lo = [slice(None)]*3; hi = [slice(None)]*3; lo[a] = slice(0, -1); hi[a] = slice(1, None)
+            with np.errstate(invalid="ignore"):
+                e = np.abs(0.5*(logL[tuple(lo)]+logL[tuple(hi)])-exact)
+            b, c = [d for d in range(3) if d != a]
+            def edge(db, dc):
+                sl = [slice(None)]*3; sl[b] = slice(db, db+n[b]); sl[c] = slice(dc, dc+n[c]); return e[tuple(sl)]
+            err += np.maximum(np.maximum(edge(0, 0), edge(0, 1)), np.maximum(edge(1, 0), edge(1, 1)))
+        err[np.isnan(err)] = np.inf   # 모서리 중 해 없는 점
+        # 셀 내부 3×3×3 점에서 정확해와 삼선형 보간 비교 (2차 모형에서 벗어나는 셀 대비)
+        for ta in ERR_SAMPLES:
+            for tb in ERR_SAMPLES:
+                for tc in ERR_SAMPLES:
+                    pts = [np.exp(u[0][:-1]+ta*np.diff(u[0])), u[1][:-1]+tb*np.diff(u[1]), np.exp(u[2][:-1]+tc*np.diff(u[2]))]
+                    exact = cls._exact_logL(V_LL, S_n, tr, *np.meshgrid(*pts, indexing="ij"))
+                    interp = sum((ta if di else 1-ta)*(tb if dj else 1-tb)*(tc if dk else 1-tc)*cube(di, dj, dk)
+                                 for di in (0, 1) for dj in (0, 1) for dk in (0, 1))
+                    with np.errstate(invalid="ignore"):
+                        err = np.fmax(err, np.abs(interp-exact))
+                    err[~(np.isfinite(interp) & np.isfinite(exact))] = np.inf
+        with np.errstate(over="ignore", invalid="ignore"):
+            err = np.expm1(ERR_SAFETY*err)   # log 오차 → 상대 오차
+        err[~(err <= tol)] = np.inf
+        return cls(V_LL, S_n, tr, *ax, logL, err)
+
+    @staticmethod
+    def _exact_logL(V_LL, S_n, tr, S, K, F):
+        _, L, ok = vec.solve_line_rl(V_LL, S_n, F, S, K*vec.omega(F), tr.R, tr.L)
+        with np.errstate(divide="ignore"):
+            return np.where(ok, np.log(np.where(ok, L, 1.0)), np.nan)
+
+    # --- 질의 ---
+    def query(self, target_scr, rx, f):
+        """
+        (R_line, L_line, ok, err) 배열 반환 (입력은 브로드캐스팅).
+        err: 해당 셀의 상대 오차 상한 (|L/L_정확 - 1| ≤ err), 정확 솔버로 푼 요소는 0.
+        """
+        S, K, F = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (target_scr, rx, f)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coords = [np.log(S), K, np.log(F)]
+        idx = []; frac = []; inside = np.ones(S.shape, dtype=bool)
+        for c, u in zip(coords, self._u):
+            x = (c-u[0])/(u[1]-u[0])
+            inside &= (x >= 0) & (x <= len(u)-1)
+            i = np.clip(np.floor(np.nan_to_num(x)), 0, len(u)-2).astype(np.intp)
+            idx.append(i); frac.append(np.clip(np.nan_to_num(x)-i, 0.0, 1.0))
+        err = np.zeros(S.shape)
+        fast = inside & np.isfinite(self.err[tuple(idx)])
+        err[fast] = self.err[tuple(i[fast] for i in idx)]
+        (i, j, k), (a, b, c) = idx, frac
+        logL = 0.0
+        for di in (0, 1):
+            wa = a if di else 1-a
+            for dj in (0, 1):
+                wb = b if dj else 1-b
+                for dk in (0, 1):
+                    wc = c if dk else 1-c
+                    v = self.logL[i+di, j+dj, k+dk]
+                    logL = logL + wa*wb*wc*np.where(fast, v, 0.0)
+        L = np.array(np.exp(logL), dtype=float); ok = np.array(fast)
+        slow = ~fast
+        if slow.any():
+            _, Ls, oks = vec.solve_line_rl(self.V_LL, self.S_n, F[slow], S[slow], K[slow]*vec.omega(F[slow]), self.tr.R, self.tr.L)
+            L[slow] = Ls; ok[slow] = oks
+        L = np.where(ok, L, np.nan)
+        return K*vec.omega(F)*L, L, ok, err
+
+    @property
+    def max_err(self) -> float:
+        """보간으로 답하는 셀들의 상대 오차 상한 중 최대."""
+        e = self.err[np.isfinite(self.err)]
+        return float(e.max()) if e.size else 0.0
+
+    # --- 저장 ---
+    def save(self, path):
+        np.savez(path, meta=json.dumps(dict(V_LL=self.V_LL, S_n=self.S_n, R_tr=self.tr.R, L_tr=self.tr.L)),
+                 scr=self.scr, rx=self.rx, f=self.f, logL=self.logL, err=self.err)
+
+    @classmethod
+    def load(cls, path) -> "LineDesignTable":
+        with np.load(path) as z:
+            m = json.loads(str(z["meta"]))
+            return cls(m["V_LL"], m["S_n"], RL(m["R_tr"], m["L_tr"]), z["scr"], z["rx"], z["f"], z["logL"], z["err"])
+
+    @classmethod
+    def cached(cls, V_LL: float, S_n: float, tr: RL = RL(), cache_dir=None, **axes) -> "LineDesignTable":
+        """같은 매개변수면 메모리 → cache_dir/<해시>.npz → 새로 생성 순으로 재사용."""
+        key = json.dumps([float(V_LL), float(S_n), float(tr.R), float(tr.L),
+                          sorted((k, list(map(float, v))) for k, v in axes.items())])
+        return _cached(cls, key, str(cache_dir) if cache_dir else None)
+
+@functools.lru_cache(maxsize=32)
+def _cached(cls, key: str, cache_dir):
+    V_LL, S_n, R_tr, L_tr, axes = json.loads(key)
+    path = Path(cache_dir)/f"line_design_{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}.npz" if cache_dir else None
+    if path is not None and path.exists(): return cls.load(path)
+    tbl = cls.build(V_LL, S_n, RL(R_tr, L_tr), **dict(axes))
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True); tbl.save(path)
+    return tbl
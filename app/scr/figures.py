@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+시각화 그림(Phasor + P–δ, 시간 파형)을 한 번만 만들고 이후에는 아티스트의
+set_data 와 블리팅으로 갱신한다.
+
+- 정적 요소(축, 눈금, 범례, P–δ 곡선, 한계선)는 축 범위/범례가 바뀔 때만 전체 렌더
+- 운전점에 따라 움직이는 요소(E/ΔV 화살표, 현재점, 파형)는 배경 복원 후 draw_artist
+- PNG 는 내보내기 때 처음 요청될 때만 렌더링하며 입력 해시별로 캐시
+
+Kivy 에 의존하지 않으므로 헤드리스 보고서 생성에도 그대로 쓴다. 공개 메서드는 self.lock 으로
+직렬화되어 워커 스레드에서 갱신하고 UI 스레드에서 내보내도 된다.
+"""
+from __future__ import annotations
+import functools, io, math, threading
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+C_V, C_E, C_DV, C_PT = "#93c5fd", "#34d399", "#f59e0b", "#ef4444"
+C_LIM = {"I_max": "#f59e0b", "ΔV%": "#a78bfa"}
+KO_FONTS = ["Malgun Gothic", "AppleGothic", "NanumGothic", "Noto Sans CJK KR"]
+
+def configure_fonts():
+    """한글 글꼴 중 설치된 것만 rcParams 에 등록 (없는 글꼴이 목록에 있으면 그릴 때마다 탐색/경고가 반복된다)."""
+    import matplotlib
+    from matplotlib import font_manager
+    have = {f.name for f in font_manager.fontManager.ttflist}
+    matplotlib.rcParams["font.family"] = [n for n in KO_FONTS if n in have] + ["DejaVu Sans"]
+    matplotlib.rcParams["axes.unicode_minus"] = False
+
+def _locked(fn):
+    @functools.wraps(fn)
+    def wrap(self, *a, **kw):
+        with self.lock: return fn(self, *a, **kw)
+    return wrap
+
+class PlotSet:
+    def __init__(self, figsize=(6, 3), dpi=120):
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        self.ax1 = ax1 = self.fig.add_subplot(121); self.ax2 = ax2 = self.fig.add_subplot(122)
+        kw = dict(head_width=0.03, length_includes_head=True)
+        self.aV = ax1.arrow(0, 0, 1, 0, color=C_V, label="V", **kw)
+        self.aE = ax1.arrow(0, 0, 1, 0, color=C_E, label="E", **kw)
+        self.aD = ax1.arrow(0, 0, 1, 0, color=C_DV, label="ΔV", **kw)
+        ax1.set_aspect('equal'); ax1.set_title("Phasor"); ax1.legend(fontsize=8, loc="upper left")
+        self.curve, = ax2.plot([], [], label="P(δ)")
+        self.pt = ax2.scatter([0], [0], s=18, color=C_PT, label="현재")
+        self.lims = {k: ax2.axvline(0, color=c, linestyle="--", visible=False) for k, c in C_LIM.items()}
+        ax2.set_xlabel("δ [deg]"); ax2.set_ylabel("P [MW]"); ax2.grid(True, alpha=.3); ax2.set_title("P–δ + 한계")
+
+        self.fig2 = Figure(figsize=figsize, dpi=dpi); self.axw = axw = self.fig2.add_subplot(111)
+        self.wv = [axw.plot([], [], label=lab)[0] for lab in ("v_pcc[V]", "v_inv[V]", "i[A]")]
+        axw.set_xlabel("t [ms]"); axw.grid(True, alpha=.3); axw.legend(fontsize=8); axw.set_title("Time waveforms")
+
+        self.agg = {k: FigureCanvasAgg(f) for k, f in self.figures.items()}
+        self._dyn = {"phas_pdelta": [self.aE, self.aD, self.pt], "wave": self.wv}
+        for arts in self._dyn.values():
+            for a in arts: a.set_animated(True)
+        self._bg = {}; self._full = set(self.figures); self._dirty = set(self.figures)
+        self._static = {}; self.key = None; self._png = {}; self.lock = threading.RLock()
+
+    @property
+    def figures(self) -> dict:
+        return {"phas_pdelta": self.fig, "wave": self.fig2}
+
+    def _changed(self, name: str, value) -> bool:
+        if self._static.get(name) == value: return False
+        self._static[name] = value; return True
+
+    @_locked
+    def update(self, op: dict) -> bool:
+        """
+        op: Vph, delta, theta, VLL, Zabs, P, dI, dV (None 가능), t, v_pcc, v_inv, i_t.
+        입력이 직전과 같으면 아무것도 하지 않고 False. 실제 그리기는 render().
+        """
+        # 파형 배열은 해시하지 않는 대신 시간축 끝(주파수·주기 수)과 점 수를 넣는다 — 순저항 계통은 f 만 바뀌어도 스칼라가 같다
+        t = op["t"]
+        key = hash(tuple((k, v) for k, v in sorted(op.items()) if not isinstance(v, np.ndarray)) + (float(t[-1]), len(t)))
+        if key == self.key: return False
+        self.key = key; self._dirty.update(self.figures)
+        Vph, delta, theta, Zabs, VLL = op["Vph"], op["delta"], op["theta"], op["Zabs"], op["VLL"]
+        # Phasor — V 화살표와 축 범위는 Vph 가 바뀔 때만
+        hw = 0.03*Vph
+        if self._changed("Vph", Vph):
+            self.aV.set_data(x=0, y=0, dx=Vph, dy=0, head_width=hw)
+            vmax = Vph*1.25; self.ax1.set_xlim(-vmax, vmax); self.ax1.set_ylim(-vmax, vmax)
+            self._full.add("phas_pdelta")
+        Ex, Ey = Vph*math.cos(delta), Vph*math.sin(delta)
+        self.aE.set_data(x=0, y=0, dx=Ex, dy=Ey, head_width=hw)
+        self.aD.set_data(x=Ex, y=Ey, dx=Vph-Ex, dy=-Ey, head_width=hw)
+        # P–δ — 곡선/한계선/범례는 계통 또는 한계가 바뀔 때만
+        if self._changed("curve", (VLL, Zabs, theta)):
+            ds = np.linspace(0, min(theta, math.radians(89.9)), 400)
+            Pc = (VLL**2/Zabs)*(np.cos(theta-ds)-np.cos(theta)) if Zabs > 0 else np.zeros_like(ds)
+            self.curve.set_data(np.degrees(ds), Pc/1e6)
+            self._full.add("phas_pdelta")
+        if self._changed("lims", (op.get("dI"), op.get("dV"))):
+            for (lab, ln), dval in zip(self.lims.items(), (op.get("dI"), op.get("dV"))):
+                ln.set_visible(bool(dval))
+                if dval:
+                    deg = math.degrees(dval); ln.set_xdata([deg, deg]); ln.set_label(f"{lab} @ {deg:.1f}°")
+                else: ln.set_label("_" + lab)
+            self.ax2.legend(fontsize=8); self._full.add("phas_pdelta")
+        px, py = math.degrees(delta), op["P"]/1e6
+        self.pt.set_offsets([[px, py]])
+        if "phas_pdelta" in self._full or not _inside(self.ax2, px, py):
+            self.ax2.relim(visible_only=True); self.ax2.update_datalim([[px, py]]); self.ax2.autoscale_view()
+            self._full.add("phas_pdelta")
+        # 파형 — y 범위는 히스테리시스(넘치거나 40% 미만으로 줄 때만 재설정)
+        tm = op["t"]*1e3; ys = (op["v_pcc"], op["v_inv"], op["i_t"])
+        for ln, y in zip(self.wv, ys): ln.set_data(tm, y)
+        ymax = max(float(np.max(np.abs(y))) for y in ys) or 1.0
+        lo, hi = self.axw.get_ylim()
+        if self._changed("t", (tm[0], tm[-1])) or ymax > 0.98*hi or ymax < 0.4*hi:
+            self.axw.set_xlim(tm[0], tm[-1]); self.axw.set_ylim(-1.1*ymax, 1.1*ymax)
+            self._full.add("wave")
+        return True
+
+    @_locked
+    def render(self) -> list:
+        """바뀐 그림만 Agg 버퍼에 다시 그린다. 다시 그린 그림 이름 목록 반환."""
+        done = []
+        for name in [n for n in self.figures if n in self._dirty]:
+            agg = self.agg[name]; fig = self.figures[name]
+            if name in self._full or name not in self._bg:
+                agg.draw(); self._bg[name] = agg.copy_from_bbox(fig.bbox)
+            else:
+                agg.restore_region(self._bg[name])
+            for a in self._dyn[name]: a.axes.draw_artist(a)
+            done.append(name)
+        self._full.clear(); self._dirty.clear()
+        return done
+
+    @_locked
+    def resize(self, name: str, w_px: float, h_px: float):
+        fig = self.figures[name]
+        if w_px > 1 and h_px > 1:
+            fig.set_size_inches(w_px/fig.dpi, h_px/fig.dpi, forward=False)
+            self._full.add(name); self._dirty.add(name)
+
+    @_locked
+    def png(self, name: str, dpi: int = 140, tight: bool = True) -> bytes:
+        """
+        그림을 PNG 바이트로. 같은 입력(key)이면 캐시 반환.
+        tight=False 는 여백 계산용 추가 렌더를 생략한다 (대량 보고서 — 렌더 시간이 약 절반).
+        """
+        ck = (self.key, name, dpi, tight)
+        if ck not in self._png:
+            buf = io.BytesIO(); arts = self._dyn[name]
+            for a in arts: a.set_animated(False)
+            try: self.agg[name].print_figure(buf, format="png", dpi=dpi, bbox_inches="tight" if tight else None)
+            finally:
+                for a in arts: a.set_animated(True)
+                self._full.add(name); self._dirty.add(name)   # 저장 후 배경 버퍼 무효
+            self._png = {k: v for k, v in self._png.items() if k[0] == self.key}
+            self._png[ck] = buf.getvalue()
+        return self._png[ck]
+
+    @_locked
+    def snapshot(self, name: str) -> tuple:
+        """(폭, 높이, RGBA bytes) — 다른 스레드가 다시 그려도 안전한 버퍼 사본."""
+        buf = self.agg[name].buffer_rgba()
+        return buf.shape[1], buf.shape[0], buf.tobytes()
+
+def _inside(ax, x, y) -> bool:
+    (x0, x1), (y0, y1) = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+    return x0 <= x <= x1 and y0 <= y <= y1
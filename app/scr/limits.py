@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+한계 δ 탐색 공용 모듈.
+
+- chord_delta: |E∠δ − V| = 2V·sin(δ/2) 의 닫힌 역함수 (I_max, ΔV% 한계가 공유)
+- solve_limit: 닫힌 해가 없는 단조 제약 g(δ) ≥ target (열적/ΔV 모델 등)을
+  브래킷 후 Brent(또는 이분법)로 푼다.
+"""
+from __future__ import annotations
+import math
+from typing import Callable
+
+EPS = 2.220446049250313e-16
+DELTA_MAX = math.radians(89.9)   # 한계선 탐색 상한(기존 스캔 범위)
+
+def chord_delta(s: float) -> float | None:
+    """
+    s = |E−V|/(2V) → δ = 2·asin(s). s∉[0,1] 이면 None.
+    float 반올림 수준(≈1e-15 rad)까지 정확.
+    """
+    if s is None or s!=s or s<0 or s>1: return None
+    return 2.0*math.asin(s)
+
+def bracket(g: Callable[[float], float], lo: float, hi: float, n: int = 16):
+    """[lo,hi]를 n등분해 부호가 바뀌는 첫 구간 (a,b) 반환. 없으면 None."""
+    a=lo; ga=g(a)
+    if ga==0: return (a, a)
+    for k in range(1, n+1):
+        b=lo+(hi-lo)*k/n; gb=g(b)
+        if gb==0 or (ga<0)!=(gb<0): return (a, b)
+        a, ga = b, gb
+    return None
+
+def bisect(g: Callable[[float], float], a: float, b: float, xtol: float = 1e-12, maxiter: int = 200) -> float:
+    ga=g(a)
+    if ga==0: return a
+    for _ in range(maxiter):
+        m=0.5*(a+b); gm=g(m)
+        if gm==0 or 0.5*(b-a)<xtol: return m
+        if (gm<0)==(ga<0): a, ga = m, gm
+        else: b=m
+    return 0.5*(a+b)
+
+def brentq(g: Callable[[float], float], a: float, b: float, xtol: float = 1e-12, maxiter: int = 100) -> float:
+    """g(a), g(b) 부호가 다른 구간에서 Brent 법. 오차 ≤ xtol + 4·eps·|x|."""
+    fa=g(a); fb=g(b)
+    if fa==0: return a
+    if fb==0: return b
+    if (fa<0)==(fb<0): raise ValueError("브래킷 구간에 근이 없음.")
+    c, fc = a, fa; d=e=b-a
+    for _ in range(maxiter):
+        if (fb<0)==(fc<0): c, fc = a, fa; d=e=b-a
+        if abs(fc)<abs(fb): a, b, c = b, c, b; fa, fb, fc = fb, fc, fb
+        tol=2*EPS*abs(b)+0.5*xtol; m=0.5*(c-b)
+        if abs(m)<=tol or fb==0: return b
+        if abs(e)>=tol and abs(fa)>abs(fb):
+            s=fb/fa
+            if a==c: p=2*m*s; q=1-s
+            else:
+                q=fa/fc; r=fb/fc
+                p=s*(2*m*q*(q-r)-(b-a)*(r-1)); q=(q-1)*(r-1)*(s-1)
+            if p>0: q=-q
+            else: p=-p
+            if 2*p<min(3*m*q-abs(tol*q), abs(e*q)): e=d; d=p/q
+            else: d=m; e=m
+        else: d=m; e=m
+        a, fa = b, fb
+        b += d if abs(d)>tol else (tol if m>0 else -tol)
+        fb=g(b)
+    return b
+
+def solve_limit(g: Callable[[float], float], target: float, lo: float = 0.0, hi: float = DELTA_MAX,
+                *, xtol: float = 1e-12, method: str = "brent") -> float | None:
+    """
+    [lo,hi]에서 증가하는 제약 g 에 대해 g(δ)=target 인 δ. 범위 안에서 도달하지 않으면 None.
+    """
+    if target is None or target<=0: return None
+    h=lambda d: g(d)-target
+    if h(lo)>=0: return lo
+    ab=bracket(h, lo, hi)
+    if ab is None: return None
+    a, b = ab
+    if a==b: return a
+    return brentq(h, a, b, xtol) if method=="brent" else bisect(h, a, b, xtol)
+
+def bisect_array(g, lo, hi, target, *, iters: int = 60):
+    """
+    배열 버전 이분법: 요소마다 증가 함수 g(δ)=target 을 [lo,hi]에서 푼다.
+    (δ, ok) 반환, 범위 밖은 ok=False·δ=nan. 60회면 2^-60·(hi-lo) 정밀도.
+    """
+    import numpy as np
+    lo=np.asarray(lo, dtype=float); hi=np.asarray(hi, dtype=float); target=np.asarray(target, dtype=float)
+    a, b, t = np.broadcast_arrays(lo, hi, target)
+    a=a.copy(); b=b.copy()
+    ok=(g(a)<=t) & (g(b)>=t)
+    for _ in range(iters):
+        m=0.5*(a+b); up=g(m)<t
+        a=np.where(up, m, a); b=np.where(up, b, m)
+    return np.where(ok, 0.5*(a+b), np.nan), ok
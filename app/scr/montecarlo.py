@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+몬테카를로 불확도 해석 — System/RL 매개변수를 분포에서 N 개 뽑아 SCR, P_max, δ-한계의
+분위수/히스토그램을 구한다.
+
+    python -m scr.montecarlo spec.json -n 10000000 --workers 8
+
+spec(JSON): 매개변수 → 상수(단위 문자열 허용) 또는 분포
+  {"dist": "normal",  "mean": "380", "sd": "4"}        (또는 "sd_pct": 1)
+  {"dist": "uniform", "lo": "70uH", "hi": "80uH"}
+  {"dist": "tol",     "nom": "75uH", "pct": 5}          (nom·(1 ± pct%) 균등)
+매개변수: V_LL, S_n, f, R_line, L_line, R_tr, L_tr (+선택 I_max, dV_pct → δ-한계). 표본은 0 이상으로 자른다.
+
+- 표본은 chunk 단위로 뽑고 청크마다 SeedSequence(seed).spawn 의 독립 스트림을 쓰므로
+  결과가 워커 수와 무관하게 재현된다 (청크 순서대로 병합)
+- 통계는 온라인(평균/분산 Chan 병합, 최소/최대, 고정 구간 히스토그램)이라 메모리는
+  chunk 크기 × 진행 중 청크 수로 제한된다. 히스토그램 범위는 첫 청크에서 정한다
+- 분위수는 히스토그램 보간 — 히스토그램 범위 안에서는 오차가 구간 폭(bin_width) 이하
+"""
+from __future__ import annotations
+import argparse, json, os, sys, time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import vec
+from .batch import KINDS
+from .utils import parse_value
+
+PARAMS = ("V_LL", "S_n", "f", "R_line", "L_line", "R_tr", "L_tr", "I_max", "dV_pct")
+QUANTILES = (1, 5, 25, 50, 75, 95, 99)
+
+# --- 분포 ---
+def _val(v, kind):
+    return float(parse_value(v, kind)) if isinstance(v, str) else float(v)
+
+def parse_spec(spec: dict) -> dict:
+    """spec → {매개변수: (분포, a, b)} (단위 해석 완료). 알 수 없는 키/분포는 ValueError."""
+    out = {}
+    for k, v in spec.items():
+        if k not in PARAMS: raise ValueError(f"알 수 없는 매개변수: {k}")
+        kind = KINDS[k]
+        if not isinstance(v, dict):
+            out[k] = ("const", _val(v, kind), 0.0); continue
+        d = v.get("dist", "const")
+        if d == "normal":
+            m = _val(v["mean"], kind)
+            out[k] = ("normal", m, _val(v["sd"], kind) if "sd" in v else abs(m)*float(v.get("sd_pct", 0))/100)
+        elif d == "uniform":
+            out[k] = ("uniform", _val(v["lo"], kind), _val(v["hi"], kind))
+        elif d == "tol":
+            nom = _val(v["nom"], kind); p = float(v["pct"])/100
+            out[k] = ("uniform", nom*(1-p), nom*(1+p))
+        elif d == "const":
+            out[k] = ("const", _val(v["value"], kind), 0.0)
+        else:
+            raise ValueError(f"알 수 없는 분포: {d}")
+    for k in ("V_LL", "S_n", "f"):
+        if k not in out: raise ValueError(f"필수 매개변수 없음: {k}")
+    return out
+
+def sample(params: dict, n: int, rng) -> dict:
+    cols = {}
+    for k, (d, a, b) in params.items():
+        if d == "normal": x = rng.normal(a, b, n)
+        elif d == "uniform": x = rng.uniform(a, b, n)
+        else: x = np.full(n, a)
+        cols[k] = np.maximum(x, 0.0)
+    return cols
+
+def evaluate(cols: dict) -> dict:
+    """표본 열 → 지표 열 (SCR, Zth, P_max_MW, 선택 delta_I_deg/delta_V_deg). 해 없음은 nan."""
+    with np.errstate(all="ignore"):
+        res = vec.evaluate(cols)
+        out = dict(SCR=res["SCR"], Zth=res["Zth"], P_max_MW=res["P_max"]/1e6)
+        Vph = cols["V_LL"]/vec.SQRT3
+        if "I_max" in cols: out["delta_I_deg"] = np.degrees(vec.current_drop_limit(Vph, res["Zth"], cols["I_max"])[0])
+        if "dV_pct" in cols: out["delta_V_deg"] = np.degrees(vec.voltage_drop_limit(Vph, cols["dV_pct"])[0])
+    return out
+
+# --- 온라인 통계 ---
+class Stats:
+    """병합 가능한 온라인 통계: 개수, nan 수, 평균/분산, 최소/최대, 고정 구간 히스토그램."""
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=float)
+        self.counts = np.zeros(len(self.edges)+1, dtype=np.int64)   # [0]=미만, [-1]=초과
+        self.n = 0; self.nan = 0; self.mean = 0.0; self.m2 = 0.0; self.lo = np.inf; self.hi = -np.inf
+
+    @classmethod
+    def range_for(cls, x, bins: int, margin: float = 0.05) -> np.ndarray:
+        x = x[np.isfinite(x)]
+        if not x.size: return np.linspace(0.0, 1.0, bins+1)
+        lo, hi = float(x.min()), float(x.max()); pad = (hi-lo)*margin or abs(lo)*margin or 1.0
+        return np.linspace(lo-pad, hi+pad, bins+1)
+
+    def update(self, x):
+        x = np.asarray(x, dtype=float); fin = np.isfinite(x); self.nan += int(x.size-fin.sum()); x = x[fin]
+        if not x.size: return self
+        o = Stats.__new__(Stats); o.n = x.size; o.mean = float(x.mean()); o.m2 = float(((x-o.mean)**2).sum())
+        o.lo = float(x.min()); o.hi = float(x.max()); o.nan = 0
+        idx = np.searchsorted(self.edges, x, side="right"); idx[x == self.edges[-1]] = len(self.edges)-1
+        o.counts = np.bincount(idx, minlength=len(self.counts)); o.edges = self.edges
+        return self.merge(o)
+
+    def merge(self, o: "Stats"):
+        n = self.n+o.n
+        if o.n:
+            d = o.mean-self.mean
+            self.mean += d*o.n/n; self.m2 += o.m2 + d*d*self.n*o.n/n
+            self.lo = min(self.lo, o.lo); self.hi = max(self.hi, o.hi)
+        self.n = n; self.nan += o.nan; self.counts += o.counts
+        return self
+
+    @property
+    def std(self) -> float:
+        return (self.m2/(self.n-1))**0.5 if self.n > 1 else float("nan")
+
+    @property
+    def bin_width(self) -> float:
+        return float(self.edges[1]-self.edges[0])
+
+    def percentile(self, q):
+        """히스토그램 선형 보간 분위수 (q: 0–100). 범위 밖 구간은 관측 최소/최대까지로 본다."""
+        if not self.n: return np.full(np.shape(q), np.nan)
+        lo_e = np.concatenate([[min(self.lo, self.edges[0])], self.edges])
+        hi_e = np.concatenate([self.edges, [max(self.hi, self.edges[-1])]])
+        cum = np.cumsum(self.counts); t = np.asarray(q, dtype=float)/100*self.n
+        i = np.minimum(np.searchsorted(cum, t, side="left"), len(cum)-1)
+        prev = np.where(i > 0, cum[i-1], 0); c = np.maximum(self.counts[i], 1)
+        x = lo_e[i] + (hi_e[i]-lo_e[i])*np.clip((t-prev)/c, 0, 1)
+        return np.clip(x, self.lo, self.hi)
+
+    def summary(self, qs=QUANTILES) -> dict:
+        p = self.percentile(qs)
+        return dict(n=self.n, nan=self.nan, mean=self.mean, std=self.std, min=self.lo, max=self.hi,
+                    bin_width=self.bin_width, **{f"p{q:g}": float(v) for q, v in zip(qs, p)})
+
+    def histogram(self):
+        """(구간 경계, 개수) — 범위 밖 개수는 제외."""
+        return self.edges, self.counts[1:-1]
+
+# --- 실행 ---
+def _work(args) -> tuple[int, dict]:
+    params, m, ss, edges = args
+    res = evaluate(sample(params, m, np.random.default_rng(ss)))
+    return m, {k: Stats(edges[k]).update(v) for k, v in res.items()}
+
+def run(spec: dict, n: int, *, chunk: int = 1 << 18, workers: int = 0, seed: int = 0, bins: int = 1024,
+        ranges: dict | None = None, progress: bool = False) -> dict:
+    """
+    N 표본 몬테카를로. {지표: Stats} 반환. workers<=1 이면 현재 프로세스에서.
+    ranges={지표: (최소, 최대)} 를 주면 그 범위로 히스토그램을 만든다 (아니면 첫 청크에서).
+    """
+    params = parse_spec(spec)
+    sizes = [min(chunk, n-a) for a in range(0, n, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if not sizes: return {}
+    first = evaluate(sample(params, sizes[0], np.random.default_rng(seeds[0])))
+    edges = {k: np.linspace(*ranges[k], bins+1) if ranges and k in ranges else Stats.range_for(v, bins)
+             for k, v in first.items()}
+    stats = {k: Stats(edges[k]).update(v) for k, v in first.items()}
+    jobs = ((params, m, ss, edges) for m, ss in zip(sizes[1:], seeds[1:]))
+    t0 = time.perf_counter(); done = sizes[0]
+    def merge(m, part):
+        nonlocal done
+        for k, s in part.items(): stats[k].merge(s)
+        done += m
+        if progress:
+            dt = time.perf_counter()-t0
+            print(f"\r{done:,}/{n:,} 표본, {done/dt if dt else 0:,.0f}/s", end="", file=sys.stderr, flush=True)
+    if workers <= 1:
+        for j in jobs: merge(*_work(j))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            pending = deque()
+            for j in jobs:
+                pending.append(ex.submit(_work, j))
+                if len(pending) >= workers*2: merge(*pending.popleft().result())
+            while pending: merge(*pending.popleft().result())
+    if progress: print(file=sys.stderr)
+    return stats
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m scr.montecarlo", description="SCR 몬테카를로 불확도 해석")
+    ap.add_argument("spec", help="분포 spec JSON 경로")
+    ap.add_argument("-n", type=float, default=1e6, help="표본 수")
+    ap.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("-c", "--chunk", type=int, default=1 << 18)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--bins", type=int, default=1024)
+    ap.add_argument("-o", "--output", help="요약 JSON 경로 (기본 stdout)")
+    ap.add_argument("-q", "--quiet", action="store_true")
+    a = ap.parse_args(argv)
+    with open(a.spec, encoding="utf-8") as f: spec = json.load(f)
+    t0 = time.perf_counter()
+    stats = run(spec, int(a.n), chunk=a.chunk, workers=a.workers, seed=a.seed, bins=a.bins, progress=not a.quiet)
+    text = json.dumps({k: s.summary() for k, s in stats.items()}, ensure_ascii=False, indent=2)
+    if a.output:
+        with open(a.output, "w", encoding="utf-8") as f: f.write(text + "\n")
+    else:
+        print(text)
+    if not a.quiet: print(f"완료: {int(a.n):,} 표본, {time.perf_counter()-t0:.2f}s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
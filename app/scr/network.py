@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+다모선 계통 모델 — 가지(branch) 목록에서 희소 어드미턴스 행렬 Y 를 만들어 한 번 LU 분해하고,
+모든 모선의 테브난 임피던스 Z_kk = (Y⁻¹)_kk 와 SCR 을 구한다.
+
+- 가지: (from, to, R, L). to 가 GROUND(-1) 이면 기준(무한 모선 전압원 뒤의 계통 임피던스 등)
+- Y 는 ω 에서의 복소 대칭 행렬 → Z 도 대칭이라 Z 의 열만 풀면 행도 얻는다
+- Y 가 대칭이므로 대칭 순서화·대각 피벗으로 분해하면 U = D·Lᵀ. Z 대각은 이 L, D 위에서
+  Takahashi 선택 역행렬(채움 패턴 위의 Z 원소만 계산)로 얻는다 — 밀집 역행렬 없이 O(nnz(L)) 메모리.
+  분해가 대칭이 아니면(피벗 교환) 단위벡터 블록 풀이로 대신한다
+- 가지 하나의 값/차단기 변경은 ΔY = Δy·a·aᵀ (a = e_from − e_to) 의 저계수 갱신이라
+  재분해 없이 Woodbury 식으로 반영하고, 누적 갱신이 max_updates 를 넘으면 재분해한다
+
+scipy 가 필요하다 (PC 용 — 안드로이드 앱 빌드에는 포함하지 않음).
+"""
+from __future__ import annotations
+import math
+from typing import Iterable, Sequence
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .core import System, RL, MultiInfeed
+
+GROUND = -1
+
+class Network:
+    def __init__(self, sys: System, n_bus: int, frm, to, R, L, *, max_updates: int = 32, block: int = 256):
+        self.sys = sys; self.n = int(n_bus)
+        self.frm = np.asarray(frm, dtype=np.intp); self.to = np.asarray(to, dtype=np.intp)
+        self.R = np.asarray(R, dtype=float).copy(); self.L = np.asarray(L, dtype=float).copy()
+        self.closed = np.ones(len(self.frm), dtype=bool)
+        if self.frm.min(initial=0) < 0 or max(self.frm.max(initial=-1), self.to.max(initial=-1)) >= self.n:
+            raise ValueError("가지의 모선 번호가 범위를 벗어남.")
+        self.max_updates = max_updates; self.block = block
+        self._lu = None; self._diag0 = None
+        self._A = []; self._dy = []; self._W = None; self._Minv = None
+
+    @classmethod
+    def from_branches(cls, sys: System, branches: Iterable[Sequence], n_bus: int | None = None, **kw) -> "Network":
+        """branches: (from, to, RL) 또는 (from, to, R, L). to=GROUND(-1)/None 은 기준 모선."""
+        rows = []
+        for b in branches:
+            f, t, *z = b
+            R, L = (z[0].R, z[0].L) if len(z) == 1 else z
+            rows.append((f, GROUND if t is None else t, R, L))
+        frm, to, R, L = (np.array(c) for c in zip(*rows)) if rows else ([], [], [], [])
+        n = n_bus if n_bus is not None else int(max(np.max(frm), np.max(to))) + 1
+        return cls(sys, n, frm, to, R, L, **kw)
+
+    # --- 조립/분해 ---
+    def _y(self, idx=slice(None)):
+        z = self.R[idx] + 1j*self.sys.omega*self.L[idx]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y = np.where(z != 0, 1.0/z, 0.0)
+        if np.any(z[self.closed[idx]] == 0): raise ValueError("임피던스 0 인 가지 — 모선을 합쳐서 입력하세요.")
+        return np.where(self.closed[idx], y, 0.0)
+
+    def admittance(self) -> sp.csc_matrix:
+        """모선 어드미턴스 행렬 Y (n×n, 복소 대칭, CSC)."""
+        y = self._y(); f = self.frm; t = self.to; g = t == GROUND
+        m = ~g
+        rows = np.concatenate([f, t[m], f[m], t[m]]); cols = np.concatenate([f, t[m], t[m], f[m]])
+        vals = np.concatenate([y, y[m], -y[m], -y[m]])
+        return sp.csc_matrix((vals, (rows, cols)), shape=(self.n, self.n))
+
+    def factorize(self):
+        """Y 를 LU 분해하고 저계수 갱신을 비운다 (대각 Z 캐시도 무효화)."""
+        try:
+            self._lu = spla.splu(self.admittance(), permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0,
+                                 options=dict(SymmetricMode=True))
+        except RuntimeError as e:
+            raise ValueError("Y 가 특이 — 기준(GROUND)과 연결되지 않은 모선이 있음.") from e
+        self._diag0 = None; self._A = []; self._dy = []; self._W = None; self._Minv = None
+        return self
+
+    def _factor(self):
+        if self._lu is None: self.factorize()
+        return self._lu
+
+    def _solve0(self, B):
+        """기준 분해로 Y0⁻¹·B."""
+        return self._factor().solve(np.asarray(B, dtype=complex))
+
+    # --- Z 추출 ---
+    def _z0_diag(self) -> np.ndarray:
+        if self._diag0 is None:
+            lu = self._factor()
+            self._diag0 = _selinv_diag(lu)[lu.perm_c] if np.array_equal(lu.perm_r, lu.perm_c) else self._block_diag()
+        return self._diag0
+
+    def _block_diag(self) -> np.ndarray:
+        n, blk = self.n, self.block; out = np.empty(n, dtype=complex)
+        for a in range(0, n, blk):
+            b = min(n, a+blk); E = np.zeros((n, b-a), dtype=complex)
+            E[np.arange(a, b), np.arange(b-a)] = 1.0
+            out[a:b] = self._solve0(E)[np.arange(a, b), np.arange(b-a)]
+        return out
+
+    def z_diag(self) -> np.ndarray:
+        """모든 모선의 테브난 임피던스 Z_kk (복소, Ω/상)."""
+        d = self._z0_diag()
+        if not self._dy: return d.copy()
+        W, Minv = self._woodbury()
+        return d - np.einsum("ij,jk,ik->i", W, Minv, W)
+
+    def z_columns(self, buses: Sequence[int]) -> np.ndarray:
+        """Z[:, buses] (n×k). 대칭이므로 Z[buses, :] 의 전치이기도 하다."""
+        buses = np.asarray(buses, dtype=np.intp)
+        E = np.zeros((self.n, len(buses)), dtype=complex); E[buses, np.arange(len(buses))] = 1.0
+        Z = self._solve0(E)
+        if self._dy:
+            W, Minv = self._woodbury()
+            Z = Z - W @ (Minv @ W[buses].T)
+        return Z
+
+    def z_matrix(self, buses: Sequence[int]) -> np.ndarray:
+        """선택 모선 사이의 Z (k×k) — 다중 연계 상호작용 계산용."""
+        return self.z_columns(buses)[np.asarray(buses, dtype=np.intp)]
+
+    def thevenin(self, buses: Sequence[int] | None = None) -> np.ndarray:
+        """|Z_th| (Ω/상). buses=None 이면 전 모선."""
+        if buses is None: return np.abs(self.z_diag())
+        return np.abs(np.diagonal(self.z_matrix(buses)))
+
+    def scr(self, S_n=None, buses: Sequence[int] | None = None) -> np.ndarray:
+        """SCR = V_LL²/(|Z_kk|·S_n). S_n 은 스칼라 또는 모선별 배열 (기본 sys.S_n)."""
+        Sn = self.sys.S_n if S_n is None else np.asarray(S_n, dtype=float)
+        with np.errstate(divide="ignore"):
+            return self.sys.V_LL**2/(self.thevenin(buses)*Sn)
+
+    def multi_infeed(self, buses: Sequence[int], S_n, chunk: int = 256) -> MultiInfeed:
+        """연계 모선들의 MIIF/MISCR/WSCR (core.MultiInfeed)."""
+        return MultiInfeed(self.sys.V_LL, self.z_matrix(buses), S_n, chunk)
+
+    # --- 저계수 갱신 ---
+    def _a(self, k) -> np.ndarray:
+        a = np.zeros(self.n); a[self.frm[k]] = 1.0
+        if self.to[k] != GROUND: a[self.to[k]] = -1.0
+        return a
+
+    def _woodbury(self):
+        """Z = Z0 − W·M⁻¹·Wᵀ, W = Z0·A, M = D⁻¹ + Aᵀ·Z0·A (ΔY = A·D·Aᵀ)."""
+        if self._W is None:
+            A = np.column_stack(self._A); W = self._solve0(A)
+            Dinv = np.diag(1.0/np.asarray(self._dy)); AW = A.T @ W; M = Dinv + AW
+            # 모선이 분리되면 D⁻¹ 와 AᵀZ0A 가 상쇄되어 M 이 반올림 잡음만 남는다 — 두 항의 크기에 대한
+            # 최소 특이값으로 판정 (1×1 이면 cond(M) 은 언제나 1 이라 쓸 수 없다)
+            sv = np.linalg.svd(M, compute_uv=False)
+            if not np.all(np.isfinite(sv)) or sv[-1] <= 1e-10*max(np.abs(Dinv).max(), np.abs(AW).max()):
+                raise ValueError("변경 후 계통이 분리됨 (Y 특이).")
+            Minv = np.linalg.inv(M)
+            self._W, self._Minv = W, Minv
+        return self._W, self._Minv
+
+    def set_branch(self, k: int, R: float | None = None, L: float | None = None, closed: bool | None = None):
+        """
+        가지 k 의 R/L 또는 차단기 상태를 바꾼다. 분해가 있으면 저계수 갱신으로 반영하고,
+        누적 갱신이 max_updates 를 넘으면 다시 분해한다.
+        """
+        y_old = self._y([k])[0]
+        if R is not None: self.R[k] = R
+        if L is not None: self.L[k] = L
+        if closed is not None: self.closed[k] = bool(closed)
+        dy = self._y([k])[0] - y_old
+        if self._lu is None or dy == 0: return self
+        if len(self._dy) >= self.max_updates: return self.factorize()
+        self._A.append(self._a(k)); self._dy.append(dy); self._W = None; self._Minv = None
+        return self
+
+    def __len__(self): return self.n
+
+def _selinv_diag(lu) -> np.ndarray:
+    """
+    대칭 분해(U = D·Lᵀ)에서 Takahashi 점화식으로 diag(A⁻¹) (분해 순서 기준).
+    열 j 의 비영 행 집합 S 에 대해 Z[S, j] = −Z[S, S]·L[S, j], Z[j, j] = 1/d_j − L[S, j]ᵀ·Z[S, j];
+    Z[S, S] 는 채움 패턴(클리크) 안이라 뒤쪽 열에서 이미 계산되어 있다.
+    """
+    L = lu.L.tocsc(); L.sort_indices(); d = lu.U.diagonal(); n = L.shape[0]
+    ip, ix, lv = L.indptr, L.indices, L.data
+    zd = np.empty(n, dtype=complex); rows = [None]*n; zc = [None]*n
+    for j in range(n-1, -1, -1):
+        S = ix[ip[j]:ip[j+1]]; l = lv[ip[j]:ip[j+1]]; m = S > j; S = S[m]; l = l[m]
+        k = len(S); rows[j] = S
+        if not k:
+            zd[j] = 1.0/d[j]; zc[j] = l; continue
+        Zs = np.empty((k, k), dtype=complex)
+        for p in range(k):
+            Zs[p, p] = zd[S[p]]
+            if p+1 < k:
+                v = zc[S[p]][np.searchsorted(rows[S[p]], S[p+1:])]
+                Zs[p+1:, p] = v; Zs[p, p+1:] = v
+        z = -(Zs @ l); zc[j] = z; zd[j] = 1.0/d[j] - l @ z
+    return zd
+
+def ladder(sys: System, n_bus: int, feeders: int = 1, seg: RL = RL(0.01, 50e-6), src: RL = RL(0.0, 30e-6),
+           ties: int = 0, seed: int = 0) -> Network:
+    """
+    시험/벤치마크용 계통: 기준 모선 0 에서 방사형 피더 feeders 개로 n_bus 모선을 잇고
+    (가지마다 seg), 모선 0 은 src 로 기준에 연결, ties 개의 무작위 연계선으로 망을 만든다.
+    """
+    rng = np.random.default_rng(seed)
+    per = max(1, math.ceil((n_bus-1)/feeders))
+    rows = [(0, GROUND, src.R, src.L)]
+    for b in range(1, n_bus):
+        prev = 0 if (b-1) % per == 0 else b-1
+        rows.append((prev, b, seg.R, seg.L))
+    for _ in range(ties):
+        i, j = rng.choice(np.arange(1, n_bus), 2, replace=False)
+        rows.append((int(i), int(j), seg.R, seg.L))
+    return Network.from_branches(sys, rows, n_bus)
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+HTML 보고서 — 케이스 하나(앱 내보내기) 또는 케이스 여러 개(배치/이력)를 한 번에.
+
+    python -m scr.report cases.csv -o reports/ --workers 8
+    python -m scr.report --store scr.sqlite3 --since 2026-01-01 -o reports/
+
+- 그림은 base64 로 끼워 넣지 않고 assets/<해시>.png 로 한 번만 쓰고 HTML 에서 참조한다.
+  해시는 그림 입력(운전점 스칼라 + 파형 배열 바이트)이라 같은 그림은 다시 렌더링하지 않는다
+- 케이스 HTML 과 색인(index.html/index.csv)은 파일에 순서대로 흘려 쓴다 — δ-스윕 표도
+  ColumnTable 페이지 단위로 써서 메모리는 표 크기와 무관하다
+- 케이스는 chunk 개씩 ProcessPoolExecutor 로 나누고 워커마다 PlotSet 을 하나씩 재사용한다
+  (진행 중 청크는 workers*2 개로 제한, 색인은 입력 순서)
+
+입력은 scr.batch 와 같은 CSV/JSONL(V_LL, S_n, f, R/L 열 + 선택 P, delta_deg, I_max, dV_pct, id)
+또는 scr.store 의 "scr" 결과. Kivy 에 의존하지 않는다.
+"""
+from __future__ import annotations
+import argparse, csv, datetime, hashlib, html, itertools, json, math, os, sys, time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .core import System, p_of_delta, delta_from_p, current_drop_limit, voltage_drop_limit, waveforms, sweep_delta
+from .utils import parse_value
+
+CSS = ("body{font-family:system-ui,Segoe UI,Roboto,'Apple SD Gothic Neo',Noto Sans KR,Malgun Gothic,sans-serif;background:#0f172a;color:#e2e8f0;margin:0}"
+       " .wrap{max-width:980px;margin:0 auto;padding:24px} .card{background:#111827;border:1px solid #1f2937;border-radius:12px;padding:16px;margin:12px 0}"
+       " table{width:100%;border-collapse:collapse} th,td{border:1px solid #1f2937;padding:8px 10px} th{background:#0b1220} img{max-width:100%} a{color:#93c5fd}")
+# (표시 이름, 키, 서식, 배율)
+ROWS = [("SCR", "SCR", "{:.3f}", 1), ("S_sc [MVA]", "S_sc", "{:.3f}", 1e-6), ("|Z_th| [Ω/상]", "Zth", "{:.6f}", 1),
+        ("I_sc/I_r", "I_ratio", "{:.3f}", 1), ("V_LL [V]", "V_LL", "{:.1f}", 1), ("S_n [VA]", "S_n", "{:.0f}", 1),
+        ("f [Hz]", "f", "{:.1f}", 1), ("R_line [Ω/상]", "R_line", "{:.6f}", 1), ("L_line [H/상]", "L_line", "{:.9e}", 1),
+        ("R_tr [Ω/상]", "R_tr", "{:.6f}", 1), ("L_tr [H/상]", "L_tr", "{:.9e}", 1)]
+INDEX_COLS = ["case", "id", "SCR", "S_sc", "Zth", "V_LL", "S_n", "f", "P_MW", "delta_deg", "P_max_MW", "error"]
+FIG_TITLES = {"phas_pdelta": "Phasor & P–δ", "wave": "Time waveforms"}
+SWEEP_KEYS, SWEEP_HEADERS, SWEEP_FMTS = ["delta_deg", "P_MW", "I_A", "dV_pct"], ["δ[deg]", "P[MW]", "I[A]", "ΔV[%]"], ["%.2f", "%.6f", "%.3f", "%.3f"]
+SWEEP_PAGE = 4096    # δ-스윕 표를 흘려 쓸 때 한 번에 서식화하는 행 수
+
+# --- 운전점 ---
+def operating_point(r: dict, P="", delta_deg=0.0, I_max="", dV_pct="") -> tuple[dict, dict]:
+    """
+    계산 결과(V_LL, S_n, f, R/L) + 운전 입력 → (PlotSet.update 용 op, 요약 값).
+    P(>0)가 있으면 δ(P), 아니면 δ 에서 P. 입력은 단위 문자열 또는 숫자.
+    """
+    num = lambda v, kind: parse_value(v, kind) if isinstance(v, str) else float(v or 0)
+    sys_ = System(float(r["V_LL"]), float(r["S_n"]), float(r["f"]))
+    R = float(r.get("R_line", 0))+float(r.get("R_tr", 0))
+    X = sys_.omega*(float(r.get("L_line", 0))+float(r.get("L_tr", 0)))
+    VLL = sys_.V_LL; Vph = sys_.V_ph; Zabs = math.hypot(R, X); theta = math.atan2(X, R) if (R or X) else 0.0
+    P_in = num(P, 'P'); d_in = math.radians(float(delta_deg or 0))
+    if P_in > 0: delta = delta_from_p(VLL, R, X, P_in); P = P_in
+    else: delta = d_in; P = p_of_delta(VLL, R, X, delta)
+    E = Vph*complex(math.cos(delta), math.sin(delta)); I = (E-Vph)/complex(R, X) if Zabs > 0 else 0j
+    Irms = abs(I); Iang = math.atan2(I.imag, I.real)
+    Pmax = (VLL**2/Zabs)*(1-math.cos(theta)) if Zabs > 0 else 0.0
+    Imax_val = num(I_max, 'I') if I_max else None; Vpct_val = num(dV_pct, 'pct') if dV_pct else None
+    dI = current_drop_limit(Vph, Zabs, Imax_val) if Imax_val else None
+    dV = voltage_drop_limit(Vph, Vpct_val) if Vpct_val else None
+    t, v_pcc, v_inv, i_t = waveforms(sys_, Irms, delta, Iang, cycles=2, ppc=400)
+    op = dict(Vph=Vph, delta=delta, theta=theta, VLL=VLL, Zabs=Zabs, P=P, dI=dI, dV=dV, t=t, v_pcc=v_pcc, v_inv=v_inv, i_t=i_t)
+    return op, dict(P=P, delta=delta, Pmax=Pmax, Irms=Irms)
+
+def op_key(op: dict, *extra) -> str:
+    """그림 입력 해시 — 스칼라는 JSON, 배열은 바이트."""
+    h = hashlib.blake2b(digest_size=12)
+    h.update(json.dumps([extra, sorted((k, v) for k, v in op.items() if not isinstance(v, np.ndarray))]).encode())
+    for k in sorted(k for k, v in op.items() if isinstance(v, np.ndarray)): h.update(np.ascontiguousarray(op[k]).tobytes())
+    return h.hexdigest()
+
+# --- 자산 ---
+class Assets:
+    """root/assets/<해시>.<확장자> — 있으면 다시 쓰지 않는다. 임시 파일 + os.replace 라 워커가 겹쳐 써도 안전."""
+    def __init__(self, root, sub: str = "assets"):
+        self.root = Path(root); self.sub = sub; self.dir = self.root/sub
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+    def _write(self, path: Path, data: bytes):
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data); os.replace(tmp, path)
+
+    def put(self, data: bytes, ext: str = "png") -> str:
+        """내용 해시로 저장. HTML 에서 쓸 상대 경로 반환."""
+        name = f"{hashlib.blake2b(data, digest_size=12).hexdigest()}.{ext}"
+        if not (self.dir/name).exists(): self._write(self.dir/name, data)
+        return f"{self.sub}/{name}"
+
+    def get_or_make(self, key: str, make, ext: str = "png") -> str:
+        """입력 해시 key 로 저장 — 이미 있으면 make() 를 부르지 않는다."""
+        name = f"{key}.{ext}"
+        if not (self.dir/name).exists(): self._write(self.dir/name, make())
+        return f"{self.sub}/{name}"
+
+# --- HTML ---
+def _fmt(r, key, fmt, scale):
+    v = r.get(key)
+    try: return fmt.format(float(v)*scale)
+    except (TypeError, ValueError): return "-"
+
+def write_case(path, r: dict, images: dict, op_info: dict | None = None, sweep=None, title: str = "SCR 계산기 Pro v2 보고서",
+               error: str | None = None):
+    """
+    케이스 보고서 HTML 을 path 에 쓴다. images: {그림 이름: 상대 경로},
+    sweep: δ-스윕 ColumnStore (있으면 표를 페이지 단위로 흘려 씀), error: 운전점을 못 구한 사유 (입력 표와 함께 표시).
+    """
+    e = html.escape
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"<!doctype html><meta charset='utf-8'><title>{e(title)}</title><style>{CSS}</style><div class='wrap'><h1>{e(title)}</h1>")
+        if r.get("id") not in (None, ""): f.write(f"<p>케이스: {e(str(r['id']))}</p>")
+        if error: f.write(f"<div class='card'><b>계산 불가:</b> {e(error)}</div>")
+        rows = [(k, _fmt(r, key, fmt, s)) for k, key, fmt, s in ROWS]
+        if op_info:
+            rows += [("P [MW]", f"{op_info['P']/1e6:.3f}"), ("δ [deg]", f"{math.degrees(op_info['delta']):.2f}"),
+                     ("P_max [MW]", f"{op_info['Pmax']/1e6:.3f}"), ("I [A]", f"{op_info['Irms']:.1f}")]
+        f.write("<div class='card'><table>" + "".join(f"<tr><th>{e(k)}</th><td>{v}</td></tr>" for k, v in rows) + "</table></div>")
+        for name, src in images.items():
+            f.write(f"<div class='card'><h3>{e(FIG_TITLES.get(name, name))}</h3><img src='{e(src)}' loading='lazy'/></div>")
+        if sweep is not None and len(sweep):
+            from .table import ColumnTable
+            tbl = ColumnTable(sweep, SWEEP_KEYS, SWEEP_FMTS)
+            f.write(f"<div class='card'><h3>δ-스윕 ({len(tbl):,} 포인트)</h3><table><tr>"
+                    + "".join(f"<th>{h}</th>" for h in SWEEP_HEADERS) + "</tr>")
+            for a in range(0, len(tbl), SWEEP_PAGE):
+                f.writelines("<tr>" + "".join(f"<td>{v}</td>" for v in row) + "</tr>" for row in tbl.rows(a, a+SWEEP_PAGE))
+            f.write("</table></div>")
+        f.write("</div>")
+
+class IndexWriter:
+    """index.html + index.csv 를 행 단위로 흘려 쓴다 (with 블록)."""
+    def __init__(self, root, title: str = "SCR 보고서 색인"):
+        self.root = Path(root); self.title = title; self.n = 0
+
+    def __enter__(self):
+        self.fh = open(self.root/"index.html", "w", encoding="utf-8")
+        self.fc = open(self.root/"index.csv", "w", newline="", encoding="utf-8-sig")
+        self.csv = csv.writer(self.fc); self.csv.writerow(INDEX_COLS)
+        self.fh.write(f"<!doctype html><meta charset='utf-8'><title>{html.escape(self.title)}</title><style>{CSS}</style>"
+                      f"<div class='wrap'><h1>{html.escape(self.title)}</h1><div class='card'><table><tr>"
+                      + "".join(f"<th>{c}</th>" for c in INDEX_COLS) + "</tr>")
+        return self
+
+    def write(self, rows):
+        for row in rows:
+            cells = [row.get(c, "") for c in INDEX_COLS]; self.csv.writerow(cells); self.n += 1
+            link = f"<a href='{html.escape(row['case'])}'>{html.escape(row['case'])}</a>"
+            self.fh.write("<tr><td>" + link + "</td>" + "".join(f"<td>{html.escape(_cell(v))}</td>" for v in cells[1:]) + "</tr>")
+
+    def __exit__(self, *exc):
+        self.fh.write(f"</table><p>{self.n:,} 케이스 · {datetime.datetime.now():%Y-%m-%d %H:%M:%S}</p></div></div>")
+        self.fh.close(); self.fc.close()
+
+def _cell(v) -> str:
+    return f"{v:.6g}" if isinstance(v, float) else str(v)
+
+# --- 케이스 입력 ---
+def iter_cases(path: str, chunk: int = 20000, fmt: str | None = None, pu: bool = False):
+    """scr.batch 입력 형식 → 케이스 dict (계산 결과 + 운전 입력 문자열) 을 순서대로."""
+    from .batch import iter_chunks, eval_chunk
+    for ch in iter_chunks(path, chunk, fmt):
+        res = eval_chunk(ch, pu); n = len(res["ok"])
+        cols = {k: v.tolist() for k, v in res.items() if isinstance(v, np.ndarray)}
+        for i in range(n):
+            r = {k: v[i] for k, v in cols.items()}
+            for k in ("id", "P", "delta_deg", "I_max", "dV_pct"):
+                if k in ch: r[k] = ch[k][i]
+            yield r
+
+def cases_from_store(store, **query):
+    """scr.store 의 "scr" 결과 (store.query 인자 그대로, 기본 최신 1000건)."""
+    query.setdefault("limit", 1000)
+    for q in store.query("scr", **query):
+        yield dict(q["result"], id=q["key"])
+
+# --- 실행 ---
+_PLOTS = None
+
+def _plots(op: dict):
+    """프로세스마다 PlotSet 하나. 여백은 첫 케이스로 한 번만 맞춘다 (png(tight=False) 가 잘리지 않게)."""
+    global _PLOTS
+    if _PLOTS is None:
+        import matplotlib
+        matplotlib.use("Agg")
+        from .figures import PlotSet, configure_fonts
+        configure_fonts(); _PLOTS = PlotSet(); _PLOTS.update(op)
+        for fig in _PLOTS.figures.values(): fig.tight_layout(); fig.set_layout_engine(None)
+    _PLOTS.update(op)
+    return _PLOTS
+
+def render_case(out: Path, name: str, r: dict, assets: Assets, *, dpi: int = 100, sweep=None) -> dict:
+    """
+    케이스 하나를 out/name 에 쓰고 색인 행을 반환. 운전점을 못 구하는 케이스(P > P_max, 임피던스 0 등)는
+    입력과 사유만 담은 페이지를 쓰고 색인 행 error 열에 사유를 남긴다 — 일괄 실행은 계속된다.
+    """
+    row = dict(case=name, id=r.get("id", ""), SCR=r.get("SCR"), S_sc=r.get("S_sc"), Zth=r.get("Zth"),
+               V_LL=r.get("V_LL"), S_n=r.get("S_n"), f=r.get("f"))
+    try:
+        # scr.batch 결과의 ok=False 중 δ(P) 실패는 operating_point 가 같은 사유로 다시 알린다
+        if r.get("ok") is False and r.get("delta_ok") is not False: raise ValueError("임피던스 0 또는 잘못된 입력")
+        op, info = operating_point(r, r.get("P", ""), r.get("delta_deg", 0.0), r.get("I_max", ""), r.get("dV_pct", ""))
+    except (ValueError, ZeroDivisionError) as exc:
+        write_case(out/name, r, {}, error=str(exc))
+        return dict(row, error=str(exc))
+    images = {}
+    for fig in FIG_TITLES:
+        def make(fig=fig):
+            return _plots(op).png(fig, dpi, tight=False)
+        images[fig] = assets.get_or_make(op_key(op, fig, dpi), make)
+    st = None
+    if sweep:
+        sys_ = System(float(r["V_LL"]), float(r["S_n"]), float(r["f"]))
+        R = float(r.get("R_line", 0))+float(r.get("R_tr", 0)); X = sys_.omega*(float(r.get("L_line", 0))+float(r.get("L_tr", 0)))
+        st = sweep_delta(sys_, R, X, *sweep)
+    write_case(out/name, r, images, info, st)
+    return dict(row, P_MW=info["P"]/1e6, delta_deg=math.degrees(info["delta"]), P_max_MW=info["Pmax"]/1e6)
+
+def _work(args) -> list[dict]:
+    start, cases, out, dpi, sweep = args
+    out = Path(out); assets = Assets(out)
+    return [render_case(out, f"case_{start+i:06d}.html", r, assets, dpi=dpi, sweep=sweep) for i, r in enumerate(cases)]
+
+def run(cases, out, *, workers: int = 0, chunk: int = 16, dpi: int = 100, sweep=None, index: bool = True,
+        progress: bool = False) -> tuple[int, float]:
+    """
+    케이스 반복자 → out/ 에 케이스별 HTML + assets/ (+ index.html/index.csv). (케이스 수, 경과 초) 반환.
+    workers<=1 이면 현재 프로세스에서. sweep=(δ_max, 간격) 이면 케이스마다 δ-스윕 표 포함.
+    """
+    out = Path(out); Assets(out)
+    it = iter(cases); t0 = time.perf_counter(); n = n_err = 0
+    def jobs():
+        k = 0
+        while True:
+            part = list(itertools.islice(it, chunk))
+            if not part: return
+            yield (k, part, str(out), dpi, sweep); k += len(part)
+    with IndexWriter(out) if index else _Null() as ix:
+        def emit(rows):
+            nonlocal n, n_err
+            ix.write(rows); n += len(rows); n_err += sum(1 for r in rows if r.get("error"))
+            if progress:
+                dt = time.perf_counter()-t0
+                print(f"\r{n:,}건, {n/dt if dt else 0:,.1f} reports/s", end="", file=sys.stderr, flush=True)
+        if workers <= 1:
+            for j in jobs(): emit(_work(j))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                pending = deque()
+                for j in jobs():
+                    pending.append(ex.submit(_work, j))
+                    if len(pending) >= workers*2: emit(pending.popleft().result())
+                while pending: emit(pending.popleft().result())
+    if progress:
+        print(file=sys.stderr)
+        if n_err: print(f"계산 불가 {n_err:,}건 — index.csv 의 error 열 참고", file=sys.stderr)
+    return n, time.perf_counter()-t0
+
+class _Null:
+    def __enter__(self): return self
+    def __exit__(self, *exc): pass
+    def write(self, rows): pass
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m scr.report", description="SCR 보고서 일괄 생성")
+    ap.add_argument("input", nargs="?", help="케이스 CSV/JSONL (scr.batch 입력 형식)")
+    ap.add_argument("-o", "--output", default="reports", help="출력 폴더")
+    ap.add_argument("--store", help="scr.store SQLite 경로 — 저장된 SCR 결과로 보고서 작성")
+    ap.add_argument("--since", help="--store 와 함께: 이 날짜(YYYY-MM-DD) 이후 결과만")
+    ap.add_argument("--limit", type=int, default=1000, help="--store 와 함께: 최대 건수")
+    ap.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("-c", "--chunk", type=int, default=16, help="워커 작업 하나의 케이스 수")
+    ap.add_argument("--dpi", type=int, default=100)
+    ap.add_argument("--sweep", nargs=2, type=float, metavar=("DMAX", "STEP"), help="케이스마다 δ-스윕 표 포함")
+    ap.add_argument("--in-format", choices=["csv", "jsonl"])
+    ap.add_argument("--pu", action="store_true")
+    ap.add_argument("--no-index", action="store_true")
+    ap.add_argument("-q", "--quiet", action="store_true")
+    a = ap.parse_args(argv)
+    if a.store:
+        from .store import Store
+        since = datetime.datetime.fromisoformat(a.since).timestamp() if a.since else None
+        store = Store(a.store); cases = list(cases_from_store(store, since=since, limit=a.limit)); store.close()
+    elif a.input:
+        cases = iter_cases(a.input, fmt=a.in_format, pu=a.pu)
+    else:
+        ap.error("input 또는 --store 가 필요합니다.")
+    n, dt = run(cases, a.output, workers=a.workers, chunk=a.chunk, dpi=a.dpi,
+                sweep=tuple(a.sweep) if a.sweep else None, index=not a.no_index, progress=not a.quiet)
+    if not a.quiet:
+        print(f"완료: {n:,}건, {dt:.2f}s, {n/dt if dt else 0:,.1f} reports/s → {a.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 HTTP 계산 서비스 (asyncio, 표준 라이브러리만) — web_preview 와 다른 도구가 앱과 같은
+계산(scr.core/scr.utils/scr.vec)을 호출한다.
+
+    python -m scr.service --port 8765        # http://127.0.0.1:8765/ 에서 web_preview 도 제공
+
+POST /scr    {V_LL, S_n, f, R_line, L_line, R_tr, L_tr, pu?}       → calc_scr 와 같은 키 + P_max
+POST /line   {V_LL, S_n, f, target_scr, r_over_l, R_tr, L_tr, pu?}  → R_line, L_line, Zth, S_sc, SCR
+POST /sweep  {…/scr 입력, dmax?, step?, dtype?}                      → δ-스윕 열 (delta_deg, P_MW, I_A, dV_pct)
+GET  /stats                                                         → 요청/캐시/배치 통계
+
+값은 앱과 같은 단위 문자열("0.38kV", "75uH") 또는 숫자. /sweep 의 dmax 기본값은 min(θ, 89.9°), step 0.2°.
+
+- 같은 이벤트 루프 턴에 도착한 /scr, /line 요청은 한 배치로 모아 vec 배열 계산 한 번으로 답한다
+  (진행 중인 같은 입력은 계산을 공유)
+- 응답 본문은 SI 로 해석된 입력의 해시(scr.store.canonical_key)로 LRU 캐시 (항목 수/바이트 상한)
+- /sweep 은 Accept: application/x-scr-columns 이면 열 단위 이진 형식:
+  b"SCRC" + uint32(머리말 길이, LE) + JSON 머리말 {n, columns, dtype} (8바이트 정렬 공백 채움) + 열 바이트를 차례로.
+  아니면 JSON {n, columns: {이름: [...]}}
+- keep-alive HTTP/1.1, CORS 허용(file:// 로 연 미리보기에서도 호출 가능)
+"""
+from __future__ import annotations
+import argparse, asyncio, json, math, struct, sys, time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from . import vec
+from .core import System, sweep_delta
+from .store import canonical_key
+from .utils import parse_value
+
+PREVIEW = Path(__file__).resolve().parents[2]/"web_preview"/"index.html"
+COLUMNS_TYPE = "application/x-scr-columns"
+SWEEP_MAX = 2_000_000       # /sweep 최대 점 수
+BODY_MAX = 1 << 20
+STATUS = {200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+          413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+class HTTPError(Exception):
+    def __init__(self, status: int, msg: str):
+        super().__init__(msg); self.status = status
+
+# --- 입력 해석 ---
+def _num(d: dict, k: str, kind: str, default=0.0, **kw) -> float:
+    v = d.get(k, default)
+    if v is None: raise HTTPError(400, f"{k}: 필수 입력")
+    try: x = parse_value(v, kind, **kw) if isinstance(v, str) else float(v)
+    except (TypeError, ValueError): raise HTTPError(400, f"{k}: 값을 해석할 수 없음 ({v!r})")
+    if not math.isfinite(x): raise HTTPError(400, f"{k}: 유한한 값이어야 함")
+    return x
+
+def _system(d: dict) -> tuple[dict, dict]:
+    """→ (SI 계통 값, R/L 해석용 pu 인자)."""
+    s = dict(V_LL=_num(d, "V_LL", "V", None), S_n=_num(d, "S_n", "S", None), f=_num(d, "f", "F", None))
+    if min(s.values()) <= 0: raise HTTPError(400, "V_LL, S_n, f 는 0 보다 커야 함")
+    pu = dict(pu=bool(d.get("pu"))); sys_ = System(s["V_LL"], s["S_n"], s["f"])
+    if pu["pu"]: pu.update(Z_base=sys_.Z_base, L_base=sys_.L_base)
+    return s, pu
+
+def parse_scr(d: dict) -> dict:
+    s, pu = _system(d)
+    for k, kind in (("R_line", "R"), ("L_line", "L"), ("R_tr", "R"), ("L_tr", "L")): s[k] = _num(d, k, kind, **pu)
+    return s
+
+def parse_line(d: dict) -> dict:
+    s, pu = _system(d)
+    s.update(target_scr=_num(d, "target_scr", "pct", None), r_over_l=_num(d, "r_over_l", "R"),
+             R_tr=_num(d, "R_tr", "R", **pu), L_tr=_num(d, "L_tr", "L", **pu))
+    if s["target_scr"] <= 0: raise HTTPError(400, "target_scr 는 0 보다 커야 함")
+    return s
+
+# --- 배치 계산 (입력 dict 목록 → 결과 목록) ---
+def _cols(items, keys):
+    return {k: np.array([it[k] for it in items], dtype=float) for k in keys}
+
+def eval_scr(items: list[dict]) -> list:
+    c = _cols(items, ("V_LL", "S_n", "f", "R_line", "L_line", "R_tr", "L_tr"))
+    with np.errstate(all="ignore"): res = vec.evaluate(c)
+    keys = ("Zth", "S_sc", "SCR", "I_ratio", "P_max")
+    rows = zip(*(res[k].tolist() for k in keys))
+    return [dict(it, **dict(zip(keys, r))) if ok else HTTPError(422, "임피던스 0 — SCR 정의 불가")
+            for it, r, ok in zip(items, rows, res["ok"].tolist())]
+
+def eval_line(items: list[dict]) -> list:
+    c = _cols(items, ("V_LL", "S_n", "f", "target_scr", "r_over_l", "R_tr", "L_tr"))
+    R, L, ok = vec.solve_line_rl(c["V_LL"], c["S_n"], c["f"], c["target_scr"], c["r_over_l"], c["R_tr"], c["L_tr"])
+    with np.errstate(all="ignore"):
+        res = vec.evaluate(dict(V_LL=c["V_LL"], S_n=c["S_n"], f=c["f"], R_line=np.nan_to_num(R), L_line=np.nan_to_num(L),
+                                R_tr=c["R_tr"], L_tr=c["L_tr"]))
+    rows = zip(R.tolist(), L.tolist(), res["Zth"].tolist(), res["S_sc"].tolist(), res["SCR"].tolist())
+    return [dict(R_line=r, L_line=l, Zth=z, S_sc=s, SCR=k) if o else HTTPError(422, "목표 SCR을 만들 수 없음(해 없음).")
+            for (r, l, z, s, k), o in zip(rows, ok.tolist())]
+
+def eval_sweep(p: dict) -> dict:
+    sys_ = System(p["V_LL"], p["S_n"], p["f"])
+    R = p["R_line"]+p["R_tr"]; X = sys_.omega*(p["L_line"]+p["L_tr"])
+    if not (R or X): raise HTTPError(422, "임피던스 0 — 스윕 불가")
+    st = sweep_delta(sys_, R, X, p["dmax"], p["step"])
+    return {k: st.columns[k] if k in st.columns else st.column(k) for k in ("delta_deg", "P_MW", "I_A", "dV_pct")}
+
+def sweep_response(p: dict, binary: bool) -> tuple:
+    """스윕 계산 + 인코딩 → (상태, 본문, 형식). 큰 스윕은 JSON 직렬화도 오래 걸리므로 통째로 스레드에서 부른다."""
+    cols = eval_sweep(p)
+    if binary: return 200, encode_columns(cols, p["dtype"]), COLUMNS_TYPE
+    return 200, _json(dict(n=len(cols["delta_deg"]), columns={k: v.tolist() for k, v in cols.items()})), "application/json"
+
+def parse_sweep(d: dict) -> dict:
+    p = parse_scr(d)
+    X = 2*math.pi*p["f"]*(p["L_line"]+p["L_tr"]); R = p["R_line"]+p["R_tr"]
+    theta = math.degrees(math.atan2(X, R)) if (R or X) else 0.0
+    p["dmax"] = _num(d, "dmax", "pct", min(theta, 89.9)); p["step"] = _num(d, "step", "pct", 0.2)
+    p["dtype"] = {"f4": "<f4", "f8": "<f8"}.get(str(d.get("dtype", "f8")))
+    if p["dtype"] is None: raise HTTPError(400, "dtype 는 f4 또는 f8")
+    if p["step"] <= 0 or p["dmax"] < 0: raise HTTPError(400, "step > 0, dmax >= 0 이어야 함")
+    if p["dmax"]/p["step"]+1 > SWEEP_MAX: raise HTTPError(413, f"스윕 점 수가 {SWEEP_MAX:,} 를 넘음")
+    return p
+
+# --- 인코딩 ---
+def encode_columns(cols: dict, dtype: str = "<f8") -> bytes:
+    names = list(cols); n = len(next(iter(cols.values()))) if cols else 0
+    head = json.dumps(dict(n=n, columns=names, dtype=dtype)).encode()
+    head += b" "*(-(8+len(head)) % 8)
+    return b"SCRC" + struct.pack("<I", len(head)) + head + b"".join(np.ascontiguousarray(cols[k], dtype=dtype).tobytes() for k in names)
+
+def decode_columns(data: bytes) -> dict:
+    """encode_columns 의 역 (부하 시험/클라이언트용)."""
+    if data[:4] != b"SCRC": raise ValueError("SCRC 형식 아님")
+    hl, = struct.unpack_from("<I", data, 4); head = json.loads(data[8:8+hl]); off = 8+hl
+    dt = np.dtype(head["dtype"]); n = head["n"]; out = {}
+    for k in head["columns"]:
+        out[k] = np.frombuffer(data, dt, n, off); off += n*dt.itemsize
+    return out
+
+def _json(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+# --- 캐시 / 배치 ---
+class LRU:
+    """키 → 응답 바이트. 항목 수와 총 바이트 둘 다 상한."""
+    def __init__(self, max_items: int = 4096, max_bytes: int = 64 << 20):
+        self.d = OrderedDict(); self.max_items = max_items; self.max_bytes = max_bytes
+        self.bytes = 0; self.hits = 0; self.misses = 0
+
+    def get(self, k):
+        v = self.d.get(k)
+        if v is None: self.misses += 1; return None
+        self.d.move_to_end(k); self.hits += 1; return v
+
+    def put(self, k, v):
+        if len(v[1]) > self.max_bytes: return
+        old = self.d.pop(k, None)
+        if old is not None: self.bytes -= len(old[1])
+        self.d[k] = v; self.bytes += len(v[1])
+        while len(self.d) > self.max_items or self.bytes > self.max_bytes:
+            _, ev = self.d.popitem(last=False); self.bytes -= len(ev[1])
+
+class Batcher:
+    """
+    submit(key, item) 을 모아 fn(items) 한 번으로 계산. 첫 요청이 들어온 턴이 끝나면(call_soon)
+    또는 max_batch 개가 차면 실행하고, max_wait>0 이면 그만큼 더 기다려 모은다.
+    같은 key 가 진행 중이면 그 결과를 같이 기다린다.
+    """
+    def __init__(self, fn, max_batch: int = 4096, max_wait: float = 0.0):
+        self.fn = fn; self.max_batch = max_batch; self.max_wait = max_wait
+        self.items = []; self.inflight = {}; self._handle = None
+        self.batches = 0; self.batched = 0; self.largest = 0
+
+    def submit(self, key, item) -> asyncio.Future:
+        fut = self.inflight.get(key)
+        if fut is not None: return fut
+        loop = asyncio.get_running_loop()
+        fut = self.inflight[key] = loop.create_future(); self.items.append((key, item, fut))
+        if len(self.items) >= self.max_batch: self.flush()
+        elif self._handle is None:
+            self._handle = loop.call_later(self.max_wait, self.flush) if self.max_wait > 0 else loop.call_soon(self.flush)
+        return fut
+
+    def flush(self):
+        if self._handle is not None: self._handle.cancel(); self._handle = None
+        items, self.items = self.items, []
+        if not items: return
+        self.batches += 1; self.batched += len(items); self.largest = max(self.largest, len(items))
+        try: results = self.fn([it for _, it, _ in items])
+        except Exception as e: results = [e]*len(items)
+        for (key, _, fut), r in zip(items, results):
+            self.inflight.pop(key, None)
+            if fut.done(): continue
+            if isinstance(r, Exception): fut.set_exception(r)
+            else: fut.set_result(r)
+
+# --- 서비스 ---
+class Service:
+    def __init__(self, cache_items: int = 4096, cache_bytes: int = 64 << 20, max_batch: int = 4096, max_wait: float = 0.0):
+        self.cache = LRU(cache_items, cache_bytes)
+        self.batchers = {"scr": Batcher(eval_scr, max_batch, max_wait), "line": Batcher(eval_line, max_batch, max_wait)}
+        self.requests = 0; self.errors = 0; self.t0 = time.time()
+        self.routes = {("POST", "/scr"): self.scr, ("POST", "/line"): self.line, ("POST", "/sweep"): self.sweep,
+                       ("GET", "/stats"): self.stats, ("GET", "/"): self.index}
+
+    async def _batched(self, kind: str, inputs: dict):
+        key = canonical_key(kind, inputs); hit = self.cache.get(key)
+        if hit is not None:
+            if hit[0] != 200: self.errors += 1
+            return hit
+        err = None
+        try: body = _json(await asyncio.shield(self.batchers[kind].submit(key, inputs)))
+        except HTTPError as e: err = e; body = _json(dict(error=str(e))); self.errors += 1
+        out = (err.status if err else 200, body, "application/json")
+        self.cache.put(key, out)   # 해 없음(422)도 입력이 같으면 같은 답이므로 캐시
+        return out
+
+    async def scr(self, body, headers): return await self._batched("scr", parse_scr(body))
+    async def line(self, body, headers): return await self._batched("line", parse_line(body))
+
+    async def sweep(self, body, headers):
+        p = parse_sweep(body); binary = COLUMNS_TYPE in headers.get("accept", "")
+        key = canonical_key("sweep" + ("/bin" if binary else "/json"), p); hit = self.cache.get(key)
+        if hit is not None: return hit
+        # 큰 스윕은 계산과 인코딩 모두 루프를 막지 않도록 스레드에서
+        out = await asyncio.get_running_loop().run_in_executor(None, sweep_response, p, binary)
+        self.cache.put(key, out); return out
+
+    async def stats(self, body, headers):
+        b = {k: dict(batches=v.batches, items=v.batched, largest=v.largest,
+                     mean=v.batched/v.batches if v.batches else 0.0) for k, v in self.batchers.items()}
+        c = self.cache
+        return 200, _json(dict(requests=self.requests, errors=self.errors, uptime_s=time.time()-self.t0, batch=b,
+                               cache=dict(items=len(c.d), bytes=c.bytes, hits=c.hits, misses=c.misses))), "application/json"
+
+    async def index(self, body, headers):
+        if not PREVIEW.exists(): raise HTTPError(404, "web_preview 없음")
+        return 200, PREVIEW.read_bytes(), "text/html; charset=utf-8"
+
+    async def handle(self, method: str, path: str, headers: dict, raw: bytes):
+        self.requests += 1
+        fn = self.routes.get((method, path.split("?", 1)[0]))
+        try:
+            if fn is None:
+                raise HTTPError(405 if any(p == path for _, p in self.routes) else 404, f"{method} {path}")
+            body = {}
+            if raw:
+                try: body = json.loads(raw)
+                except ValueError: raise HTTPError(400, "JSON 본문이 아님")
+                if not isinstance(body, dict): raise HTTPError(400, "JSON 객체여야 함")
+            return await fn(body, headers)
+        except HTTPError as e:
+            self.errors += 1; return e.status, _json(dict(error=str(e))), "application/json"
+        except Exception as e:
+            self.errors += 1; return 500, _json(dict(error=f"{type(e).__name__}: {e}")), "application/json"
+
+    # --- HTTP/1.1 ---
+    async def connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try: head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError): return
+                lines = head.decode("latin-1").split("\r\n")
+                try: method, path, version = lines[0].split(" ", 2)
+                except ValueError: return
+                headers = {}
+                for ln in lines[1:]:
+                    if ":" in ln:
+                        k, v = ln.split(":", 1); headers[k.strip().lower()] = v.strip()
+                try: n = int(headers.get("content-length") or 0)
+                except ValueError: n = -1
+                if n < 0 or n > BODY_MAX:
+                    # 본문 경계를 알 수 없으므로 답하고 연결을 닫는다
+                    status, msg = (400, "Content-Length 가 잘못됨") if n < 0 else (413, "본문이 너무 큼")
+                    self.requests += 1; self.errors += 1; body, ctype = _json(dict(error=msg)), "application/json"; keep = False
+                else:
+                    raw = await reader.readexactly(n) if n else b""
+                    keep = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                    if method == "OPTIONS": status, body, ctype = 204, b"", None
+                    else: status, body, ctype = await self.handle(method, path, headers, raw)
+                hdr = [f"HTTP/1.1 {status} {STATUS.get(status, '')}", f"Content-Length: {len(body)}",
+                       "Access-Control-Allow-Origin: *", "Access-Control-Allow-Headers: Content-Type, Accept",
+                       "Access-Control-Allow-Methods: GET, POST, OPTIONS", f"Connection: {'keep-alive' if keep else 'close'}"]
+                if ctype: hdr.append(f"Content-Type: {ctype}")
+                writer.write(("\r\n".join(hdr) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                if not keep: return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+async def serve(host: str = "127.0.0.1", port: int = 8765, **kw):
+    svc = Service(**kw)
+    server = await asyncio.start_server(svc.connection, host, port, backlog=1024)
+    print(f"SCR 계산 서비스: http://{host}:{port}/", file=sys.stderr, flush=True)
+    async with server: await server.serve_forever()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m scr.service", description="SCR 로컬 HTTP 계산 서비스")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("-p", "--port", type=int, default=8765)
+    ap.add_argument("--cache-items", type=int, default=4096)
+    ap.add_argument("--cache-mb", type=float, default=64)
+    ap.add_argument("--max-batch", type=int, default=4096)
+    ap.add_argument("--max-wait-ms", type=float, default=0.0, help="배치를 더 모으려고 기다리는 시간 (0 = 같은 루프 턴만)")
+    a = ap.parse_args(argv)
+    try:
+        asyncio.run(serve(a.host, a.port, cache_items=a.cache_items, cache_bytes=int(a.cache_mb*(1 << 20)),
+                          max_batch=a.max_batch, max_wait=a.max_wait_ms/1e3))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
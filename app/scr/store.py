@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 SQLite 저장소 — 프리셋과 계산 이력/결과 캐시.
+
+- results: 정규화 입력 해시(key) → 결과 JSON. V_LL, SCR, 시각에 색인이 있어 범위 조회가 빠르다
+- history: 계산할 때마다(캐시 적중 포함) 한 줄씩 추가만 한다
+- presets: 저장할 때마다 한 줄 추가, 같은 이름은 최신 행이 유효 (파일 전체 재기록 없음)
+- 모든 쓰기는 트랜잭션 하나로 묶이고 WAL 모드라 읽기와 겹쳐도 된다
+
+key 는 종류 + SI 단위로 해석된 입력 값(유효숫자 12자리)의 해시라서 "0.38kV" 와 "380" 이 같은 키가 된다.
+연결 하나를 잠금으로 공유하므로 워커 스레드에서 써도 된다. Kivy 에 의존하지 않는다.
+"""
+from __future__ import annotations
+import hashlib, json, sqlite3, threading, time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results(
+    key TEXT PRIMARY KEY, kind TEXT NOT NULL, ts REAL NOT NULL,
+    V_LL REAL, SCR REAL, inputs TEXT NOT NULL, result TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS results_kind_v ON results(kind, V_LL);
+CREATE INDEX IF NOT EXISTS results_kind_scr ON results(kind, SCR);
+CREATE INDEX IF NOT EXISTS results_ts ON results(ts);
+CREATE TABLE IF NOT EXISTS history(id INTEGER PRIMARY KEY, ts REAL NOT NULL, key TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS history_ts ON history(ts);
+CREATE TABLE IF NOT EXISTS presets(id INTEGER PRIMARY KEY, name TEXT NOT NULL, ts REAL NOT NULL, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS presets_name ON presets(name, id);
+"""
+
+def _canon(v):
+    if isinstance(v, float): return float(f"{v:.12g}")
+    if isinstance(v, dict): return {k: _canon(x) for k, x in sorted(v.items())}
+    if isinstance(v, (list, tuple)): return [_canon(x) for x in v]
+    return v
+
+def canonical_key(kind: str, inputs: dict) -> str:
+    """종류 + 정규화 입력 → 16자리 해시."""
+    s = json.dumps([kind, _canon(inputs)], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=8).hexdigest()
+
+class Store:
+    def __init__(self, path=":memory:"):
+        self.path = str(path); self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL"); self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        with self.lock: self.db.close()
+
+    def _tx(self, fn):
+        with self.lock:
+            self.db.execute("BEGIN")
+            try: out = fn(self.db)
+            except BaseException:
+                self.db.execute("ROLLBACK"); raise
+            self.db.execute("COMMIT")
+            return out
+
+    # --- 결과 캐시/이력 ---
+    def get(self, key: str) -> dict | None:
+        """캐시된 결과 (없으면 None)."""
+        with self.lock:
+            row = self.db.execute("SELECT result FROM results WHERE key=?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, kind: str, inputs: dict, result: dict, key: str | None = None) -> str:
+        """결과를 저장하고(이미 있으면 그대로) 이력에 한 줄 추가. key 반환."""
+        key = key or canonical_key(kind, inputs); ts = time.time()
+        def w(db):
+            db.execute("INSERT OR IGNORE INTO results(key, kind, ts, V_LL, SCR, inputs, result) VALUES (?,?,?,?,?,?,?)",
+                       (key, kind, ts, inputs.get("V_LL"), result.get("SCR"),
+                        json.dumps(inputs, ensure_ascii=False), json.dumps(result, ensure_ascii=False)))
+            db.execute("INSERT INTO history(ts, key) VALUES (?,?)", (ts, key))
+        self._tx(w); return key
+
+    def put_many(self, kind: str, rows) -> int:
+        """(inputs, result) 반복자를 한 트랜잭션으로 저장 (배치/가져오기용). 저장 시도 건수 반환."""
+        ts = time.time()
+        recs = [(canonical_key(kind, i), kind, ts, i.get("V_LL"), r.get("SCR"),
+                 json.dumps(i, ensure_ascii=False), json.dumps(r, ensure_ascii=False)) for i, r in rows]
+        def w(db):
+            db.executemany("INSERT OR IGNORE INTO results(key, kind, ts, V_LL, SCR, inputs, result) VALUES (?,?,?,?,?,?,?)", recs)
+            db.executemany("INSERT INTO history(ts, key) VALUES (?,?)", [(ts, r[0]) for r in recs])
+        self._tx(w); return len(recs)
+
+    def record(self, key: str):
+        """캐시 적중도 이력에 남긴다."""
+        self._tx(lambda db: db.execute("INSERT INTO history(ts, key) VALUES (?,?)", (time.time(), key)))
+
+    def query(self, kind: str | None = None, V_LL=None, scr=None, since: float | None = None,
+              until: float | None = None, limit: int = 100) -> list[dict]:
+        """
+        색인 조회. V_LL/scr 은 값 또는 (최소, 최대), since/until 은 epoch 초. 최신순.
+        각 항목: dict(key, kind, ts, inputs, result).
+        """
+        where, args = [], []
+        if kind is not None: where.append("kind=?"); args.append(kind)
+        for col, v in (("V_LL", V_LL), ("SCR", scr)):
+            if v is None: continue
+            if isinstance(v, (tuple, list)):
+                lo, hi = v
+                if lo is not None: where.append(f"{col}>=?"); args.append(lo)
+                if hi is not None: where.append(f"{col}<=?"); args.append(hi)
+            else: where.append(f"{col}=?"); args.append(v)
+        if since is not None: where.append("ts>=?"); args.append(since)
+        if until is not None: where.append("ts<=?"); args.append(until)
+        sql = "SELECT key, kind, ts, inputs, result FROM results" + (" WHERE " + " AND ".join(where) if where else "")
+        sql += " ORDER BY ts DESC LIMIT ?"; args.append(limit)
+        with self.lock: rows = self.db.execute(sql, args).fetchall()
+        return [dict(key=k, kind=kd, ts=ts, inputs=json.loads(i), result=json.loads(r)) for k, kd, ts, i, r in rows]
+
+    def history(self, limit: int = 100) -> list[tuple]:
+        """최근 계산 (ts, key, kind) — 최신순."""
+        with self.lock:
+            return self.db.execute("SELECT h.ts, h.key, r.kind FROM history h LEFT JOIN results r ON r.key=h.key "
+                                   "ORDER BY h.id DESC LIMIT ?", (limit,)).fetchall()
+
+    def __len__(self):
+        with self.lock: return self.db.execute("SELECT count(*) FROM results").fetchone()[0]
+
+    # --- 프리셋 ---
+    def presets(self) -> dict:
+        """이름 → 최신 데이터 (저장 순)."""
+        with self.lock:
+            rows = self.db.execute("SELECT name, data FROM presets p WHERE id=(SELECT max(id) FROM presets WHERE name=p.name) "
+                                   "ORDER BY id").fetchall()
+        return {n: json.loads(d) for n, d in rows}
+
+    def save_preset(self, name: str, data: dict):
+        self._tx(lambda db: db.execute("INSERT INTO presets(name, ts, data) VALUES (?,?,?)",
+                                       (name, time.time(), json.dumps(data, ensure_ascii=False))))
+
+    def reset_presets(self, base: dict):
+        """프리셋을 base 로 교체 (명시적 초기화 — 이때만 지운다)."""
+        ts = time.time()
+        def w(db):
+            db.execute("DELETE FROM presets")
+            db.executemany("INSERT INTO presets(name, ts, data) VALUES (?,?,?)",
+                           [(k, ts, json.dumps(v, ensure_ascii=False)) for k, v in base.items()])
+        self._tx(w)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+ColumnStore 위의 가상 표 — 화면에 보이는 행만 그때그때 문자열로 만든다.
+
+- 정렬은 열 하나의 argsort 인덱스(int 배열)만 들고, 값은 복사하지 않는다
+- rows(a, b) 는 [a, b) 구간만 take() 로 읽어 서식화 (memmap 이어도 그 구간만 디스크 접근)
+- preview(k) 는 현재 순서에서 균등 간격 k 행 — 10^5+ 점 스윕의 개요/진행 중 표시용
+- n 을 주면 앞쪽 n 행만 보이는 표 (스윕이 아직 채우는 중인 저장소)
+
+Kivy 에 의존하지 않고, 앱 시작 시 import 해도 numpy 를 불러오지 않는다 (정렬/미리보기 때 로드).
+"""
+from __future__ import annotations
+from typing import Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .columnar import ColumnStore
+
+# 앱 δ-스윕 표 (main.py 와 benchmarks/suite.py 가 함께 쓴다)
+SWEEP_CHUNK = 1 << 14    # 스윕 부분 결과 전달 단위
+SWEEP_PREVIEW = 200      # 미리보기(다운샘플) 행 수
+SWEEP_PAGE = 500         # 표 한 페이지 행 수 — 화면에 올리는 행은 이 이상 늘지 않는다
+
+class ColumnTable:
+    def __init__(self, store: ColumnStore, names: Sequence[str], fmts: Sequence[str], n: int | None = None):
+        self.store = store; self.names = list(names); self.fmts = list(fmts)
+        self.n = len(store) if n is None else min(int(n), len(store))
+        self.sort_key = None; self.descending = False; self._order = None
+
+    def __len__(self): return self.n
+
+    def sort(self, name: str | None, descending: bool = False):
+        """name=None 이면 저장 순서. 안정 정렬이라 같은 값은 원래 순서를 유지."""
+        self.sort_key = name; self.descending = descending
+        if name is None:
+            self._order = None
+        else:
+            import numpy as np
+            order = np.argsort(self.store.column(name, 0, self.n), kind="stable")
+            self._order = order[::-1] if descending else order
+        return self
+
+    def toggle_sort(self, name: str):
+        """같은 열을 다시 누르면 오름차순 → 내림차순 → 원래 순서."""
+        if self.sort_key != name: return self.sort(name)
+        if not self.descending: return self.sort(name, True)
+        return self.sort(None)
+
+    def index(self, start: int, stop: int) -> np.ndarray:
+        start = max(0, start); stop = min(self.n, stop)
+        if self._order is not None: return self._order[start:stop]
+        import numpy as np
+        return np.arange(start, max(start, stop))
+
+    def _format(self, idx) -> list[tuple]:
+        cols = [self.store.take(k, idx).tolist() for k in self.names]
+        return [tuple(f % v for f, v in zip(self.fmts, row)) for row in zip(*cols)]
+
+    def rows(self, start: int, stop: int) -> list[tuple]:
+        """표시 순서 [start, stop) 구간의 행 (서식화된 문자열 튜플)."""
+        return self._format(self.index(start, stop))
+
+    def preview(self, k: int) -> list[tuple]:
+        """현재 순서에서 양 끝을 포함해 균등 간격으로 뽑은 최대 k 행."""
+        if self.n <= k: return self.rows(0, self.n)
+        import numpy as np
+        pos = np.unique(np.linspace(0, self.n-1, k).round().astype(np.intp))
+        idx = self._order[pos] if self._order is not None else pos
+        return self._format(idx)
+
+    def pages(self, size: int) -> int:
+        return max(1, -(-self.n // size))
@@ -1,16 +1,75 @@
 # -*- coding: utf-8 -*-
-import re, math
+import re, math, string
+from functools import lru_cache
 
 SI = {
     'n': 1e-9, 'u': 1e-6, 'µ': 1e-6, 'm': 1e-3,
     '': 1.0, 'k': 1e3, 'K': 1e3, 'M': 1e6, 'G': 1e9
 }
 
-def _si_prefix(text: str):
-    m = re.search(r'([numkKMµG]?)(?![a-zA-Z])', text)
-    if not m: return 1.0
-    pre = m.group(1) or ''
-    return SI.get(pre, 1.0)
+_NUM = re.compile(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?')
+# 숫자 뒤에 붙는 접두사/단위 문자. 단위 판정은 이 접미사만 보면 된다
+# (숫자 부분에는 단위 문자열과 겹치는 글자가 없음).
+_UNIT_CHARS = string.ascii_letters + 'Ωωµμ%'
+_INF = float('inf')
+
+@lru_cache(maxsize=256)
+def _unit_scale(kind: str, t: str) -> float:
+    """소문자 단위 문자열 t → 배율 (kind 별)."""
+    if kind=='R':
+        # Ω, mΩ, kΩ
+        if 'mω' in t or 'mohm' in t: return 1e-3
+        if 'kω' in t or 'kohm' in t: return 1e3
+        return 1.0
+    if kind=='L':
+        # H, mH, uH
+        if 'uh' in t or 'µh' in t: return 1e-6
+        if 'mh' in t: return 1e-3
+        return 1.0  # 기본 H
+    if kind=='V':
+        return 1e3 if 'kv' in t else 1.0
+    if kind=='S':
+        if 'mva' in t: return 1e6
+        if 'kva' in t: return 1e3
+        return 1.0
+    if kind=='I':
+        return 1e3 if 'ka' in t else 1.0
+    if kind=='P':
+        if 'mw' in t: return 1e6
+        if 'kw' in t: return 1e3
+        return 1.0
+    return 1.0  # 'F', 'pct' 등
+
+@lru_cache(maxsize=8192)
+def _parse_text(text: str, kind: str):
+    """
+    (값, pu 여부) 또는 None(숫자 없음). pu 값은 기준값 환산 전 원시값.
+    '75uH', '0.38kV' 처럼 반복되는 문자열은 캐시에서 바로 반환된다.
+    """
+    # 빠른 경로: '<숫자><공백?><단위>' 한 덩어리 → rstrip 한 번으로 분리
+    num = text.rstrip(_UNIT_CHARS)
+    if num and '_' not in num and '.e' not in num and '.E' not in num:
+        try: v = float(num)
+        except ValueError: v = None
+        if v is not None and v == v and v not in (_INF, -_INF):
+            suf = text[len(num):].lower()
+            if 'pu' in suf: return v, True
+            return v*_unit_scale(kind, suf), False
+    # 일반 경로: 임의 위치의 첫 숫자 + 전체 문자열의 단위 검사
+    t = text.lower()
+    if 'pu' in t:
+        m = _NUM.search(text)
+        return (float(m.group()), True) if m else None
+    m = _NUM.search(text.replace(',', ''))
+    if not m: return None
+    return float(m.group())*_unit_scale(kind, t), False
+
+def _pu_scale(kind, Z_base, L_base):
+    if kind=='R': return Z_base
+    if kind=='L': return L_base
+    if kind=='V': return Z_base**0.5  # 잘 쓰지 않음
+    if kind=='I': return 1/Z_base**0.5
+    return None
 
 def parse_value(s: str, kind: str, *, pu=False, Z_base=1.0, L_base=1.0, default=0.0):
     """
@@ -20,59 +79,34 @@ def parse_value(s: str, kind: str, *, pu=False, Z_base=1.0, L_base=1.0, default=
     if s is None: return default
     text = str(s).strip()
     if not text: return default
-    # pu 우선 처리
-    if 'pu' in text.lower():
-        try:
-            val = float(re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', text)[0])
-        except:
-            return default
-        if not pu:  # pu 입력 허용일 때만 적용
-            return default
-        if kind=='R': return val*Z_base
-        if kind=='L': return val*L_base
-        if kind=='V': return val*(Z_base**0.5)  # 잘 쓰지 않음
-        if kind=='I': return val*(1/Z_base**0.5)
-        return default
-
-    # 숫자 추출
-    nums = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', text.replace(',', ''))
-    if not nums: return default
-    v = float(nums[0])
+    r = _parse_text(text, kind)
+    if r is None: return default
+    v, is_pu = r
+    if not is_pu: return v
+    if not pu: return default  # pu 입력 허용일 때만 적용
+    k = _pu_scale(kind, Z_base, L_base)
+    return default if k is None else v*k
 
-    # 단위 처리
-    t = text.lower()
-    if kind=='R':
-        # Ω, mΩ, kΩ
-        if 'mω' in t or 'mohm' in t: return v*1e-3
-        if 'kω' in t or 'kohm' in t: return v*1e3
-        if 'ω' in t or 'ohm' in t: return v
-        # 접미사 없는 경우
-        return v
-    if kind=='L':
-        # H, mH, uH
-        if 'uh' in t or 'µh' in t: return v*1e-6
-        if 'mh' in t: return v*1e-3
-        if 'h' in t: return v
-        return v  # 기본 H
-    if kind=='V':
-        if 'kv' in t: return v*1e3
-        return v
-    if kind=='S':
-        if 'mva' in t: return v*1e6
-        if 'kva' in t: return v*1e3
-        return v
-    if kind=='F':
-        return v
-    if kind=='I':
-        if 'ka' in t: return v*1e3
-        return v
-    if kind=='P':
-        if 'mw' in t: return v*1e6
-        if 'kw' in t: return v*1e3
-        return v
-    if kind=='pct':
-        return v
-    return v
+def parse_column(strings, kind: str, *, pu=False, Z_base=1.0, L_base=1.0):
+    """
+    문자열 열 → (float 배열, 유효 마스크). 해석 불가/허용 안 된 pu 값은 nan·False.
+    Z_base/L_base 는 스칼라 또는 행별 배열(pu 입력 시).
+    """
+    import numpy as np
+    # 고유 문자열만 한 번씩 해석한 뒤 정수 코드로 펼친다 (전역 LRU 를 밀어내지 않음)
+    codes = {}
+    idx = np.fromiter((codes.setdefault(s, len(codes)) for s in strings), np.intp, len(strings))
+    parse = _parse_text.__wrapped__
+    res = [parse(t, kind) if t else None for t in (None if s is None else str(s).strip() for s in codes)]
+    u_raw = np.array([r[0] if r else np.nan for r in res], dtype=float)
+    u_pu = np.array([r is not None and r[1] for r in res], dtype=bool)
+    raw = u_raw[idx]; is_pu = u_pu[idx]
+    valid = ~np.isnan(raw)
+    if is_pu.any():
+        k = _pu_scale(kind, np.asarray(Z_base, dtype=float), np.asarray(L_base, dtype=float)) if pu else None
+        if k is None: raw[is_pu] = np.nan; valid &= ~is_pu
+        else: raw = np.where(is_pu, raw*k, raw)
+    return raw, valid
 
 def fmt_num(x, unit='', digits=6, sci=False):
     try:
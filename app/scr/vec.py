@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+scr.core 의 배열 버전 — N개 케이스를 한 번에 계산.
+
+모든 입력은 NumPy 브로드캐스팅을 따르며, 스칼라 API가 ValueError를 던지는
+지점(δ(P) 범위 초과, |Z|=0 등)은 요소별 마스크로 돌려준다.
+"""
+from __future__ import annotations
+from typing import Mapping
+import numpy as np
+
+from .limits import DELTA_MAX
+
+SQRT3 = np.sqrt(3.0)
+
+def _arr(x) -> np.ndarray:
+    return np.asarray(x, dtype=float)
+
+def omega(f):
+    return 2*np.pi*_arr(f)
+
+def z_base(V_LL, S_n):
+    return _arr(V_LL)**2/_arr(S_n)
+
+def l_base(V_LL, S_n, f):
+    return z_base(V_LL, S_n)/omega(f)
+
+def zabs(R, L, w):
+    return np.hypot(_arr(R), _arr(w)*_arr(L))
+
+def theta_of(R, X):
+    # atan2(0,0)=0 → 스칼라 API의 `if (R or X) else 0.0`과 동일
+    return np.arctan2(_arr(X), _arr(R))
+
+def s_sc_from_z(V_LL, Z_mag):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _arr(V_LL)**2/_arr(Z_mag)
+
+def p_of_delta(V_LL, R, X, delta):
+    Zabs=np.hypot(R, X); theta=theta_of(R, X)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (_arr(V_LL)**2/Zabs)*(np.cos(theta-_arr(delta))-np.cos(theta))
+
+def p_max(V_LL, R, X):
+    """P(δ=θ) = (V²/|Z|)(1-cosθ); |Z|=0 이면 0."""
+    R=_arr(R); X=_arr(X); Zabs=np.hypot(R, X)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out=(_arr(V_LL)**2/Zabs)*(X*X/(Zabs*(Zabs+R)))   # 1-cosθ 의 상쇄 없는 형태
+    return np.where(Zabs>0, out, 0.0)
+
+def delta_from_p(V_LL, R, X, P):
+    """
+    (δ, ok) 반환. ok=False 인 요소(요청 P가 한계 초과)는 δ=nan.
+    """
+    Zabs=np.hypot(R, X); theta=theta_of(R, X)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rhs=np.cos(theta) + (_arr(P)*Zabs)/(_arr(V_LL)**2)
+    ok=(rhs>=-1) & (rhs<=1)
+    delta=np.where(ok, theta-np.arccos(np.clip(rhs, -1.0, 1.0)), np.nan)
+    return delta, ok
+
+def solve_line_rl(V_LL, S_n, f, target_scr, r_over_l, R_tr=0.0, L_tr=0.0):
+    """
+    solve_line_rl_for_target_scr 의 배열 버전: |Z_tr + (ρ + jω)·L| = V²/(SCR·S_n) 를
+    요소별로 풀어 (R_line, L_line, ok) 반환. 해가 없거나 음의 L 뿐인 요소는 ok=False·nan
+    (스칼라 API 는 첫 실패에서 ValueError). 근은 상쇄 없는 q-형식으로 계산한다.
+    """
+    w=omega(f); rho=_arr(r_over_l); Rt=_arr(R_tr); Lt=_arr(L_tr); tgt=_arr(target_scr)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        Zt=_arr(V_LL)**2/(tgt*_arr(S_n))
+        A=rho*rho+w*w; B=2.0*(Rt*rho+w*w*Lt); C=Rt*Rt+(w*Lt)**2-Zt*Zt
+        disc=B*B-4*A*C; q=-0.5*(B+np.copysign(np.sqrt(np.maximum(disc, 0.0)), B))
+        r1=q/A; r2=np.where(q!=0, C/q, r1)      # q=0 ⇔ B=C=0 → 중근 0
+        L=np.fmin(np.where(r1>=0, r1, np.inf), np.where(r2>=0, r2, np.inf))
+    ok=(disc>=0) & (tgt>0) & np.isfinite(Zt) & np.isfinite(L)
+    L=np.where(ok, L, np.nan)
+    R=rho*L
+    R, L, ok = np.broadcast_arrays(R, L, ok)
+    return R.copy(), L.copy(), ok.copy()
+
+def evaluate(cols: Mapping, P=None) -> dict:
+    """
+    열 단위 테이블(V_LL, S_n, f, R_line, L_line, R_tr, L_tr; R/L 열은 생략 시 0)
+    → Zth, S_sc, SCR, I_ratio, P_max, (P 지정 시) delta 와 요소별 마스크 ok.
+    calc_scr 의 last_result 와 같은 키 이름을 쓴다.
+    """
+    def col(*keys):
+        vals=[_arr(cols[k]) for k in keys if k in cols]
+        return sum(vals[1:], vals[0]) if vals else _arr(0.0)
+    V=col("V_LL"); Sn=col("S_n"); w=omega(col("f"))
+    R=col("R_line", "R_tr"); X=w*col("L_line", "L_tr")
+    Z2=R*R+X*X; Zabs=np.sqrt(Z2)
+    zpos=Zabs>0; allpos=bool(zpos.all())
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Ssc=V*V/Zabs; SCR=Ssc/Sn
+        ratio=np.where(Sn*V>0, SCR, np.nan)   # I_sc/I_r = S_sc/S_n (I_r>0 일 때)
+        cos_t=R/Zabs                          # cos(atan2(X,R)), 삼각함수 호출 생략
+        # 1-cosθ = X²/(|Z|²+|Z|R) — X≪R 에서 상쇄 오차 없음
+        Pmax=Ssc*(X*X)/(Z2+Zabs*R)
+    if not allpos:
+        cos_t=np.where(zpos, cos_t, 1.0); Pmax=np.where(zpos, Pmax, 0.0)
+    ok=zpos & (Sn>0) & (V>0) & np.isfinite(SCR)
+    out=dict(Zth=Zabs, S_sc=Ssc, SCR=SCR, I_ratio=ratio, P_max=Pmax)
+    if P is None and "P" in cols: P=cols["P"]
+    if P is not None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rhs=cos_t + _arr(P)/Ssc
+        dok=(rhs>=-1) & (rhs<=1)
+        delta=np.arctan2(X, R)-np.arccos(np.clip(rhs, -1.0, 1.0))
+        if not dok.all(): delta[~dok]=np.nan
+        out["delta"]=delta; out["delta_ok"]=dok; ok=ok & dok
+    out["ok"]=np.broadcast_to(ok, np.broadcast(ok, V, Sn, Zabs).shape).copy()
+    return out
+
+def current_drop_limit(Vph, Zabs, target_I):
+    """
+    I_max 한계 δ = 2·asin(I·|Z|/(2·Vph)) 배열 버전. (δ, ok) 반환;
+    I≤0, nan, δ>89.9° 인 요소는 ok=False·δ=nan (스칼라 API의 None).
+    """
+    I=_arr(target_I)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s=I*_arr(Zabs)/(2*_arr(Vph))
+        d=2*np.arcsin(np.clip(s, 0.0, 1.0))
+    ok=(I>0) & (s>=0) & (s<=1) & (d<=DELTA_MAX)
+    return np.where(ok, d, np.nan), ok
+
+def voltage_drop_limit(Vph, target_pct):
+    """ΔV% 한계 δ 배열 버전. (δ, ok) 반환; pct≤0/nan 은 ok=False."""
+    pct=_arr(target_pct)*np.ones_like(_arr(Vph))
+    s=pct/200.0
+    with np.errstate(invalid="ignore"):
+        d=np.where(s>=1, np.radians(180-1e-3), 2*np.arcsin(np.clip(s, 0.0, 1.0)))
+    ok=pct>0
+    return np.where(ok, d, np.nan), ok
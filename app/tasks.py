@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+UI 용 백그라운드 작업 스케줄러.
+
+- 채널(예: "scr", "vis", "sweep")마다 세대 번호를 두어, 같은 채널에 새 요청이 오면
+  이전 요청은 '대체됨'으로 처리한다. 아직 시작 전이면 실행하지 않고, 실행 중이면
+  task.check() 에서 Cancelled 로 빠져나오며, 이미 끝났어도 결과를 버린다.
+- delay>0 이면 Clock 으로 디바운스 — 연속 입력 중 마지막 것만 실행된다.
+- 계산은 스레드 풀에서 (NumPy/Agg 렌더링은 GIL 을 놓으므로 스레드로 충분),
+  결과·부분 결과 콜백은 Clock.schedule_once 로 UI 스레드에서 호출된다.
+  부분 결과는 프레임당 최신 것 하나로 합쳐 전달한다.
+- 작업마다 제출/대기/시작/종료 시각(t_submit, t_queued, t_start, t_end)을 남긴다 — 계측은 호출 쪽
+  (main._submit 의 LogBook 이벤트)에서 한다. 대체/취소로 버려진 작업은 on_drop(status) 로 알린다.
+"""
+from __future__ import annotations
+import threading, time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+
+class Cancelled(Exception):
+    """대체/취소된 작업이 스스로 중단할 때 쓰는 예외."""
+
+class Task:
+    def __init__(self, sched, channel, fn, args, gen, on_done, on_error, on_partial, on_drop):
+        self.sched=sched; self.channel=channel; self.fn=fn; self.args=args; self.gen=gen
+        self.name=getattr(fn, "__name__", "task")
+        self.on_done=on_done; self.on_error=on_error; self.on_partial=on_partial; self.on_drop=on_drop
+        self.t_submit=time.perf_counter(); self.t_queued=self.t_start=self.t_end=None
+        self.status="pending"; self._partial=None; self._partial_posted=False
+
+    @property
+    def cancelled(self) -> bool:
+        return self.sched._gen[self.channel]!=self.gen
+
+    def check(self):
+        """작업 함수 안에서 주기적으로 호출 — 대체되었으면 Cancelled."""
+        if self.cancelled: raise Cancelled()
+
+    def partial(self, payload):
+        """부분 결과를 UI 로 보냄 (프레임당 최신 하나로 합쳐짐)."""
+        self.sched._post_partial(self, payload)
+
+class TaskScheduler:
+    def __init__(self, workers: int = 2):
+        self.workers=workers; self._ex=None
+        self._gen=defaultdict(int); self._timers={}; self._lock=threading.Lock()
+
+    def _pool(self):
+        if self._ex is None:
+            self._ex=ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="scr-task")
+        return self._ex
+
+    # --- 제출/취소 ---
+    def submit(self, channel: str, fn, *args, on_done=None, on_error=None, on_partial=None, on_drop=None,
+               delay: float = 0.0) -> Task:
+        """
+        fn(task, *args) 를 워커에서 실행. 같은 채널의 이전 작업은 대체된다.
+        on_done(result) / on_error(exc) / on_partial(payload) / on_drop("superseded"|"cancelled") 는 UI 스레드에서 호출.
+        """
+        with self._lock:
+            self._gen[channel]+=1; gen=self._gen[channel]
+        task=Task(self, channel, fn, args, gen, on_done, on_error, on_partial, on_drop)
+        ev=self._timers.pop(channel, None)
+        if ev is not None: ev.cancel()
+        if delay>0: self._timers[channel]=Clock.schedule_once(lambda dt: self._dispatch(task, True), delay)
+        else: self._dispatch(task)
+        return task
+
+    def cancel(self, channel: str):
+        with self._lock: self._gen[channel]+=1
+        ev=self._timers.pop(channel, None)
+        if ev is not None: ev.cancel()
+
+    def shutdown(self):
+        for ch in list(self._gen): self.cancel(ch)
+        if self._ex is not None: self._ex.shutdown(wait=False, cancel_futures=True); self._ex=None
+
+    # --- 실행 ---
+    def _dispatch(self, task, timed=False):
+        if timed: self._timers.pop(task.channel, None)
+        if task.cancelled: self._drop(task, "superseded"); return
+        task.t_queued=time.perf_counter()
+        self._pool().submit(self._run, task)
+
+    def _run(self, task):
+        task.t_start=time.perf_counter()
+        res=err=None; status="ok"
+        if task.cancelled: status="superseded"
+        else:
+            try: res=task.fn(task, *task.args)
+            except Cancelled: status="cancelled"
+            except Exception as e: err=e; status="error"
+        task.t_end=time.perf_counter()
+        if status in ("ok", "error"): Clock.schedule_once(lambda dt: self._deliver(task, res, err, status))
+        else: self._drop(task, status)
+
+    def _deliver(self, task, res, err, status):
+        if task.cancelled: self._drop(task, "superseded"); return
+        task.status=status
+        if status=="ok":
+            if task.on_done: task.on_done(res)
+        elif task.on_error: task.on_error(err)
+        else: raise err
+
+    def _post_partial(self, task, payload):
+        with self._lock:
+            task._partial=payload
+            if task._partial_posted: return
+            task._partial_posted=True
+        Clock.schedule_once(lambda dt: self._flush_partial(task))
+
+    def _flush_partial(self, task):
+        with self._lock:
+            payload=task._partial; task._partial_posted=False
+        if not task.cancelled and task.on_partial: task.on_partial(payload)
+
+    def _drop(self, task, status):
+        task.status=status
+        if task.on_drop: Clock.schedule_once(lambda dt: task.on_drop(status))
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+선로 RL 역산 비용: 스칼라 루프 vs vec.solve_line_rl vs LineDesignTable 보간.
+
+    python benchmarks/bench_design.py            # 10^5 질의
+    python benchmarks/bench_design.py -n 1000000
+
+보간 결과는 정확해 대비 최대 상대 오차와 표가 보고한 오차 추정치를 함께 출력한다.
+"""
+import argparse, sys, time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT/"app"))
+
+def _timed(fn, *args):
+    t = time.perf_counter(); out = fn(*args); return time.perf_counter()-t, out
+
+def main():
+    ap = argparse.ArgumentParser(); ap.add_argument("-n", type=int, default=100000)
+    ap.add_argument("--scalar", type=int, default=20000, help="스칼라 루프는 앞쪽 N개만 잰다")
+    a = ap.parse_args()
+    import numpy as np
+    from scr import vec
+    from scr.core import System, RL, solve_line_rl_for_target_scr
+    from scr.design import LineDesignTable
+    V, Sn, tr = 380.0, 250e3, RL(0.01, 5e-5)
+    rng = np.random.default_rng(0)
+    scr = rng.uniform(1, 20, a.n); rx = rng.uniform(0, 2, a.n); f = rng.choice([50.0, 60.0], a.n)
+    rho = rx*vec.omega(f)
+
+    def scalar(m):
+        for i in range(m):
+            try: solve_line_rl_for_target_scr(System(V, Sn, f[i]), scr[i], rho[i], tr)
+            except ValueError: pass
+    m = min(a.scalar, a.n)
+    dt, _ = _timed(scalar, m); print(f"스칼라 루프        {dt/m*1e6:9.3f} µs/질의")
+    dt, (_, Le, oke) = _timed(vec.solve_line_rl, V, Sn, f, scr, rho, tr.R, tr.L); print(f"vec.solve_line_rl  {dt/a.n*1e6:9.3f} µs/질의")
+    dt, tbl = _timed(LineDesignTable.build, V, Sn, tr); print(f"표 생성            {dt*1e3:9.1f} ms (상대 오차 상한 {tbl.max_err:.2e})")
+    dt, (_, Lq, okq, err) = _timed(tbl.query, scr, rx, f); print(f"표 보간            {dt/a.n*1e6:9.3f} µs/질의")
+    rel = np.abs(Lq[okq]-Le[okq])/Le[okq]
+    print(f"실현 가능 판정 일치 {bool((okq == oke).all())}, 최대 상대 오차 {rel.max():.2e} (상한 {err[okq].max():.2e})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+다모선 SCR: 희소 분해 + 선택 역행렬 vs 밀집 역행렬(np.linalg.inv).
+
+    python benchmarks/bench_network.py                    # 500, 2000, 10000 모선
+    python benchmarks/bench_network.py --sizes 1000 5000 --dense-max 5000
+
+밀집 역행렬은 O(n³)/O(n²) 메모리라 --dense-max 이하 크기에서만 잰다.
+가지 하나 변경(저계수 갱신) 후 전 모선 Z 재계산 시간도 함께 출력한다.
+"""
+import argparse, sys, time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT/"app"))
+
+def _timed(fn, *args):
+    t = time.perf_counter(); out = fn(*args); return time.perf_counter()-t, out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 10000])
+    ap.add_argument("--dense-max", type=int, default=4000)
+    a = ap.parse_args()
+    import numpy as np
+    from scr.core import System
+    from scr.network import ladder
+    sys_ = System(22900.0, 1e6, 60.0)
+    print(f"{'모선':>7s} {'분해+대각':>10s} {'갱신1회':>9s} {'밀집 inv':>10s} {'상대오차':>9s}")
+    for n in a.sizes:
+        net = ladder(sys_, n, feeders=max(1, n//500), ties=n//50)
+        dt, zd = _timed(lambda: net.factorize().z_diag())
+        du, _ = _timed(lambda: net.set_branch(n//2, R=0.02).z_diag())
+        if n <= a.dense_max:
+            net.set_branch(n//2, R=0.01).factorize()
+            dd, Z = _timed(lambda: np.linalg.inv(net.admittance().toarray()))
+            ref = np.diagonal(Z); err = np.abs(net.z_diag()-ref).max()/np.abs(ref).max()
+            dense = f"{dd*1e3:8.1f}ms {err:9.1e}"
+        else:
+            dense = f"{'—':>10s} {'—':>9s}"
+        print(f"{n:7d} {dt*1e3:8.1f}ms {du*1e3:7.2f}ms {dense}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+parse_value / parse_column 값당 비용 마이크로벤치.
+
+    python benchmarks/bench_parse.py               # 현재 트리
+    python benchmarks/bench_parse.py --ref HEAD~1  # git 리비전의 utils.py 와 비교
+"""
+import argparse, random, subprocess, sys, time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT/"app"))
+
+SAMPLES = [("75uH","L"), ("0.2 mH","L"), ("50mΩ","R"), ("0.38kV","V"), ("250kVA","S"),
+           ("0.75 MVA","S"), ("2.5 kW","P"), ("380","V"), ("60","F"), ("7.5e-05","L")]
+
+def workload(n, unique, seed=0):
+    rnd = random.Random(seed); out = []
+    for i in range(n):
+        s, k = SAMPLES[i % len(SAMPLES)]
+        if unique: s = s.replace(s.rstrip("µumkKMVAWHhΩΩ %"), f"{rnd.uniform(0, 1000):.6g}", 1)
+        out.append((s, k))
+    return out
+
+def per_value(fn, data, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        for s, k in data: fn(s, k)
+        best = min(best, time.perf_counter()-t)
+    return best/len(data)*1e9
+
+def load_ref(rev):
+    src = subprocess.run(["git", "show", f"{rev}:app/scr/utils.py"], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    ns = {"__name__": "utils_ref"}; exec(src, ns); return ns["parse_value"]
+
+def main():
+    ap = argparse.ArgumentParser(); ap.add_argument("--ref"); ap.add_argument("-n", type=int, default=100000)
+    a = ap.parse_args()
+    from scr.utils import parse_value, parse_column
+    impls = [("current", parse_value)] + ([(f"ref {a.ref}", load_ref(a.ref))] if a.ref else [])
+    for label, unique in (("반복 문자열", False), ("고유 문자열", True)):
+        data = workload(a.n, unique)
+        for name, fn in impls:
+            print(f"{label:8s} {name:14s} {per_value(fn, data):8.0f} ns/값")
+    for label, unique in (("반복 문자열", False), ("고유 문자열", True)):
+        col = [s for s, _ in workload(a.n, unique)]
+        parse_column(col[:10], "L")   # numpy 지연 임포트 제외
+        dt = min(_timed(parse_column, col, "L") for _ in range(5))
+        print(f"{label:8s} parse_column   {dt/a.n*1e9:8.0f} ns/값")
+
+def _timed(fn, *args):
+    t = time.perf_counter(); fn(*args); return time.perf_counter()-t
+
+if __name__ == "__main__":
+    main()
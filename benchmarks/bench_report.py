@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+보고서 일괄 생성 처리량: 무작위 케이스 N 개 → 케이스별 HTML + assets/ + 색인.
+
+    python benchmarks/bench_report.py                 # 1000 케이스, 코어 수만큼 워커
+    python benchmarks/bench_report.py -n 200 -w 1
+
+이전 방식(그림 base64 인라인, 케이스마다 bbox tight 렌더)의 케이스당 시간과 크기도 앞쪽 몇 개로 잰다.
+"""
+import argparse, base64, os, sys, tempfile, time, warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT/"app"))
+
+def _size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+def main():
+    ap = argparse.ArgumentParser(); ap.add_argument("-n", type=int, default=1000)
+    ap.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--inline", type=int, default=10, help="인라인 방식은 앞쪽 N개만 잰다")
+    a = ap.parse_args()
+    warnings.filterwarnings("ignore")
+    import numpy as np
+    from scr import report, vec
+    rng = np.random.default_rng(0)
+    V = rng.choice([380.0, 400.0, 480.0], a.n); f = rng.choice([50.0, 60.0], a.n)
+    cols = dict(V_LL=V, S_n=np.full(a.n, 250e3), f=f, R_line=rng.uniform(0, 0.01, a.n), L_line=rng.uniform(30e-6, 120e-6, a.n),
+                R_tr=np.zeros(a.n), L_tr=np.zeros(a.n))
+    res = vec.evaluate(cols); P = rng.uniform(50e3, 200e3, a.n)
+    cases = [dict({k: float(v[i]) for k, v in cols.items()}, **{k: float(res[k][i]) for k in ("Zth", "S_sc", "SCR", "I_ratio")},
+                  id=f"c{i}", P=float(P[i])) for i in range(a.n)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)/"inline"; out.mkdir()
+        plots = report._plots(report.operating_point(cases[0], cases[0]["P"])[0]); m = min(a.inline, a.n)
+        t = time.perf_counter()
+        for i, r in enumerate(cases[:m]):
+            op, info = report.operating_point(r, r["P"]); plots.update(op)
+            imgs = {k: "data:image/png;base64," + base64.b64encode(plots.png(k)).decode("ascii") for k in plots.figures}
+            report.write_case(out/f"case_{i}.html", r, imgs, info)
+        dt = time.perf_counter()-t
+        print(f"인라인 base64      {dt/m*1e3:8.1f} ms/케이스, {_size(out)/m/1024:7.1f} KiB/케이스")
+
+        out = Path(tmp)/"bulk"
+        n, dt = report.run(cases, out, workers=a.workers)
+        print(f"일괄 (워커 {a.workers})     {dt/n*1e3:8.1f} ms/케이스, {_size(out)/n/1024:7.1f} KiB/케이스 → {n} 케이스 {dt:.1f}s")
+        n, dt = report.run(cases, out, workers=a.workers)
+        print(f"재실행 (그림 재사용) {dt/n*1e3:8.1f} ms/케이스")
+
+if __name__ == "__main__":
+    main()
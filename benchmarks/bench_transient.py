@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+시간 영역 모의 처리량: 시나리오 수별 (시나리오·적분 단계)/s.
+
+    python benchmarks/bench_transient.py                         # 2 s, h=1 µs, decim 100
+    python benchmarks/bench_transient.py --scenarios 1 10 100 1000 --decim 10
+
+scr.transient 는 출력 표본만 계산하므로 처리량은 decim 에 거의 비례한다 — 출력 표본/s 도 함께 출력.
+"""
+import argparse, sys, time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT/"app"))
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--scenarios", type=int, nargs="+", default=[1, 10, 100, 1000])
+    ap.add_argument("--t-end", type=float, default=2.0)
+    ap.add_argument("--h", type=float, default=1e-6)
+    ap.add_argument("--decim", type=int, default=100)
+    a = ap.parse_args()
+    import numpy as np
+    from scr.core import System
+    from scr.transient import simulate, Event
+    sys_ = System(380.0, 250e3, 60.0)
+    ev = [Event(a.t_end*0.25, delta_deg=20.0), Event(a.t_end*0.5, L=100e-6), Event(a.t_end*0.75, P=80e3)]
+    steps = int(round(a.t_end/a.h))
+    print(f"{'시나리오':>8s} {'시간':>9s} {'단계/s':>12s} {'출력 표본/s':>12s}")
+    for S in a.scenarios:
+        t = time.perf_counter()
+        r = simulate(sys_, np.full(S, 0.01), np.linspace(50e-6, 200e-6, S), 10.0, a.t_end, h=a.h, events=ev, decim=a.decim)
+        dt = time.perf_counter()-t
+        print(f"{S:8d} {dt*1e3:7.1f}ms {S*steps/dt:12.3e} {S*len(r.t)/dt:12.3e}")
+
+if __name__ == "__main__":
+    main()
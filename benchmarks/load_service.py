@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+계산 서비스 부하 시험: keep-alive 연결 C 개로 D 초 동안 요청 → p50/p99 지연과 초당 요청 수.
+
+    python benchmarks/load_service.py                      # 서비스를 하위 프로세스로 띄워서 잰다
+    python benchmarks/load_service.py -c 64 -d 10 --unique 1.0
+    python benchmarks/load_service.py --url http://127.0.0.1:8765 --mix scr=1
+
+--unique 는 매번 새 입력을 만드는 요청 비율(나머지는 작은 입력 집합을 재사용 → 캐시 적중).
+--mix 는 끝점 비율, 예: scr=8,line=1,sweep=1 (sweep 은 이진 열 형식으로 받는다).
+"""
+import argparse, asyncio, json, os, random, subprocess, sys, time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parents[1]
+
+def _body(ep: str, rnd: random.Random, unique: bool) -> dict:
+    k = rnd.random() if unique else rnd.randrange(16)/16
+    d = dict(V_LL=380 if k < .5 else 400, S_n="250kVA", f=60, R_line=f"{k*10:.9g}mΩ", L_line=f"{30+90*k:.9g}uH")
+    if ep == "line": d = dict(V_LL=d["V_LL"], S_n="250kVA", f=60, target_scr=2+8*k, r_over_l=0.1)
+    if ep == "sweep": d.update(step=0.5, dtype="f4")
+    return d
+
+async def _client(host, port, mix, a, rnd, lat, stop, errors):
+    r, w = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < stop:
+            ep = rnd.choices(list(mix), list(mix.values()))[0]
+            body = json.dumps(_body(ep, rnd, rnd.random() < a.unique)).encode()
+            acc = "Accept: application/x-scr-columns\r\n" if ep == "sweep" else ""
+            t = time.perf_counter()
+            w.write(f"POST /{ep} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n{acc}"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+            head = await r.readuntil(b"\r\n\r\n")
+            n = next(int(l.split(b":", 1)[1]) for l in head.split(b"\r\n") if l.lower().startswith(b"content-length:"))
+            await r.readexactly(n)
+            lat.append(time.perf_counter()-t)
+            if not head.startswith(b"HTTP/1.1 200"): errors[ep] = errors.get(ep, 0)+1
+    finally:
+        w.close()
+
+async def _run(host, port, mix, a):
+    lat, errors = [], {}
+    await asyncio.sleep(0); stop = time.perf_counter()+a.duration; t = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, mix, a, random.Random(i), lat, stop, errors) for i in range(a.concurrency)))
+    return lat, errors, time.perf_counter()-t
+
+def _wait(host, port, timeout=10.0):
+    async def probe():
+        r, w = await asyncio.open_connection(host, port); w.close()
+    t = time.time()
+    while True:
+        try: return asyncio.run(probe())
+        except OSError:
+            if time.time()-t > timeout: raise
+            time.sleep(0.1)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--url", help="이미 떠 있는 서비스 (없으면 하위 프로세스로 띄움)")
+    ap.add_argument("-c", "--concurrency", type=int, default=32)
+    ap.add_argument("-d", "--duration", type=float, default=5.0)
+    ap.add_argument("--unique", type=float, default=0.5, help="캐시를 피하는 새 입력 비율 0..1")
+    ap.add_argument("--mix", default="scr=8,line=1,sweep=1")
+    ap.add_argument("--port", type=int, default=8766)
+    a = ap.parse_args()
+    mix = {k: float(v) for k, v in (p.split("=") for p in a.mix.split(","))}
+    proc = None
+    if a.url: u = urlsplit(a.url); host, port = u.hostname, u.port or 80
+    else:
+        host, port = "127.0.0.1", a.port
+        proc = subprocess.Popen([sys.executable, "-m", "scr.service", "--host", host, "--port", str(port)], cwd=ROOT/"app",
+                                env=dict(os.environ, PYTHONPATH=str(ROOT/"app")), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait(host, port)
+        lat, errors, dt = asyncio.run(_run(host, port, mix, a))
+    finally:
+        if proc: proc.terminate(); proc.wait()
+    lat.sort(); n = len(lat)
+    if not n: sys.exit("응답 없음")
+    q = lambda p: lat[min(n-1, int(p*n))]*1e3
+    print(f"연결 {a.concurrency}, {a.duration:g}s, unique {a.unique:g}, mix {a.mix}")
+    print(f"요청 {n:,}  →  {n/dt:,.0f} req/s   p50 {q(.5):.2f} ms   p99 {q(.99):.2f} ms   최대 {lat[-1]*1e3:.1f} ms")
+    if errors: print("오류:", errors)
+
+if __name__ == "__main__":
+    main()
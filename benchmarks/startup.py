@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+콜드 스타트 측정 (헤드리스 Linux, SDL offscreen).
+
+    python benchmarks/startup.py                 # 5회 측정, 중앙값 출력
+    python benchmarks/startup.py --budget-ms 1500 --json startup.json
+
+매 회 새 프로세스에서 `import main` → SCRProV2() → build() 반환까지를 잰다.
+-X importtime 으로 모듈별 누적 임포트 시간 상위 항목도 함께 보여 준다.
+--budget-ms 를 넘으면 종료 코드 1 (CI 회귀 감시용).
+"""
+import argparse, json, os, statistics, subprocess, sys, tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+APP = ROOT/"app"
+
+CHILD = r"""
+import time; t0=time.perf_counter()
+import os, sys, json
+sys.path.insert(0, os.getcwd())
+import main
+t1=time.perf_counter()
+app=main.SCRProV2()
+t2=time.perf_counter()
+root=app.build()
+t3=time.perf_counter()
+mods=sorted(m for m in ("numpy","matplotlib","kivy_garden.matplotlib") if m in sys.modules)
+sys.__stdout__.write(json.dumps(dict(import_ms=(t1-t0)*1e3, init_ms=(t2-t1)*1e3, build_ms=(t3-t2)*1e3,
+                                    total_ms=(t3-t0)*1e3, heavy_loaded=mods))+"\n")
+sys.__stdout__.flush()
+os._exit(0)
+"""
+
+def headless_env():
+    env = dict(os.environ)
+    env.update(KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1", SDL_VIDEODRIVER="offscreen")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)   # 값이 무엇이든 설정돼 있으면 .pyc 를 안 쓴다 — 예열 실행이 캐시를 남기게
+    env.setdefault("KIVY_HOME", str(Path(tempfile.gettempdir())/"scr_kivy_home"))
+    Path(env["KIVY_HOME"]).mkdir(parents=True, exist_ok=True)
+    return env
+
+def run_once(env) -> dict:
+    out = subprocess.run([sys.executable, "-c", CHILD], cwd=APP, env=env, capture_output=True, text=True, timeout=300)
+    for line in out.stdout.splitlines()[::-1]:
+        if line.startswith("{"): return json.loads(line)
+    raise RuntimeError(f"측정 실패:\n{out.stderr[-2000:]}")
+
+def import_breakdown(env, top: int) -> list:
+    """-X importtime 의 누적(cumulative) 상위 모듈 [(ms, 모듈)]."""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=APP, env=env,
+                         capture_output=True, text=True, timeout=300)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line: continue
+        try:
+            _, cum, name = line.split(":", 1)[1].split("|")
+            rows.append((int(cum)/1e3, name.strip()))
+        except ValueError:
+            continue
+    return sorted(rows, reverse=True)[:top]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", "--runs", type=int, default=5)
+    ap.add_argument("--top", type=int, default=15)
+    ap.add_argument("--budget-ms", type=float, help="build() 반환까지 허용 시간(중앙값)")
+    ap.add_argument("--json", help="결과 JSON 저장 경로")
+    a = ap.parse_args()
+    env = headless_env()
+    run_once(env)   # .pyc/폰트 캐시 예열
+    runs = [run_once(env) for _ in range(a.runs)]
+    med = {k: statistics.median(r[k] for r in runs) for k in ("import_ms", "init_ms", "build_ms", "total_ms")}
+    print("콜드 스타트 (중앙값, %d회)" % a.runs)
+    for k, v in med.items(): print(f"  {k:10s} {v:8.1f} ms")
+    print("  시작 시 로드된 무거운 모듈:", ", ".join(runs[-1]["heavy_loaded"]) or "없음")
+    top = import_breakdown(env, a.top)
+    print("임포트 누적 시간 상위:")
+    for ms, name in top: print(f"  {ms:8.1f} ms  {name}")
+    if a.json:
+        Path(a.json).write_text(json.dumps(dict(median=med, runs=runs, imports=top), ensure_ascii=False, indent=2), encoding="utf-8")
+    if a.budget_ms and med["total_ms"] > a.budget_ms:
+        print(f"예산 초과: {med['total_ms']:.1f} ms > {a.budget_ms:.1f} ms", file=sys.stderr); sys.exit(1)
+
+if __name__ == "__main__":
+    main()
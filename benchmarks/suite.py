@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+헤드리스 벤치마크 묶음 — scr.core/scr.utils 와 앱 계산 경로(시각화·δ-스윕)를 입력 크기별로 재고,
+기준선(JSON)을 저장/비교해 회귀를 표시한다. Kivy/디스플레이가 필요 없다.
+
+    python benchmarks/suite.py                          # 전체 실행, 크기별 표 + 스케일링 기울기
+    python benchmarks/suite.py -k parse,sweep --quick   # 이름에 포함된 것만, 반복 줄임
+    python benchmarks/suite.py --save                   # benchmarks/baselines/baseline.json 에 기준선 저장
+    python benchmarks/suite.py --compare --threshold 10 --report cmp.md
+                                                        # 기준선 대비 10% 넘게 느려지면 회귀 (종료 코드 1)
+
+- 각 (항목, 크기)는 한 번 예열 후 호출 1회가 min_time 이상이 되도록 묶어 repeat 번 재고 최솟값/중앙값을 쓴다
+- 스케일링 기울기는 log(시간)–log(크기) 최소제곱 기울기 (1 ≈ 선형, 0 ≈ 고정 비용)
+- 기준선은 기계마다 다르므로 같은 기계/같은 환경에서 만든 파일과 비교한다 (meta 에 환경을 기록)
+- matplotlib 이 없으면 그림 항목은 건너뛴다
+"""
+import argparse, datetime, json, math, os, platform, statistics, subprocess, sys, time, warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT/"app"))
+BASELINE = ROOT/"benchmarks"/"baselines"/"baseline.json"
+
+from scr.table import SWEEP_CHUNK, SWEEP_PREVIEW, SWEEP_PAGE   # 앱과 같은 값 (kivy/numpy 를 불러오지 않음)
+
+BENCHES = {}
+
+def bench(name: str, sizes, unit: str = "건"):
+    """setup(n) → 인자 없는 호출 가능 객체. n 은 입력 크기 (unit 단위)."""
+    def deco(setup):
+        BENCHES[name] = (tuple(sizes), unit, setup); return setup
+    return deco
+
+class Skip(Exception):
+    pass
+
+# --- 입력 생성 ---
+UNIT_SAMPLES = [("{}uH", "L"), ("{} mH", "L"), ("{}mΩ", "R"), ("{}kV", "V"), ("{}kVA", "S"),
+                ("{} MVA", "S"), ("{} kW", "P"), ("{}", "V"), ("{}", "F"), ("{}e-05", "L")]
+
+def _strings(n, seed=0):
+    import random
+    rnd = random.Random(seed)
+    return [(fmt.format(f"{rnd.uniform(0, 1000):.6g}"), k) for fmt, k in (UNIT_SAMPLES[i % len(UNIT_SAMPLES)] for i in range(n))]
+
+def _grid(n, seed=0):
+    """계통 n 개: (V_LL, R, X, S_n, f) 배열."""
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    V = rng.choice([380.0, 400.0, 480.0], n); f = rng.choice([50.0, 60.0], n)
+    R = rng.uniform(0.0, 0.02, n); X = 2*np.pi*f*rng.uniform(30e-6, 150e-6, n)
+    return V, R, X, np.full(n, 250e3), f
+
+def _op(ppc=400, delta=0.1, L=75e-6):
+    from scr import report
+    r = dict(V_LL=380.0, S_n=250e3, f=60.0, R_line=0.005, L_line=L, R_tr=0.0, L_tr=0.0)
+    op, info = report.operating_point(r, "", math.degrees(delta), "500", "5")
+    if ppc != 400:   # 파형 점 수만 바꿈 (전류 위상은 벤치마크에 무관)
+        from scr.core import System, waveforms
+        op["t"], op["v_pcc"], op["v_inv"], op["i_t"] = waveforms(System(380.0, 250e3, 60.0), info["Irms"], delta, 0.0, cycles=2, ppc=ppc)
+    return op
+
+# --- 항목 ---
+@bench("parse_value", (100, 1000, 10000), "값")
+def _(n):
+    from scr.utils import parse_value, _parse_text
+    data = _strings(n)
+    def run():
+        _parse_text.cache_clear()   # 고유 문자열 기준 (캐시 적중만 재지 않도록)
+        for s, k in data: parse_value(s, k)
+    return run
+
+@bench("parse_column", (1000, 10000, 100000), "값")
+def _(n):
+    from scr.utils import parse_column, _parse_text
+    col = [s for s, _ in _strings(n)]
+    def run():
+        _parse_text.cache_clear(); parse_column(col, "L")
+    return run
+
+@bench("p_of_delta", (100, 1000, 10000))
+def _(n):
+    from scr.core import p_of_delta
+    V, R, X, _, _ = (a.tolist() for a in _grid(n)); d = [0.01*(i % 90) for i in range(n)]
+    return lambda: [p_of_delta(V[i], R[i], X[i], d[i]) for i in range(n)]
+
+@bench("delta_from_p", (100, 1000, 10000))
+def _(n):
+    from scr.core import delta_from_p, p_of_delta
+    V, R, X, _, _ = (a.tolist() for a in _grid(n))
+    P = [p_of_delta(V[i], R[i], X[i], 0.01*(i % 90)) for i in range(n)]
+    return lambda: [delta_from_p(V[i], R[i], X[i], P[i]) for i in range(n)]
+
+@bench("vec.p_delta", (1000, 100000, 1000000))
+def _(n):
+    from scr import vec
+    V, R, X, _, _ = _grid(n); P = vec.p_of_delta(V, R, X, 0.2)
+    return lambda: vec.delta_from_p(V, R, X, P)
+
+@bench("solve_line_rl_for_target_scr", (100, 1000, 10000))
+def _(n):
+    from scr.core import System, RL, solve_line_rl_for_target_scr
+    sys_ = [System(380.0, 250e3, 50.0 + 10*(i % 2)) for i in range(n)]; tr = RL(0.002, 20e-6)
+    scr = [1.5 + (i % 180)/10 for i in range(n)]
+    return lambda: [solve_line_rl_for_target_scr(sys_[i], scr[i], 10.0, tr) for i in range(n)]
+
+@bench("vec.solve_line_rl", (1000, 100000, 1000000))
+def _(n):
+    import numpy as np
+    from scr import vec
+    V, _, _, Sn, f = _grid(n); scr = np.linspace(1.5, 20, n)
+    return lambda: vec.solve_line_rl(V, Sn, f, scr, 10.0, 0.002, 20e-6)
+
+@bench("current_drop_limit", (100, 1000, 10000))
+def _(n):
+    from scr.core import current_drop_limit
+    Z = [0.01 + 0.0001*(i % 400) for i in range(n)]; I = [100.0 + (i % 900) for i in range(n)]
+    return lambda: [current_drop_limit(219.4, Z[i], I[i]) for i in range(n)]
+
+@bench("waveforms", (100, 1000, 10000), "점/주기")
+def _(n):
+    from scr.core import System, waveforms
+    sys_ = System(380.0, 250e3, 60.0)
+    return lambda: waveforms(sys_, 300.0, 0.2, 0.1, cycles=2, ppc=n)
+
+@bench("run_sweep", (1000, 100000, 1000000), "점")
+def _(n):
+    # 앱 _sweep_job + _show_sweep: 청크 단위 스윕(부분 결과 콜백) → 가상 표 미리보기/첫 페이지
+    from scr.core import System, sweep_delta
+    from scr.table import ColumnTable
+    sys_ = System(380.0, 250e3, 60.0); X = sys_.omega*75e-6; step = 90.0/(n-1)
+    def run():
+        seen = []
+        st = sweep_delta(sys_, 0.005, X, 90.0, step, chunk=SWEEP_CHUNK, progress=lambda st, done: seen.append(done))
+        tbl = ColumnTable(st, ["delta_deg", "P_MW", "I_A", "dV_pct"], ["%.2f", "%.6f", "%.3f", "%.3f"])
+        tbl.preview(SWEEP_PREVIEW); tbl.rows(0, SWEEP_PAGE)
+    return run
+
+def _plot_set():
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        from scr.figures import PlotSet, configure_fonts
+    except ImportError as e:
+        raise Skip(f"matplotlib 없음 ({e})")
+    warnings.filterwarnings("ignore", category=UserWarning)
+    configure_fonts(); return PlotSet()
+
+@bench("visualize.blit", (100, 400, 1600), "점/주기")
+def _(n):
+    # 운전점만 바뀜 (축 범위 그대로) — 앱 _vis_job 의 흔한 경로: update + render(블리팅) + snapshot
+    plots = _plot_set(); ops = [_op(n, 0.05 + 0.001*i) for i in range(16)]; k = [0]
+    def run():
+        k[0] += 1; plots.update(ops[k[0] % len(ops)])
+        for name in plots.render(): plots.snapshot(name)
+    return run
+
+@bench("visualize.full", (100, 400, 1600), "점/주기")
+def _(n):
+    # 계통(R, L)이 바뀜 — P–δ 곡선/축 범위 재설정으로 전체 렌더
+    plots = _plot_set(); ops = [_op(n, 0.1, (50 + 5*i)*1e-6) for i in range(16)]; k = [0]
+    def run():
+        k[0] += 1; plots.update(ops[k[0] % len(ops)])
+        for name in plots.render(): plots.snapshot(name)
+    return run
+
+@bench("visualize.png", (100, 140, 200), "dpi")
+def _(n):
+    # 내보내기용 PNG (입력마다 새로 렌더 — png() 캐시를 피하려고 운전점을 돌린다)
+    plots = _plot_set(); ops = [_op(400, 0.05 + 0.001*i) for i in range(16)]; k = [0]
+    def run():
+        k[0] += 1; plots.update(ops[k[0] % len(ops)])
+        for name in plots.figures: plots.png(name, n)
+    return run
+
+# --- 측정 ---
+def measure(fn, repeat: int, min_time: float) -> dict:
+    fn(); t = time.perf_counter(); fn(); once = time.perf_counter()-t
+    number = max(1, int(math.ceil(min_time/once))) if once > 0 else 1000
+    runs = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        for _ in range(number): fn()
+        runs.append((time.perf_counter()-t)/number)
+    return dict(min=min(runs), median=statistics.median(runs), number=number, repeat=repeat)
+
+def slope(points) -> float:
+    """log(시간)–log(크기) 기울기."""
+    xs = [math.log(n) for n, _ in points]; ys = [math.log(t) for _, t in points]
+    if len(xs) < 2: return float("nan")
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    den = sum((x-mx)**2 for x in xs)
+    return sum((x-mx)*(y-my) for x, y in zip(xs, ys))/den if den else float("nan")
+
+def run_suite(names, repeat: int, min_time: float, out=sys.stdout) -> dict:
+    results = {}
+    print(f"{'항목':32s} {'크기':>9s} {'최소':>11s} {'중앙':>11s} {'항목당':>12s}", file=out)
+    for name in names:
+        sizes, unit, setup = BENCHES[name]; rows = {}
+        for n in sizes:
+            try: fn = setup(n)
+            except Skip as e:
+                print(f"{name:32s} 건너뜀: {e}", file=out); break
+            m = measure(fn, repeat, min_time); rows[str(n)] = m
+            print(f"{name:32s} {n:>9,} {_t(m['min']):>11s} {_t(m['median']):>11s} {_t(m['min']/n):>10s}/{unit}", file=out)
+        if rows:
+            results[name] = rows
+            s = slope([(int(n), m["min"]) for n, m in rows.items()])
+            print(f"{'':32s} 스케일링 기울기 {s:.2f}", file=out)
+    return results
+
+def _t(s: float) -> str:
+    for scale, u in ((1, "s"), (1e-3, "ms"), (1e-6, "µs")):
+        if s >= scale: return f"{s/scale:.3g} {u}"
+    return f"{s*1e9:.3g} ns"
+
+def meta() -> dict:
+    def ver(mod):
+        try: return __import__(mod).__version__
+        except Exception: return None
+    try: rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError: rev = None
+    return dict(date=datetime.datetime.now().isoformat(timespec="seconds"), git=rev, host=platform.node(),
+                machine=platform.machine(), cpus=os.cpu_count(), python=platform.python_version(),
+                numpy=ver("numpy"), matplotlib=ver("matplotlib"))
+
+# --- 비교 ---
+def compare(base: dict, cur: dict, threshold: float) -> tuple[list, int]:
+    """(행 목록, 회귀 수). 행: (항목, 크기, 기준, 현재, 비율, 판정). 최솟값끼리 비교."""
+    rows = []; bad = 0
+    for name, sizes in cur.items():
+        for n, m in sizes.items():
+            b = base.get(name, {}).get(n)
+            if b is None: rows.append((name, n, None, m["min"], None, "신규")); continue
+            r = m["min"]/b["min"]
+            verdict = "회귀" if r > 1+threshold else "개선" if r < 1/(1+threshold) else "-"
+            bad += verdict == "회귀"; rows.append((name, n, b["min"], m["min"], r, verdict))
+    return rows, bad
+
+def format_report(rows, bad: int, threshold: float, base_meta: dict, cur_meta: dict) -> str:
+    env = lambda m: f"{m.get('git')} · {m.get('host')} · py {m.get('python')} · numpy {m.get('numpy')} · {m.get('date')}"
+    lines = ["# 벤치마크 비교", "", f"- 기준: {env(base_meta)}", f"- 현재: {env(cur_meta)}",
+             f"- 임계: ±{threshold*100:.0f}% — 회귀 {bad}건", "",
+             "| 항목 | 크기 | 기준 | 현재 | 비율 | 판정 |", "|---|---:|---:|---:|---:|---|"]
+    for name, n, b, c, r, v in rows:
+        lines.append(f"| {name} | {int(n):,} | {_t(b) if b else '-'} | {_t(c)} | {f'{r:.2f}×' if r else '-'} | {v} |")
+    return "\n".join(lines) + "\n"
+
+def main():
+    ap = argparse.ArgumentParser(description="SCR 계산 경로 벤치마크")
+    ap.add_argument("-k", help="쉼표로 구분한 이름 일부 — 포함된 항목만 실행")
+    ap.add_argument("--list", action="store_true", help="항목 목록만 출력")
+    ap.add_argument("--quick", action="store_true", help="repeat 3, min_time 0.02s")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--min-time", type=float, default=0.1, help="측정 1회의 최소 시간 [s]")
+    ap.add_argument("--json", help="결과 JSON 경로")
+    ap.add_argument("--save", nargs="?", const=str(BASELINE), help="기준선으로 저장 (기본 benchmarks/baselines/baseline.json)")
+    ap.add_argument("--compare", nargs="?", const=str(BASELINE), help="기준선과 비교")
+    ap.add_argument("--threshold", type=float, default=10.0, help="회귀 판정 임계 [%%]")
+    ap.add_argument("--report", help="비교 보고서(Markdown) 경로")
+    a = ap.parse_args()
+    if a.list:
+        for name, (sizes, unit, _) in BENCHES.items(): print(f"{name:32s} {', '.join(f'{n:,}' for n in sizes)} ({unit})")
+        return
+    if a.compare and not Path(a.compare).is_file():
+        # 기준선은 기계마다 달라 저장소에 두지 않는다 — 측정 전에 알려 준다
+        sys.exit(f"기준선 없음: {a.compare}\n먼저 같은 기계에서 python benchmarks/suite.py --save 로 만드세요.")
+    keys = [k.strip() for k in a.k.split(",")] if a.k else None
+    names = [n for n in BENCHES if keys is None or any(k in n for k in keys)]
+    repeat, min_time = (3, 0.02) if a.quick else (a.repeat, a.min_time)
+    doc = dict(meta=meta(), results=run_suite(names, repeat, min_time))
+    for path in (a.json, a.save):
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text(json.dumps(doc, ensure_ascii=False, indent=1), encoding="utf-8")
+            print(f"저장: {path}")
+    if a.compare:
+        base = json.loads(Path(a.compare).read_text(encoding="utf-8"))
+        rows, bad = compare(base["results"], doc["results"], a.threshold/100)
+        text = format_report(rows, bad, a.threshold/100, base.get("meta", {}), doc["meta"])
+        print(); print(text)
+        if a.report: Path(a.report).write_text(text, encoding="utf-8")
+        if bad: sys.exit(1)
+
+if __name__ == "__main__":
+    main()
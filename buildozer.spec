@@ -9,7 +9,7 @@ orientation = all
 fullscreen = 0
 log_level = 2
 
-requirements = python3,kivy,kivymd,kivy_garden.matplotlib,matplotlib,numpy
+requirements = python3,sqlite3,kivy,kivymd,matplotlib,numpy
 
 android.api = 34
 android.minapi = 26
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""scr.design — 설계표 보간이 정확 솔버와 돌려준 오차 상한 안에서 일치하는지."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]/"app"))
+
+from scr import vec
+from scr.core import RL
+from scr.design import LineDesignTable
+
+@pytest.mark.parametrize("tr", [RL(), RL(0.002, 20e-6), RL(0.01, 100e-6)])
+def test_query_error_within_bound(tr):
+    tbl = LineDesignTable.build(380.0, 250e3, tr)
+    rng = np.random.default_rng(0); n = 100000
+    S = np.exp(rng.uniform(0.0, np.log(20.0), n)); K = rng.uniform(0, 2, n); F = np.exp(rng.uniform(np.log(50), np.log(60), n))
+    R, L, ok, err = tbl.query(S, K, F)
+    _, Le, oke = vec.solve_line_rl(380.0, 250e3, F, S, K*vec.omega(F), tr.R, tr.L)
+    assert (ok == oke).all()
+    fast = ok & (err > 0)
+    assert fast.mean() > 0.5                       # 대부분은 보간으로 답한다
+    rel = np.abs(L[ok]/Le[ok]-1)
+    assert (rel <= err[ok]).all()                  # 정확 솔버로 푼 요소는 err=0 이고 오차도 0
+    assert rel.max() <= tbl.max_err <= 1e-3
+    np.testing.assert_allclose(R[ok], K[ok]*vec.omega(F[ok])*L[ok])
+
+def test_outside_grid_uses_exact_solver():
+    tbl = LineDesignTable.build(380.0, 250e3, RL(), scr=(2.0, 10.0, 9), rx=(0.0, 1.0, 5), f=(50.0, 60.0, 3))
+    R, L, ok, err = tbl.query([25.0, 5.0], [0.5, 3.0], [60.0, 50.0])
+    _, Le, oke = vec.solve_line_rl(380.0, 250e3, np.array([60.0, 50.0]), np.array([25.0, 5.0]),
+                                   np.array([0.5, 3.0])*vec.omega(np.array([60.0, 50.0])))
+    assert (err == 0).all() and (ok == oke).all()
+    np.testing.assert_array_equal(L, Le)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""scr.montecarlo.run — 같은 seed 면 워커 수와 무관하게 Stats/히스토그램이 같다."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]/"app"))
+
+from scr import montecarlo
+
+SPEC = {"V_LL": {"dist": "normal", "mean": "380", "sd_pct": 2}, "S_n": "250kVA", "f": 60,
+        "R_line": {"dist": "uniform", "lo": "0", "hi": "5mΩ"}, "L_line": {"dist": "tol", "nom": "75uH", "pct": 10},
+        "I_max": {"dist": "uniform", "lo": "500", "hi": "3kA"}, "dV_pct": 5}
+N, CHUNK = 50_000, 4096          # 청크 13 개 (마지막은 짧음)
+
+def _same(a, b):
+    assert a.keys() == b.keys()
+    for k in a:
+        sa, sb = a[k], b[k]
+        assert (sa.n, sa.nan, sa.mean, sa.m2, sa.lo, sa.hi) == (sb.n, sb.nan, sb.mean, sb.m2, sb.lo, sb.hi), k
+        np.testing.assert_array_equal(sa.edges, sb.edges)
+        np.testing.assert_array_equal(sa.counts, sb.counts)
+        assert sa.summary() == sb.summary()
+
+@pytest.fixture(scope="module")
+def serial():
+    return montecarlo.run(SPEC, N, chunk=CHUNK, workers=1, seed=7, bins=256)
+
+def test_workers_do_not_change_result(serial):
+    _same(serial, montecarlo.run(SPEC, N, chunk=CHUNK, workers=3, seed=7, bins=256))
+
+def test_serial_is_reproducible_and_seed_matters(serial):
+    _same(serial, montecarlo.run(SPEC, N, chunk=CHUNK, workers=1, seed=7, bins=256))
+    other = montecarlo.run(SPEC, N, chunk=CHUNK, workers=1, seed=8, bins=256)
+    assert other["SCR"].mean != serial["SCR"].mean
+
+def test_stats_cover_all_samples(serial):
+    assert set(serial) == {"SCR", "Zth", "P_max_MW", "delta_I_deg", "delta_V_deg"}
+    for s in serial.values():
+        assert s.n + s.nan == N and s.counts.sum() == s.n
+        assert s.lo <= s.percentile(50) <= s.hi
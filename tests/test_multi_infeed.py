@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+core.MultiInfeed / Network.multi_infeed — 손으로 푼 두 연계점 사례.
+
+기준 ─ X_s=0.01Ω ─ 모선 0 ─┬─ X_l=0.02Ω ─ 모선 1 (S1 = 1 MVA)
+                           └─ X_l=0.02Ω ─ 모선 2 (S2 = 0.5 MVA)
+Z11 = Z22 = j0.03, Z12 = j0.01, V_LL = 400 V
+S_sc = 400²/0.03 = 16/3 MVA, MIIF = 0.01/0.03 = 1/3
+MISCR1 = (16/3)/(1 + 0.5/3) = 32/7, MISCR2 = (16/3)/(0.5 + 1/3) = 32/5
+WSCR = (16/3)·1.5/1.5² = 32/9
+"""
+import math, sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]/"app"))
+
+from scr.core import System, MultiInfeed
+
+SYS = System(400.0, 1e6, 50.0)
+Z = 1j*np.array([[0.03, 0.01], [0.01, 0.03]])
+S = [1e6, 0.5e6]
+
+def _check(mi):
+    np.testing.assert_allclose(mi.S_sc, [16e6/3, 16e6/3], rtol=1e-12)
+    np.testing.assert_allclose(mi.miif(), [[1.0, 1/3], [1/3, 1.0]], rtol=1e-12)
+    np.testing.assert_allclose(mi.scr, [16/3, 32/3], rtol=1e-12)
+    np.testing.assert_allclose(mi.miscr, [32/7, 32/5], rtol=1e-12)
+    assert mi.wscr == pytest.approx(32/9, rel=1e-12)
+
+def test_two_bus_hand_calculation():
+    _check(MultiInfeed(SYS.V_LL, Z, S))
+    _check(MultiInfeed(SYS.V_LL, Z, S, chunk=1))      # 행 블록 누적
+
+def test_set_rating_matches_rebuild():
+    mi = MultiInfeed(SYS.V_LL, Z, S).set_rating(1, 1e6)
+    np.testing.assert_allclose(mi.miscr, [4.0, 4.0], rtol=1e-12)   # (16/3)/(1 + 1/3)
+    assert mi.wscr == pytest.approx(8/3, rel=1e-12)
+
+def test_network_multi_infeed():
+    pytest.importorskip("scipy")
+    from scr.network import Network
+    w = SYS.omega
+    net = Network.from_branches(SYS, [(0, None, 0.0, 0.01/w), (0, 1, 0.0, 0.02/w), (0, 2, 0.0, 0.02/w)])
+    _check(net.multi_infeed([1, 2], S))
+
+def test_zero_self_impedance_rejected():
+    with pytest.raises(ValueError): MultiInfeed(SYS.V_LL, np.zeros((2, 2)), S)
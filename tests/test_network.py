@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""scr.network — 희소 분해/선택 역행렬/Woodbury 갱신이 밀집 역행렬과 같은지."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]/"app"))
+
+from scr.core import System, RL
+from scr.network import Network, ladder
+
+SYS = System(400.0, 1e6, 50.0)
+
+def _dense_z(net):
+    return np.linalg.inv(net.admittance().toarray())
+
+def _check(net, buses):
+    Z = _dense_z(net)
+    np.testing.assert_allclose(net.z_diag(), np.diagonal(Z), rtol=1e-9)
+    np.testing.assert_allclose(net.z_columns(buses), Z[:, buses], rtol=1e-9, atol=1e-15)
+    np.testing.assert_allclose(net.scr(), SYS.V_LL**2/(np.abs(np.diagonal(Z))*SYS.S_n), rtol=1e-9)
+
+def test_z_against_dense_inverse_before_and_after_set_branch():
+    net = ladder(SYS, 60, feeders=3, ties=8, seed=1).factorize(); buses = [1, 17, 42, 59]
+    _check(net, buses)
+    k_tie = len(net.frm)-1                           # 마지막 가지는 연계선
+    net.set_branch(5, R=0.03, L=80e-6)               # 값 변경
+    _check(net, buses)
+    net.set_branch(k_tie, closed=False)              # 차단기 개방
+    _check(net, buses)
+    net.set_branch(k_tie, closed=True); net.set_branch(0, L=45e-6)
+    assert len(net._dy) == 4                         # 재분해 없이 Woodbury 로 반영됨
+    _check(net, buses)
+
+def test_refactorize_after_max_updates():
+    net = ladder(SYS, 30, feeders=2, ties=4, seed=2).factorize(); net.max_updates = 3
+    rng = np.random.default_rng(0)
+    for k in rng.choice(np.arange(1, len(net.frm)), 7):
+        net.set_branch(int(k), R=float(rng.uniform(0.005, 0.02)))
+        assert len(net._dy) <= 3
+        _check(net, [3, 29])
+
+def test_block_diag_path_matches_selected_inverse():
+    net = ladder(SYS, 40, feeders=2, ties=6, seed=3).factorize()
+    np.testing.assert_allclose(net._block_diag(), net._z0_diag(), rtol=1e-9)
+
+def test_islanding_is_reported():
+    net = Network.from_branches(SYS, [(0, None, RL(0, 30e-6)), (0, 1, RL(0.01, 50e-6))]).factorize()
+    with pytest.raises(ValueError):
+        net.set_branch(1, closed=False); net.z_diag()
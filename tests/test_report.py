@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""scr.report 일괄 생성 — 운전점을 못 구하는 케이스가 있어도 나머지는 계속 쓴다."""
+import csv, sys, warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]/"app"))
+warnings.filterwarnings("ignore")
+
+from scr import report
+
+def test_infeasible_rows_do_not_abort_bulk_run(tmp_path):
+    src = tmp_path/"cases.csv"
+    src.write_text("id,V_LL,S_n,f,R_line,L_line,P\n"
+                   "a,380,250kVA,60,0,75uH,100kW\n"
+                   "b,380,250kVA,60,0,75uH,50MW\n"       # P > P_max
+                   "c,380,250kVA,60,0,0,100kW\n"         # Zth = 0
+                   "d,400,250kVA,50,1mΩ,60uH,100kW\n", encoding="utf-8")
+    out = tmp_path/"out"
+    n, _ = report.run(report.iter_cases(str(src)), out, workers=1)
+    assert n == 4
+    with open(out/"index.csv", encoding="utf-8-sig") as f: rows = list(csv.DictReader(f))
+    assert [r["id"] for r in rows] == ["a", "b", "c", "d"]
+    assert [bool(r["error"]) for r in rows] == [False, True, True, False]
+    assert "한계를 초과" in rows[1]["error"]
+    for r in rows:
+        page = (out/r["case"]).read_text(encoding="utf-8")
+        assert ("계산 불가" in page) == bool(r["error"])
+        assert ("assets/" in page) != bool(r["error"])
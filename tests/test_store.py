@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""scr.store — put/get/query/history 왕복, canonical_key 는 유효숫자 12자리 아래 잡음만 무시."""
+import sys, time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]/"app"))
+
+from scr.store import Store, canonical_key
+
+BASE = dict(V_LL=380.0, S_n=250e3, f=60.0, R_line=0.0, L_line=75e-6, R_tr=0.0, L_tr=0.0)
+
+def _inp(**kw): return {**BASE, **kw}
+
+def test_canonical_key_ignores_float_noise():
+    k = canonical_key("scr", BASE)
+    assert canonical_key("scr", _inp(L_line=75e-6*(1+1e-14))) == k
+    assert canonical_key("scr", _inp(V_LL=0.38*1000)) == k                 # 379.99999999999994
+    assert canonical_key("scr", dict(reversed(list(BASE.items())))) == k   # 키 순서 무관
+    assert canonical_key("line", _inp(target=0.1+0.2)) == canonical_key("line", _inp(target=0.3))
+
+@pytest.mark.parametrize("change", [dict(L_line=75.001e-6), dict(V_LL=380.0000001), dict(S_n=250e3*(1+1e-9)),
+                                    dict(f=50.0), dict(R_tr=1e-12), dict(extra=1.0)])
+def test_canonical_key_separates_real_changes(change):
+    assert canonical_key("scr", _inp(**change)) != canonical_key("scr", BASE)
+
+def test_canonical_key_separates_kinds():
+    assert canonical_key("scr", BASE) != canonical_key("line", BASE)
+
+def test_put_get_query_history_round_trip(tmp_path):
+    path = tmp_path/"scr.db"; st = Store(path)
+    rows = [(_inp(V_LL=v, L_line=l), dict(SCR=scr, Zth=z)) for v, l, scr, z in
+            ((380.0, 75e-6, 8.5, 0.068), (400.0, 60e-6, 11.2, 0.057), (690.0, 90e-6, 4.1, 0.46))]
+    keys = []
+    for inp, res in rows:
+        keys.append(st.put("scr", inp, res)); time.sleep(0.002)
+    assert keys == [canonical_key("scr", i) for i, _ in rows] and len(st) == 3
+    for k, (_, res) in zip(keys, rows): assert st.get(k) == res
+    assert st.get("0"*16) is None
+    assert st.put("scr", _inp(L_line=75e-6*(1+1e-15)), dict(SCR=-1.0)) == keys[0]   # 같은 키 → 기존 결과 유지
+    assert st.get(keys[0]) == rows[0][1] and len(st) == 3
+    st.record(keys[1])
+    st.put("line", _inp(target=5.0), dict(L=1e-4))
+    st.close()
+
+    st = Store(path)                                                             # 다시 열어도 그대로
+    q = st.query("scr")
+    assert [r["key"] for r in q] == keys[::-1]                                   # 최신순
+    assert q[-1]["inputs"] == rows[0][0] and q[-1]["result"] == rows[0][1] and q[-1]["kind"] == "scr"
+    assert [r["key"] for r in st.query("scr", V_LL=(390, None))] == [keys[2], keys[1]]
+    assert [r["key"] for r in st.query("scr", V_LL=400.0)] == [keys[1]]
+    assert [r["key"] for r in st.query("scr", scr=(5, 10))] == [keys[0]]
+    assert [r["key"] for r in st.query("scr", since=q[1]["ts"])] == [keys[2], keys[1]]
+    assert [r["key"] for r in st.query("scr", until=q[1]["ts"], limit=1)] == [keys[1]]
+    assert len(st.query()) == 4 and [r["kind"] for r in st.query("line")] == ["line"]
+    h = st.history()
+    assert [k for _, k, _ in h] == [canonical_key("line", _inp(target=5.0)), keys[1], keys[0], keys[2], keys[1], keys[0]]
+    assert [kd for _, _, kd in h] == ["line"] + ["scr"]*5
+    assert [k for _, k, _ in st.history(limit=2)] == [k for _, k, _ in h[:2]]
+    st.close()
+
+def test_put_many_matches_put():
+    a, b = Store(), Store()
+    rows = [(_inp(V_LL=float(v)), dict(SCR=v/100)) for v in range(300, 310)]
+    assert a.put_many("scr", rows) == 10
+    for i, r in rows: b.put("scr", i, r)
+    assert {r["key"]: r["result"] for r in a.query()} == {r["key"]: r["result"] for r in b.query()}
+    assert len(a) == len(b) == 10 and len(a.history()) == 10
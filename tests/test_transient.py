@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+scr.transient.simulate — 정상 상태 P 는 core.p_of_delta 와 같고, 사건 계단 뒤 i_a 는
+RL 회로의 해석 해 i(t) = i_ss(t) + (i(t_e) − i_ss(t_e))·e^{−R(t−t_e)/L} 를 따른다.
+"""
+import math, sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]/"app"))
+
+from scr import core
+from scr.core import System
+from scr.transient import simulate, Event
+
+SYS = System(380.0, 250e3, 60.0)
+R = np.array([0.002, 0.01, 0.03]); L = np.array([40e-6, 100e-6, 150e-6])   # τ = 20, 10, 5 ms
+D0, D1 = 10.0, 25.0
+
+def _i_ss(t, R, L, delta_deg):
+    """(e − v)/Z 의 정현 정상 해 (실수 시간 영역): e − v = Vm·(sin(ωt+δ) − sin ωt)."""
+    w = SYS.omega; Vm = math.sqrt(2)*SYS.V_ph; d = math.radians(delta_deg)
+    amp = Vm*2*math.sin(d/2); phi = d/2 + math.pi/2                      # sin(a+δ) − sin a = 2 sin(δ/2) cos(a+δ/2)
+    return amp/math.hypot(R, w*L)*np.sin(w*t + phi - math.atan2(w*L, R))
+
+def test_steady_start_power_matches_p_of_delta():
+    r = simulate(SYS, R, L, D0, t_end=0.05, h=1e-5, decim=10)
+    for s in range(len(R)):
+        want = core.p_of_delta(SYS.V_LL, R[s], SYS.omega*L[s], math.radians(D0))/1e6
+        np.testing.assert_allclose(r["P_MW"][s], want, rtol=1e-9)
+        np.testing.assert_allclose(r["i_a"][s], _i_ss(r.t, R[s], L[s], D0), rtol=0, atol=1e-9*np.abs(r["i_a"][s]).max())
+
+def test_delta_step_follows_analytic_rl_response():
+    te = 0.0123; h = 1e-5
+    r = simulate(SYS, R, L, D0, t_end=0.1, h=h, decim=1, events=[Event(te, delta_deg=D1)])
+    t = r.t; n_e = round(te/h); after = t >= t[n_e]
+    for s in range(len(R)):
+        ia = r["i_a"][s]
+        np.testing.assert_allclose(ia[~after], _i_ss(t[~after], R[s], L[s], D0), atol=1e-9*np.abs(ia).max())
+        i0 = _i_ss(t[n_e], R[s], L[s], D0)                                    # 인덕터 전류는 연속
+        want = _i_ss(t[after], R[s], L[s], D1) + (i0 - _i_ss(t[n_e], R[s], L[s], D1))*np.exp(-R[s]*(t[after]-t[n_e])/L[s])
+        np.testing.assert_allclose(ia[after], want, atol=1e-9*np.abs(ia).max())
+        want_P = core.p_of_delta(SYS.V_LL, R[s], SYS.omega*L[s], math.radians(D1))/1e6
+        assert r["P_MW"][s, -1] == pytest.approx(want_P, rel=5e-2)            # 0.1 s ≥ 5τ 뒤 정상 상태 근처
+    np.testing.assert_array_equal(r["delta_deg"][:, [n_e-1, n_e]], [[D0, D1]]*len(R))
+
+def test_zero_start_and_power_event():
+    w = SYS.omega; P = 0.8*core.p_of_delta(SYS.V_LL, R[1], w*L[1], math.radians(D0))
+    r = simulate(SYS, R[1], L[1], D0, t_end=0.3, h=1e-5, decim=5, start="zero", events=[Event(0.02, P=P)])
+    t = r.t; pre = t < 0.02
+    want = _i_ss(t[pre], R[1], L[1], D0) - _i_ss(0.0, R[1], L[1], D0)*np.exp(-R[1]*t[pre]/L[1])
+    np.testing.assert_allclose(r["i_a"][0, pre], want, atol=1e-9*np.abs(want).max())
+    assert r.ok.all() and r["P_MW"][0, -1] == pytest.approx(P/1e6, rel=1e-9)   # 28τ 뒤
+    assert r["delta_deg"][0, -1] == pytest.approx(math.degrees(core.delta_from_p(SYS.V_LL, R[1], w*L[1], P)), rel=1e-12)
+    bad = simulate(SYS, R[1], L[1], D0, t_end=0.01, events=[Event(0.005, P=1e9)])
+    assert not bad.ok.all() and bad["delta_deg"][0, -1] == D0
+
+def test_pure_resistance_rejected():
+    with pytest.raises(ValueError): simulate(SYS, 0.01, 0.0, D0, t_end=0.01)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""scr.utils — parse_value/parse_column 회귀 (기대값은 캐시/빠른 경로 도입 전 파서의 출력)."""
+import math, sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]/"app"))
+
+from scr.utils import parse_value, parse_column
+
+Z_B, L_B = 0.5776, 0.0015321
+NA = -1.0   # default — 숫자 없음 / 허용 안 된 pu
+
+# (입력, kind, pu=False 결과, pu=True 결과)
+CASES = [
+    ("75uH", "L", 7.5e-05, 7.5e-05), ("75 µH", "L", 7.5e-05, 7.5e-05), ("75µh", "L", 7.5e-05, 7.5e-05),
+    ("0.2 mH", "L", 2e-4, 2e-4), ("1.5H", "L", 1.5, 1.5), ("2e-4", "L", 2e-4, 2e-4),
+    ("+.5e-3 mH", "L", 5e-07, 5e-07), ("1E3 uH", "L", 1e-3, 1e-3),
+    ("50mΩ", "R", 0.05, 0.05), ("50 mohm", "R", 0.05, 0.05), ("1.2kΩ", "R", 1200.0, 1200.0),
+    ("3 kohm", "R", 3000.0, 3000.0), ("0.5Ω", "R", 0.5, 0.5), ("0.25 ohm", "R", 0.25, 0.25),
+    ("0.38kV", "V", 380.0, 380.0), ("380 V", "V", 380.0, 380.0), ("1,000 V", "V", 1000.0, 1000.0),
+    ("1,250.5kVA", "S", 1250500.0, 1250500.0), ("0.75 MVA", "S", 750000.0, 750000.0),
+    ("250kVA", "S", 250000.0, 250000.0), ("250000", "S", 250000.0, 250000.0),
+    ("60", "F", 60.0, 60.0), ("50 Hz", "F", 50.0, 50.0), ("x12y", "F", 12.0, 12.0),
+    ("2.5 kW", "P", 2500.0, 2500.0), ("1.2MW", "P", 1.2e6, 1.2e6), ("-3e3 W", "P", -3000.0, -3000.0),
+    ("1.5e+2", "pct", 150.0, 150.0), ("12.5%", "pct", 12.5, 12.5), ("2kA", "I", 2000.0, 2000.0),
+    ("abc", "R", NA, NA), ("", "R", NA, NA), ("  ", "L", NA, NA),
+    ("0.1pu", "R", NA, 0.1*Z_B), ("0.1 PU", "L", NA, 0.1*L_B), ("-0.2pu", "R", NA, -0.2*Z_B),
+    ("2pu", "V", NA, 2*math.sqrt(Z_B)), ("0.05pu", "I", NA, 0.05/math.sqrt(Z_B)), ("1pu", "S", NA, NA),
+]
+
+@pytest.mark.parametrize("s, kind, plain, with_pu", CASES)
+def test_parse_value(s, kind, plain, with_pu):
+    for pu, want in ((False, plain), (True, with_pu)):
+        got = parse_value(s, kind, pu=pu, Z_base=Z_B, L_base=L_B, default=NA)
+        assert got == pytest.approx(want, rel=1e-12), (s, kind, pu)
+
+def test_parse_value_none_and_numbers():
+    assert parse_value(None, "R", default=7.0) == 7.0
+    assert parse_value(0.5, "L") == 0.5 and parse_value(380, "V") == 380.0
+
+@pytest.mark.parametrize("pu", [False, True])
+def test_parse_column_matches_parse_value(pu):
+    for kind in sorted({k for _, k, _, _ in CASES}):
+        col = [s for s, k, _, _ in CASES if k == kind]*3 + [None]
+        v, ok = parse_column(col, kind, pu=pu, Z_base=Z_B, L_base=L_B)
+        want = [parse_value(s, kind, pu=pu, Z_base=Z_B, L_base=L_B, default=math.nan) for s in col]
+        np.testing.assert_allclose(v, want, rtol=1e-12)
+        np.testing.assert_array_equal(ok, ~np.isnan(want))
+
+def test_parse_column_valid_mask_and_row_bases():
+    col = ["0.1pu", "50mΩ", "0.1pu", "bad", "", "0.2 pu"]
+    Zb = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    v, ok = parse_column(col, "R", pu=True, Z_base=Zb)
+    np.testing.assert_allclose(v, [0.1, 0.05, 0.3, np.nan, np.nan, 1.2])
+    np.testing.assert_array_equal(ok, [True, True, True, False, False, True])
+    v, ok = parse_column(col, "R")                   # pu 미허용 → pu 행은 무효
+    np.testing.assert_array_equal(ok, [False, True, False, False, False, False])
+    assert v[1] == 0.05 and np.isnan(v[[0, 2, 5]]).all()
+    Lb = np.array([1e-3, 2e-3])
+    v, ok = parse_column(["1pu", "1pu"], "L", pu=True, L_base=Lb)
+    np.testing.assert_allclose(v, Lb); assert ok.all()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""scr.vec — 배열 버전이 scr.core 스칼라 API 와 허용 오차 안에서 같은지 (무작위 입력, 실패 마스크 포함)."""
+import math, sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]/"app"))
+
+from scr import core, vec
+from scr.core import System, RL
+
+N = 2000
+RTOL = 1e-9
+
+@pytest.fixture
+def cases():
+    rng = np.random.default_rng(0)
+    c = dict(V_LL=rng.uniform(200, 700, N), S_n=rng.uniform(50e3, 5e6, N), f=rng.choice([50.0, 60.0], N),
+             R_line=rng.uniform(0, 0.05, N), L_line=rng.uniform(0, 300e-6, N),
+             R_tr=rng.uniform(0, 0.01, N), L_tr=rng.uniform(0, 100e-6, N))
+    zero = rng.random(N) < 0.05                      # |Z|=0 행
+    for k in ("R_line", "L_line", "R_tr", "L_tr"): c[k][zero] = 0.0
+    return c
+
+def _scalar_scr(r):
+    sys_ = System(r["V_LL"], r["S_n"], r["f"])
+    Zabs = RL(r["R_line"]+r["R_tr"], r["L_line"]+r["L_tr"]).Zabs(sys_.omega)
+    if Zabs == 0: return None
+    Ssc = core.s_sc_from_z(sys_.V_LL, Zabs)
+    return Zabs, Ssc, Ssc/sys_.S_n
+
+def _rows(c):
+    return [{k: float(v[i]) for k, v in c.items()} for i in range(N)]
+
+def test_evaluate_matches_scalar(cases):
+    res = vec.evaluate(cases)
+    for i, r in enumerate(_rows(cases)):
+        s = _scalar_scr(r)
+        if s is None:
+            assert not res["ok"][i] and res["Zth"][i] == 0 and res["P_max"][i] == 0
+            continue
+        assert res["ok"][i]
+        for k, v in zip(("Zth", "S_sc", "SCR"), s): assert res[k][i] == pytest.approx(v, rel=RTOL)
+        assert res["I_ratio"][i] == pytest.approx(s[2], rel=RTOL)
+        R = r["R_line"]+r["R_tr"]; X = 2*math.pi*r["f"]*(r["L_line"]+r["L_tr"])
+        assert res["P_max"][i] == pytest.approx(core.p_of_delta(r["V_LL"], R, X, math.atan2(X, R)), rel=1e-7, abs=1e-6)
+
+def test_delta_from_p_matches_scalar_and_masks_infeasible(cases):
+    rng = np.random.default_rng(1)
+    w = vec.omega(cases["f"]); R = cases["R_line"]+cases["R_tr"]; X = w*(cases["L_line"]+cases["L_tr"])
+    Pmax = vec.p_max(cases["V_LL"], R, X)
+    P = Pmax*rng.uniform(0, 1.5, N)                  # 약 1/3 은 P > P_max
+    d, ok = vec.delta_from_p(cases["V_LL"], R, X, P)
+    ev = vec.evaluate(cases, P=P)
+    n_bad = 0
+    for i in range(N):
+        if R[i] == 0 and X[i] == 0: continue
+        try: ds = core.delta_from_p(cases["V_LL"][i], R[i], X[i], P[i])
+        except ValueError:
+            n_bad += 1; assert not ok[i] and np.isnan(d[i]) and not ev["ok"][i] and not ev["delta_ok"][i]
+            continue
+        assert ok[i] and d[i] == pytest.approx(ds, rel=1e-7, abs=1e-9)
+        assert ev["delta"][i] == pytest.approx(ds, rel=1e-7, abs=1e-9)
+    assert n_bad > N//10
+
+def test_p_of_delta_matches_scalar(cases):
+    w = vec.omega(cases["f"]); R = cases["R_line"]+cases["R_tr"]; X = w*(cases["L_line"]+cases["L_tr"])
+    nz = (R > 0) | (X > 0); delta = np.random.default_rng(2).uniform(0, math.radians(89), N)
+    P = vec.p_of_delta(cases["V_LL"], R, X, delta)
+    for i in np.flatnonzero(nz):
+        assert P[i] == pytest.approx(core.p_of_delta(cases["V_LL"][i], R[i], X[i], delta[i]), rel=1e-7, abs=1e-6)
+
+def test_drop_limits_match_scalar(cases):
+    rng = np.random.default_rng(3)
+    Vph = cases["V_LL"]/math.sqrt(3); Z = vec.evaluate(cases)["Zth"]
+    I = rng.uniform(-100, 5e4, N); I[::50] = np.nan
+    dI, okI = vec.current_drop_limit(Vph, Z, I)
+    pct = rng.uniform(-5, 250, N)
+    dV, okV = vec.voltage_drop_limit(Vph, pct)
+    for i in range(N):
+        s = core.current_drop_limit(Vph[i], Z[i], None if np.isnan(I[i]) else I[i])
+        assert okI[i] == (s is not None)
+        if s is not None: assert dI[i] == pytest.approx(s, rel=1e-12, abs=1e-15)
+        s = core.voltage_drop_limit(Vph[i], pct[i])
+        assert okV[i] == (s is not None)
+        if s is not None: assert dV[i] == pytest.approx(s, rel=1e-12)
+    assert okI.any() and (~okI).any() and (~okV).any()
+
+def test_solve_line_rl_matches_scalar(cases):
+    rng = np.random.default_rng(4)
+    target = rng.uniform(0.5, 40, N); rho = rng.uniform(0, 2, N)*vec.omega(cases["f"])
+    R, L, ok = vec.solve_line_rl(cases["V_LL"], cases["S_n"], cases["f"], target, rho, cases["R_tr"], cases["L_tr"])
+    n_bad = 0
+    for i in range(N):
+        sys_ = System(cases["V_LL"][i], cases["S_n"][i], cases["f"][i])
+        try: s = core.solve_line_rl_for_target_scr(sys_, target[i], rho[i], RL(cases["R_tr"][i], cases["L_tr"][i]))
+        except ValueError:
+            n_bad += 1; assert not ok[i] and np.isnan(L[i]); continue
+        assert ok[i]
+        assert L[i] == pytest.approx(s.L, rel=1e-7, abs=1e-15) and R[i] == pytest.approx(s.R, rel=1e-7, abs=1e-15)
+    assert n_bad > 0